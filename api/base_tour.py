@@ -1,12 +1,16 @@
 # 한국관광공사_기초지자체 중심 관광지 정보
 # https://www.data.go.kr/data/15128559/openapi.do
 
-import requests
-import json
-import time
-from settings.config import API_CONFIGS, COMMON_PARAMS
+import asyncio
+from api.regions import (
+    collect_region_items, collect_region_items_async, expand_month_units, get_signgu_units, iter_region_items
+)
+from settings.config import API_CONFIGS, BASE_TOUR_BASE_YM, COMMON_PARAMS, PageFetchError
 
 class BaseTourAPI:
+    # 기준 연월 범위 수집 지원 (call_api 등의 months 인자, main.py --months)
+    supports_months = True
+    
     def __init__(self):
         self.config = API_CONFIGS["base_tour"]
         self.base_url = self.config["base_url"]
@@ -16,7 +20,7 @@ class BaseTourAPI:
         params.update({
             "MobileApp": self.config["app_name"],
             "serviceKey": self.config["service_key"],
-            "baseYm": "202506",
+            "baseYm": BASE_TOUR_BASE_YM,
             "areaCd": "47"
         })
         return params
@@ -27,7 +31,7 @@ class BaseTourAPI:
         }
     
     def get_signgu_list(self):
-        """경상북도 시군구 코드 목록"""
+        """경상북도 시군구 코드 목록 (CRAWL_AREAS 미지정 시 수집 범위)"""
         return [
             "47111", "47113", "47130", "47150", "47170", "47190", "47210",
             "47230", "47250", "47280", "47290", "47730", "47750", "47760", 
@@ -35,100 +39,98 @@ class BaseTourAPI:
             "47930", "47940"
         ]
     
-    def fetch_signgu_data(self, signgu_code, endpoint_path, base_params):
-        """특정 시군구의 모든 페이지 데이터 수집"""
-        all_items = []
-        page_no = 1
-        max_pages = 50
+    def get_region_units(self, months=None):
+        """
+        수집할 (시도, 시군구) 단위 목록 (CRAWL_AREAS를 지정하면 ldongCode2로 시군구 탐색)
         
-        while page_no <= max_pages:
-            params = base_params.copy()
-            params["signguCd"] = signgu_code
-            params["pageNo"] = str(page_no)
+        months(기준 연월 목록)를 지정하면 (기준 연월 × 시군구) 셀 목록을 반환한다.
+        지정하지 않으면 BASE_TOUR_BASE_YM 한 달만 수집한다.
+        """
+        units, error = get_signgu_units(self.get_signgu_list())
+        if error or not months:
+            return units, error
+        return expand_month_units(units, months), None
+    
+    def call_api(self, endpoint_id, extra_params=None, months=None):
+        endpoints = self.get_endpoints()
+        if endpoint_id not in endpoints:
+            return None, f"잘못된 엔드포인트 ID: {endpoint_id}"
             
-            url = self.base_url + endpoint_path
+        desc, endpoint_path = endpoints[endpoint_id]
+        base_params = self.get_common_params()
+        if extra_params:
+            base_params.update(extra_params)
+        units, error = self.get_region_units(months)
+        if error:
+            return None, error
+        
+        # 시군구 단위를 공유 작업 큐에서 큰 단위부터 동시 수집 (호스트별 요청 수는 fetch_all_pages에서 제한)
+        all_items, failures, error = collect_region_items("base_tour", self.base_url, endpoint_path, base_params, units)
+        if error:
+            return None, error
+        
+        return self.build_result(units, all_items, failures), None
+    
+    def iter_pages(self, endpoint_id, extra_params=None, months=None):
+        """
+        call_api의 스트리밍 버전 - 시군구별 item 리스트를 수집이 끝나는 순서대로 yield
+        
+        실행 중인 시군구 수는 작업자 수(SIGNGU_CONCURRENCY)로 제한된다.
+        """
+        endpoints = self.get_endpoints()
+        if endpoint_id not in endpoints:
+            raise PageFetchError(f"잘못된 엔드포인트 ID: {endpoint_id}")
             
-            try:
-                response = requests.get(url, params=params)
-                if response.status_code != 200:
-                    print(f"[경고] 시군구 {signgu_code} 페이지 {page_no} HTTP {response.status_code} 오류")
-                    break
-                    
-                data = response.json()
-                
-                # 응답 구조 확인
-                response_body = data.get("response", {}).get("body", {})
-                total_count = response_body.get("totalCount", 0)
-                items = response_body.get("items", {})
-                
-                # items가 없거나 빈 경우 종료
-                if not items:
-                    break
-                    
-                # item 추출
-                if isinstance(items, dict):
-                    item_list = items.get("item", [])
-                else:
-                    item_list = items
-                    
-                if not isinstance(item_list, list):
-                    item_list = [item_list] if item_list else []
-                    
-                if not item_list:
-                    break
-                    
-                all_items.extend(item_list)
-                
-                # 첫 페이지에서 총 개수 확인하여 페이징 여부 판단
-                if page_no == 1:
-                    if total_count <= 100:
-                        # 100개 이하면 페이징 불필요
-                        print(f"[{signgu_code}] 데이터 항목 수: {len(item_list)} (전체)")
-                        break
-                    else:
-                        print(f"[{signgu_code}] 페이지 {page_no}: {len(item_list)}개 수집 (총 {len(all_items)}개, 전체 {total_count}개)")
-                else:
-                    print(f"[{signgu_code}] 페이지 {page_no}: {len(item_list)}개 수집 (총 {len(all_items)}개)")
-                
-                # 전체 데이터를 다 가져왔는지 확인
-                if len(all_items) >= total_count:
-                    print(f"[{signgu_code}] 완료: 전체 {total_count}개 데이터 수집 완료")
-                    break
-                    
-                # 다음 페이지로
-                page_no += 1
-                
-                # API 호출 간격
-                time.sleep(0.1)
-                
-            except Exception as e:
-                print(f"[경고] 시군구 {signgu_code} 페이지 {page_no} 처리 실패: {str(e)}")
-                break
+        desc, endpoint_path = endpoints[endpoint_id]
+        base_params = self.get_common_params()
+        if extra_params:
+            base_params.update(extra_params)
+        units, error = self.get_region_units(months)
+        if error:
+            raise PageFetchError(error)
         
-        return all_items
+        yield from iter_region_items("base_tour", self.base_url, endpoint_path, base_params, units)
     
-    def call_api(self, endpoint_id):
+    async def call_api_async(self, endpoint_id, transport, extra_params=None, months=None):
+        """call_api의 비동기 버전 - 작업자 코루틴이 공유 큐에서 시군구를 꺼내 수집"""
         endpoints = self.get_endpoints()
         if endpoint_id not in endpoints:
             return None, f"잘못된 엔드포인트 ID: {endpoint_id}"
             
         desc, endpoint_path = endpoints[endpoint_id]
         base_params = self.get_common_params()
-        signgu_list = self.get_signgu_list()
+        if extra_params:
+            base_params.update(extra_params)
+        # 시군구 탐색은 참조 코드 캐시를 쓰는 동기 호출이므로 스레드에서 실행
+        units, error = await asyncio.to_thread(self.get_region_units, months)
+        if error:
+            return None, error
         
-        all_items = []
+        all_items, failures, error = await collect_region_items_async(
+            "base_tour", transport, self.base_url, endpoint_path, base_params, units
+        )
+        if error:
+            return None, error
         
-        for signgu in signgu_list:
-            signgu_items = self.fetch_signgu_data(signgu, endpoint_path, base_params)
-            all_items.extend(signgu_items)
+        return self.build_result(units, all_items, failures), None
+    
+    def build_result(self, units, all_items, failures):
+        """시군구 단위 결과를 통합 결과 형태로 변환"""
+        area_codes = []
+        for unit in units:
+            if unit.params["areaCd"] not in area_codes:
+                area_codes.append(unit.params["areaCd"])
         
         # 통합 결과 반환
         result = {
-            "areaCd": base_params["areaCd"],
+            "areaCd": ",".join(sorted(area_codes)),
             "totalCount": len(all_items),
             "items": all_items
         }
         
+        if failures:
+            result["failures"] = failures
+        
         print(f"\n[전체 완료] 총 {len(all_items)}개 데이터 수집 완료")
         
-        return result, None
+        return result
@@ -3,7 +3,9 @@
 
 import requests
 import json
-from settings.config import API_CONFIGS, COMMON_PARAMS, fetch_all_pages
+import asyncio
+from api.regions import collect_region_items, collect_region_items_async, get_area_units, iter_region_items
+from settings.config import API_CONFIGS, COMMON_PARAMS, PageFetchError, fetch_all_pages, iter_all_pages
 
 class GreenTourAPI:
     def __init__(self):
@@ -28,26 +30,69 @@ class GreenTourAPI:
     def get_optional_params(self, endpoint_id):
         optional_params = {
             "1": {},
+            # 목록 엔드포인트의 areaCode는 지역 단위(get_region_units)로 지정
             "2": {
-                "arrange": "C",
-                "areaCode": "35"
+                "arrange": "C"
             },
             "3": {
-                "arrange": "C", 
-                "areaCode": "35"
+                "arrange": "C"
             }
         }
         return optional_params.get(endpoint_id, {})
     
-    def call_api(self, endpoint_id):
+    def get_region_endpoint_ids(self):
+        """지역 단위(areaCode)로 나누어 수집하는 목록 엔드포인트 ID (지역은 get_region_units에서 지정)"""
+        return {"2", "3"}
+    
+    def get_region_units(self):
+        """수집할 지역 단위 목록 (CRAWL_AREAS=all이면 /areaCode1로 전국 지역 탐색)"""
+        return get_area_units("greentour", self.base_url, "/areaCode1", self.get_common_params())
+    
+    def get_sync_endpoint_id(self, endpoint_id):
+        """지역기반 목록 엔드포인트에 대응하는 동기화 목록 엔드포인트 ID (증분 수집용)"""
+        return {"2": "3"}.get(endpoint_id)
+    
+    def build_params(self, endpoint_id, extra_params=None):
+        """엔드포인트별 요청 파라미터 구성"""
+        params = self.get_common_params()
+        params.update(self.get_optional_params(endpoint_id))
+        if extra_params:
+            params.update(extra_params)
+        return params
+    
+    def build_result(self, all_items, failures=None):
+        """표준 응답 형태로 변환 (일부 지역 단위가 실패하면 failures 포함)"""
+        result = {
+            "response": {
+                "body": {
+                    "totalCount": len(all_items),
+                    "items": {
+                        "item": all_items
+                    }
+                }
+            }
+        }
+        if failures:
+            result["failures"] = failures
+        return result
+    
+    def call_api(self, endpoint_id, extra_params=None):
         endpoints = self.get_endpoints()
         if endpoint_id not in endpoints:
             return None, f"잘못된 엔드포인트 ID: {endpoint_id}"
             
         desc, endpoint_path = endpoints[endpoint_id]
+        params = self.build_params(endpoint_id, extra_params)
         
-        params = self.get_common_params()
-        params.update(self.get_optional_params(endpoint_id))
+        # 목록 엔드포인트는 지역 단위 작업 큐로 수집
+        if endpoint_id in self.get_region_endpoint_ids():
+            units, error = self.get_region_units()
+            if error:
+                return None, error
+            all_items, failures, error = collect_region_items("greentour", self.base_url, endpoint_path, params, units)
+            if error:
+                return None, error
+            return self.build_result(all_items, failures), None
         
         # 페이징 처리로 모든 데이터 가져오기
         all_items, error = fetch_all_pages(self.base_url, endpoint_path, params)
@@ -55,16 +100,53 @@ class GreenTourAPI:
         if error:
             return None, error
             
-        # 표준 응답 형태로 반환
-        result = {
-            "response": {
-                "body": {
-                    "totalCount": len(all_items),
-                    "items": {
-                        "item": all_items
-                    }
-                }
-            }
-        }
+        return self.build_result(all_items), None
+    
+    def iter_pages(self, endpoint_id, extra_params=None):
+        """call_api의 스트리밍 버전 - 페이지별 item 리스트를 페이지 순서대로 yield"""
+        endpoints = self.get_endpoints()
+        if endpoint_id not in endpoints:
+            raise PageFetchError(f"잘못된 엔드포인트 ID: {endpoint_id}")
+            
+        desc, endpoint_path = endpoints[endpoint_id]
+        params = self.build_params(endpoint_id, extra_params)
+        
+        # 목록 엔드포인트는 지역 단위별 item 리스트를 완료 순서대로 yield
+        if endpoint_id in self.get_region_endpoint_ids():
+            units, error = self.get_region_units()
+            if error:
+                raise PageFetchError(error)
+            yield from iter_region_items("greentour", self.base_url, endpoint_path, params, units)
+            return
+        
+        yield from iter_all_pages(self.base_url, endpoint_path, params)
+    
+    async def call_api_async(self, endpoint_id, transport, extra_params=None):
+        """call_api의 비동기 버전 (AsyncTourApiTransport 공유)"""
+        from settings.async_transport import fetch_all_pages_async
+        
+        endpoints = self.get_endpoints()
+        if endpoint_id not in endpoints:
+            return None, f"잘못된 엔드포인트 ID: {endpoint_id}"
+            
+        desc, endpoint_path = endpoints[endpoint_id]
+        params = self.build_params(endpoint_id, extra_params)
+        
+        if endpoint_id in self.get_region_endpoint_ids():
+            # 지역 탐색은 참조 코드 캐시를 쓰는 동기 호출이므로 스레드에서 실행
+            units, error = await asyncio.to_thread(self.get_region_units)
+            if error:
+                return None, error
+            all_items, failures, error = await collect_region_items_async(
+                "greentour", transport, self.base_url, endpoint_path, params, units
+            )
+            if error:
+                return None, error
+            return self.build_result(all_items, failures), None
+        
+        all_items, error = await fetch_all_pages_async(transport, self.base_url, endpoint_path, params)
         
-        return result, None
+        if error:
+            return None, error
+            
+        return self.build_result(all_items), None
@@ -0,0 +1,414 @@
+# 수집 지역 탐색 및 지역 단위 작업 큐
+# 지역 코드 조회 엔드포인트(areaCode1, areaCode2, ldongCode2)로 수집할 지역을 찾아
+# (지역, 시군구) 단위 작업으로 나누고, 공유 작업 큐에서 큰 단위부터 동시에 수집한다.
+# - 지역 코드 응답은 참조 코드 응답 캐시(settings/response_cache.py)에 저장되어 TTL 동안 재사용
+# - 단위별 최근 item 수를 상태 저장소(sync_state 테이블 또는 파일)에 기록해 다음 실행에서 큰 단위부터 예약 (처음 보는 단위는 가장 먼저)
+# - 실패한 단위는 큐 뒤에 다시 넣어 REGION_UNIT_RETRIES번까지 재시도
+# - CRAWL_AREAS(--areas)를 지정하지 않으면 기존 고정 지역(생태/무장애 35, 기초지자체 47)만 수집
+
+import asyncio
+import threading
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+
+from settings.config import (
+    API_CONFIGS, COMMON_PARAMS, CRAWL_AREAS, REGION_SIZE_CACHE_PATH, REGION_UNIT_RETRIES, SIGNGU_CONCURRENCY,
+    PageFetchError, fetch_all_pages, fetch_page
+)
+from settings.metrics import phase, submit_in_scope
+from settings.state_store import StateStore
+
+# 수집 단위 - key: 실패 기록용 식별자, label: 로그 표시, params: 요청에 덧붙일 파라미터
+# size_key: 크기 기록용 식별자 (없으면 key, 월별 셀은 시군구 코드를 공유)
+RegionUnit = namedtuple("RegionUnit", ["key", "label", "params", "size_key"], defaults=(None,))
+
+# CRAWL_AREAS를 지정하지 않았을 때의 API별 고정 지역 (기존 수집 범위)
+FIXED_AREA_CODES = {
+    "greentour": ["35"],
+    "barrier_free": ["35"],
+    "base_tour": ["47"]
+}
+
+# 지역 코드 목록 조회 시 numOfRows (전국 시군구 목록이 한 페이지에 들어오는 크기)
+DISCOVERY_PAGE_SIZE = "1000"
+
+_crawl_areas = CRAWL_AREAS
+
+
+def set_crawl_areas(value):
+    """--areas: 수집 지역 지정 (all 또는 쉼표로 구분한 지역 코드)"""
+    global _crawl_areas
+    _crawl_areas = str(value or "")
+
+
+def get_area_spec():
+    """
+    현재 수집 지역 설정
+
+    Returns:
+        str 또는 list: "" (고정 지역), "all" (전국 탐색), 지역 코드 목록
+    """
+    spec = _crawl_areas.strip()
+    if spec.lower() == "all":
+        return "all"
+    return [code.strip() for code in spec.split(",") if code.strip()] if spec else ""
+
+
+def fetch_code_list(base_url, endpoint_path, params):
+    """
+    지역 코드 조회 엔드포인트 한 페이지 조회 (참조 코드 응답 캐시 사용)
+
+    Returns:
+        tuple: (items: list, error: str)
+    """
+    request_params = COMMON_PARAMS.copy()
+    request_params.update(params)
+    request_params["numOfRows"] = DISCOVERY_PAGE_SIZE
+
+    try:
+        total_count, items = fetch_page(base_url + endpoint_path, request_params, 1)
+    except Exception as e:
+        return [], f"{endpoint_path} 조회 실패: {str(e)}"
+
+    if total_count > len(items):
+        return [], f"{endpoint_path} 목록이 한 페이지를 넘음 ({len(items)}/{total_count}개)"
+    return items, None
+
+
+def get_area_units(api_type, base_url, area_endpoint, base_params):
+    """
+    생태/무장애 API의 지역(areaCode) 단위 목록
+
+    시군구로 나누면 시군구 코드가 없는 item이 빠지므로 지역 단위로 수집한다.
+
+    Returns:
+        tuple: (units: list, error: str)
+    """
+    spec = get_area_spec()
+    if spec == "all":
+        items, error = fetch_code_list(base_url, area_endpoint, base_params)
+        if error:
+            return [], f"지역 탐색 실패: {error}"
+        area_codes = [str(item["code"]) for item in items if item.get("code")]
+        print(f"[지역 탐색] {area_endpoint}: 지역 {len(area_codes)}개")
+    else:
+        area_codes = spec or FIXED_AREA_CODES[api_type]
+
+    units = [RegionUnit(code, f"지역 {code}", {"areaCode": code}) for code in area_codes]
+    return sort_units(api_type, units), None
+
+
+def discover_signgu_codes():
+    """
+    법정동 코드 조회(무장애 API ldongCode2)로 시도별 시군구 코드 탐색
+
+    Returns:
+        tuple: ({시도 코드: [시군구 코드(5자리), ...]}, error: str)
+    """
+    config = API_CONFIGS["barrier_free"]
+    params = {
+        "MobileApp": config["app_name"],
+        "serviceKey": config["service_key"],
+        "lDongListYn": "Y"
+    }
+    items, error = fetch_code_list(config["base_url"], "/ldongCode2", params)
+    if error:
+        return {}, error
+
+    signgu_codes = {}
+    for item in items:
+        area_code = str(item.get("lDongRegnCd") or "")
+        signgu_code = str(item.get("lDongSignguCd") or "")
+        if not area_code or not signgu_code:
+            continue
+        code = signgu_code if signgu_code.startswith(area_code) and len(signgu_code) == 5 else area_code + signgu_code
+        codes = signgu_codes.setdefault(area_code, [])
+        if code not in codes:
+            codes.append(code)
+    return signgu_codes, None
+
+
+def get_signgu_units(fixed_signgu_codes):
+    """
+    기초지자체 API의 (시도, 시군구) 단위 목록
+
+    Args:
+        fixed_signgu_codes: 고정 지역(47)의 시군구 코드 목록 (CRAWL_AREAS 미지정 시 탐색 없이 사용)
+
+    Returns:
+        tuple: (units: list, error: str)
+    """
+    spec = get_area_spec()
+    if spec:
+        signgu_codes, error = discover_signgu_codes()
+        if error:
+            return [], f"시군구 탐색 실패: {error}"
+        if spec != "all":
+            signgu_codes = {area_code: signgu_codes.get(area_code, []) for area_code in spec}
+        print(f"[지역 탐색] ldongCode2: 시도 {len(signgu_codes)}개, 시군구 {sum(map(len, signgu_codes.values()))}개")
+    else:
+        signgu_codes = {FIXED_AREA_CODES["base_tour"][0]: list(fixed_signgu_codes)}
+
+    units = [
+        RegionUnit(signgu, signgu, {"areaCd": area_code, "signguCd": signgu})
+        for area_code, codes in signgu_codes.items()
+        for signgu in codes
+    ]
+    return sort_units("base_tour", units), None
+
+
+def expand_month_units(units, months):
+    """
+    시군구 단위를 (기준 연월 × 시군구) 셀로 확장 (기초지자체 API --months)
+
+    큰 시군구의 셀부터 배정되도록 시군구 순서(크기순)를 유지하고, 크기는 시군구 기록을 공유한다.
+    """
+    return [
+        RegionUnit(f"{month}:{unit.key}", f"{month} {unit.label}", dict(unit.params, baseYm=month), unit.key)
+        for unit in units
+        for month in months
+    ]
+
+
+class RegionSizeCache:
+    """단위별 최근 수집 item 수 캐시 (큰 단위부터 예약하는 데 사용, sync_state 테이블 또는 파일)"""
+
+    def __init__(self, cache_path=REGION_SIZE_CACHE_PATH):
+        self.store = StateStore("region_sizes", cache_path)
+        self.lock = threading.Lock()
+        self.cache = self.store.load()
+        # 바뀐 API 종류 (해당 항목만 저장)
+        self.dirty = set()
+
+    def save(self):
+        """변경된 경우에만 캐시 저장"""
+        with self.lock:
+            if not self.dirty:
+                return
+            self.store.save(self.cache, sorted(self.dirty))
+            self.dirty.clear()
+
+    def get(self, api_type, key):
+        with self.lock:
+            return self.cache.get(api_type, {}).get(key)
+
+    def record(self, api_type, key, size):
+        with self.lock:
+            sizes = self.cache.setdefault(api_type, {})
+            if sizes.get(key) != size:
+                sizes[key] = size
+                self.dirty.add(api_type)
+
+
+# 프로세스 전체에서 공유하는 지역 크기 캐시
+_sizes = None
+_sizes_lock = threading.Lock()
+
+
+def get_region_sizes():
+    """공유 RegionSizeCache 인스턴스 반환"""
+    global _sizes
+    with _sizes_lock:
+        if _sizes is None:
+            _sizes = RegionSizeCache()
+        return _sizes
+
+
+def sort_units(api_type, units):
+    """최근 item 수가 큰 단위부터 정렬 (기록이 없는 단위는 맨 앞, 같은 크기는 원래 순서 유지)"""
+    sizes = get_region_sizes()
+
+    def sort_key(unit):
+        size = sizes.get(api_type, unit.size_key or unit.key)
+        return (0, 0) if size is None else (1, -size)
+
+    return sorted(units, key=sort_key)
+
+
+def record_unit_result(api_type, unit, result, attempt, retries, failures):
+    """
+    단위 수집 결과 (items, error) 처리
+
+    Returns:
+        bool: 재시도 필요 여부 (실패했고 재시도 횟수가 남은 경우)
+    """
+    items, error = result
+    if not error:
+        get_region_sizes().record(api_type, unit.size_key or unit.key, len(items))
+        return False
+    if attempt <= retries:
+        print(f"[재시도] {unit.label} ({attempt}/{retries}): {error}")
+        return True
+    failures[unit.key] = error
+    print(f"[경고] {unit.label} 수집 실패: {error}")
+    return False
+
+
+def iter_units(api_type, units, fetch, workers, failures, retries=REGION_UNIT_RETRIES):
+    """
+    공유 작업 큐에서 단위를 동시에 수집하고 완료되는 순서대로 (unit, items) yield
+
+    큐 앞쪽(큰 단위)부터 작업자에게 배정하며, 실행 중인 단위는 작업자 수로 제한한다.
+    재시도 후에도 실패한 단위는 failures에 {unit.key: 오류}로 기록한다.
+
+    Args:
+        fetch: unit → (items, error) 함수
+    """
+    queue = deque((unit, 1) for unit in units)
+    workers = max(1, min(workers, len(queue)))
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            running = {}
+
+            def fill():
+                while queue and len(running) < workers:
+                    unit, attempt = queue.popleft()
+                    running[submit_in_scope(executor, fetch, unit)] = (unit, attempt)
+
+            fill()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    unit, attempt = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = ([], str(e))
+
+                    if record_unit_result(api_type, unit, result, attempt, retries, failures):
+                        queue.append((unit, attempt + 1))
+                    elif unit.key not in failures:
+                        yield unit, result[0]
+                fill()
+    finally:
+        get_region_sizes().save()
+
+
+def collect_units(api_type, units, fetch, workers, retries=REGION_UNIT_RETRIES):
+    """
+    iter_units의 결과를 모아 반환
+
+    Returns:
+        tuple: (results: {unit.key: items}, failures: {unit.key: 오류})
+    """
+    failures = {}
+    results = {unit.key: items for unit, items in iter_units(api_type, units, fetch, workers, failures, retries)}
+    return results, failures
+
+
+async def collect_units_async(api_type, units, fetch, workers, retries=REGION_UNIT_RETRIES):
+    """
+    collect_units의 비동기 버전 - 작업자 코루틴이 공유 큐에서 단위를 꺼내 수집
+
+    Args:
+        fetch: unit → (items, error) 코루틴 함수
+
+    Returns:
+        tuple: (results: {unit.key: items}, failures: {unit.key: 오류})
+    """
+    queue = deque((unit, 1) for unit in units)
+    results = {}
+    failures = {}
+
+    async def worker():
+        while queue:
+            unit, attempt = queue.popleft()
+            try:
+                result = await fetch(unit)
+            except Exception as e:
+                result = ([], str(e))
+
+            if record_unit_result(api_type, unit, result, attempt, retries, failures):
+                queue.append((unit, attempt + 1))
+            elif unit.key not in failures:
+                results[unit.key] = result[0]
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(max(1, min(workers, len(queue))))))
+    finally:
+        get_region_sizes().save()
+    return results, failures
+
+
+def fetch_unit(base_url, endpoint_path, params, unit):
+    """단위 하나의 모든 페이지 수집 - (items, error)"""
+    unit_params = params.copy()
+    unit_params.update(unit.params)
+    with phase("fetch_signgu"):
+        return fetch_all_pages(base_url, endpoint_path, unit_params, label=unit.label)
+
+
+async def fetch_unit_async(transport, base_url, endpoint_path, params, unit):
+    """fetch_unit의 비동기 버전"""
+    from settings.async_transport import fetch_all_pages_async
+
+    unit_params = params.copy()
+    unit_params.update(unit.params)
+    with phase("fetch_signgu"):
+        return await fetch_all_pages_async(transport, base_url, endpoint_path, unit_params, label=unit.label)
+
+
+def merge_unit_items(units, results, failures):
+    """
+    단위별 결과를 단위 키 순서대로 병합
+
+    Returns:
+        tuple: (all_items: list, error: str) - 모든 단위가 실패한 경우에만 error
+    """
+    if units and len(failures) == len(units):
+        return None, f"모든 지역 단위 수집 실패 ({len(failures)}개)"
+
+    all_items = []
+    for unit in sorted(units, key=lambda unit: unit.key):
+        all_items.extend(results.get(unit.key, []))
+
+    if failures:
+        print(f"\n[부분 완료] 지역 단위 {len(units)}개 중 {len(failures)}개 실패: {', '.join(sorted(failures))}")
+    return all_items, None
+
+
+def collect_region_items(api_type, base_url, endpoint_path, params, units):
+    """
+    지역 단위를 작업 큐에서 동시에 수집하여 병합
+
+    Returns:
+        tuple: (all_items: list, failures: dict, error: str)
+    """
+    fetch = partial(fetch_unit, base_url, endpoint_path, params)
+    results, failures = collect_units(api_type, units, fetch, SIGNGU_CONCURRENCY)
+    all_items, error = merge_unit_items(units, results, failures)
+    return all_items, failures, error
+
+
+async def collect_region_items_async(api_type, transport, base_url, endpoint_path, params, units):
+    """collect_region_items의 비동기 버전 (작업자 코루틴 SIGNGU_CONCURRENCY개)"""
+    fetch = partial(fetch_unit_async, transport, base_url, endpoint_path, params)
+    results, failures = await collect_units_async(api_type, units, fetch, SIGNGU_CONCURRENCY)
+    all_items, error = merge_unit_items(units, results, failures)
+    return all_items, failures, error
+
+
+def iter_region_items(api_type, base_url, endpoint_path, params, units):
+    """
+    지역 단위별 item 리스트를 완료되는 순서대로 yield (스트리밍 동기화용)
+
+    실행 중인 단위는 SIGNGU_CONCURRENCY개로 제한되므로 메모리 사용량은 단위 크기에 비례한다.
+    실패한 단위가 있으면 성공한 단위를 모두 yield한 뒤 PageFetchError(failures=...)를 던져
+    호출자가 부분 완료를 성공으로 처리하지 않게 한다 (체크포인트 유지, 실패/부분 완료 기록).
+
+    Raises:
+        PageFetchError: 하나 이상의 단위가 재시도 후에도 실패한 경우 (failures에 {unit.key: 오류})
+    """
+    failures = {}
+    fetch = partial(fetch_unit, base_url, endpoint_path, params)
+    for unit, items in iter_units(api_type, units, fetch, SIGNGU_CONCURRENCY, failures):
+        if items:
+            yield items
+
+    if units and len(failures) == len(units):
+        raise PageFetchError(f"모든 지역 단위 수집 실패 ({len(failures)}개)", failures=failures)
+    if failures:
+        print(f"\n[부분 완료] 지역 단위 {len(units)}개 중 {len(failures)}개 실패: {', '.join(sorted(failures))}")
+        raise PageFetchError(f"지역 단위 {len(units)}개 중 {len(failures)}개 수집 실패", failures=failures)
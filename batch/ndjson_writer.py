@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# 로컬 저장용 NDJSON 스냅샷 작성/읽기 (LOCAL_FORMAT=ndjson, --format=ndjson)
+# item을 한 줄에 하나씩 기록하고 선택적으로 gzip/zstd로 압축한다.
+# - 페이지를 받는 대로 이어 쓰므로 스트리밍 모드에서도 전체 응답을 메모리에 모으지 않는다.
+# - 작성 중에는 .part 파일에 쓰고 끝나면 이름을 바꾸므로, 중간에 실패한 파일은 스냅샷으로 읽히지 않는다.
+# - 파일 옆에 매니페스트(<파일>.manifest.json)를 남긴다: item 수, 크기, sha256(파일/압축 전 내용), 요청 파라미터 등
+import gzip
+import hashlib
+import io
+import json
+import os
+from datetime import datetime
+from settings.config import PageFetchError
+
+try:
+    import zstandard
+except ImportError:  # zstd 압축을 사용하지 않으면 필요 없음 (요청 시 gzip으로 대체)
+    zstandard = None
+
+# 압축 방식별 파일 확장자
+COMPRESSION_SUFFIXES = {
+    "none": "",
+    "gzip": ".gz",
+    "zstd": ".zst"
+}
+
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+def resolve_compression(compression):
+    """사용할 압축 방식 (알 수 없는 값은 none, zstandard가 없으면 gzip)"""
+    compression = (compression or "none").lower()
+    if compression not in COMPRESSION_SUFFIXES:
+        print(f"[로컬 저장] 알 수 없는 압축 방식 {compression}, 압축 없이 저장합니다.")
+        return "none"
+    if compression == "zstd" and zstandard is None:
+        print("[로컬 저장] zstandard 패키지가 없어 gzip으로 압축합니다.")
+        return "gzip"
+    return compression
+
+
+class HashingFile:
+    """쓰기 바이트 수와 sha256을 함께 계산하는 파일 래퍼"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data):
+        self.sha256.update(data)
+        self.size += len(data)
+        return self.raw.write(data)
+
+    def flush(self):
+        self.raw.flush()
+
+
+class NdjsonWriter:
+    """
+    NDJSON 스냅샷 작성기
+
+    with 블록이 예외 없이 끝나면 close(), 예외가 나면 abort()를 호출한다.
+    """
+
+    def __init__(self, path, compression="gzip", metadata=None):
+        self.compression = resolve_compression(compression)
+        self.path = path + COMPRESSION_SUFFIXES[self.compression]
+        self.part_path = self.path + ".part"
+        self.metadata = dict(metadata or {})
+        self.created_at = datetime.now().isoformat()
+        self.items = 0
+        self.content_sha256 = hashlib.sha256()
+        self.content_size = 0
+        # tee()로 넘긴 페이지 이터레이터를 끝까지 소비했는지 여부
+        self.exhausted = False
+        # 끝까지 소비했지만 일부 지역 단위가 실패한 경우 {unit.key: 오류} (매니페스트에 기록)
+        self.failures = None
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.raw = open(self.part_path, "wb")
+        self.file = HashingFile(self.raw)
+        if self.compression == "gzip":
+            # mtime=0: 같은 내용이면 같은 파일 해시
+            self.stream = gzip.GzipFile(fileobj=self.file, mode="wb", compresslevel=6, mtime=0)
+        elif self.compression == "zstd":
+            self.stream = zstandard.ZstdCompressor(level=3).stream_writer(self.file, closefd=False)
+        else:
+            self.stream = self.file
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def write_items(self, items):
+        """item 목록을 한 번에 이어 쓰기 (페이지 단위 호출)"""
+        if not items:
+            return
+        data = "".join(json.dumps(item, ensure_ascii=False) + "\n" for item in items).encode("utf-8")
+        self.content_sha256.update(data)
+        self.content_size += len(data)
+        self.stream.write(data)
+        self.items += len(items)
+
+    def tee(self, pages):
+        """
+        페이지 이터레이터를 그대로 내보내면서 각 페이지를 파일에 기록
+
+        이터레이터를 끝까지 소비하면 exhausted가 True가 된다 (중간에 멈춘 수집과 구분).
+        일부 지역 단위만 실패한 경우(PageFetchError.failures)에도 끝까지 소비한 것으로 보고 failures를 남긴 뒤 예외를 다시 던진다.
+        """
+        try:
+            for page_items in pages:
+                self.write_items(page_items)
+                yield page_items
+        except PageFetchError as e:
+            if e.failures and self.items:
+                self.failures = e.failures
+                self.exhausted = True
+            raise
+        self.exhausted = True
+
+    def close(self, **extra):
+        """
+        파일을 완성하고 매니페스트 기록
+
+        Returns:
+            dict: 매니페스트
+        """
+        if self.stream is not self.file:
+            self.stream.close()
+        self.raw.close()
+        os.replace(self.part_path, self.path)
+
+        manifest = {
+            "format": "ndjson",
+            "compression": self.compression,
+            "file": os.path.basename(self.path),
+            "items": self.items,
+            "bytes": self.file.size,
+            "content_bytes": self.content_size,
+            "sha256": self.file.sha256.hexdigest(),
+            "content_sha256": self.content_sha256.hexdigest(),
+            "created_at": self.created_at,
+            "completed_at": datetime.now().isoformat()
+        }
+        manifest.update(self.metadata)
+        manifest.update(extra)
+
+        with open(self.path + MANIFEST_SUFFIX, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        return manifest
+
+    def abort(self):
+        """작성 중인 파일 삭제"""
+        try:
+            if self.stream is not self.file:
+                self.stream.close()
+            self.raw.close()
+        finally:
+            if os.path.exists(self.part_path):
+                os.remove(self.part_path)
+
+
+def open_ndjson(path):
+    """확장자(.gz/.zst)에 맞게 NDJSON 파일을 텍스트 모드로 열기"""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError(f"zstandard 패키지가 필요합니다: {path}")
+        raw = open(path, "rb")
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(raw, closefd=True), encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def iter_ndjson_items(path):
+    """NDJSON 파일의 item을 한 줄씩 yield"""
+    with open_ndjson(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_manifest(path):
+    """NDJSON 파일의 매니페스트 (없으면 None)"""
+    try:
+        with open(path + MANIFEST_SUFFIX, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# PostgreSQL 직접 연결 COPY 쓰기 경로
+# SUPABASE_DB_DSN이 설정되어 있고 psycopg가 설치되어 있으면 PostgREST 대신 사용한다.
+# 변경 행을 임시 스테이징 테이블에 COPY로 넣은 뒤, data_hash가 다른 행만 갱신하는
+# INSERT ... ON CONFLICT 한 번으로 대상 테이블에 병합한다. (스키마: migrate_to_lowercase.sql)
+import json
+import threading
+from settings.config import SUPABASE_DB_DSN
+from settings.metrics import get_metrics
+
+try:
+    import psycopg
+    from psycopg import sql
+except ImportError:  # 직접 연결 경로를 사용하지 않으면 필요 없음
+    psycopg = None
+
+class PgCopyWriter:
+    """COPY + INSERT ... ON CONFLICT 기반 대량 업서트"""
+
+    def __init__(self, dsn=SUPABASE_DB_DSN):
+        if psycopg is None:
+            raise ImportError("직접 연결 쓰기를 사용하려면 psycopg 패키지를 설치하세요 (pip install 'psycopg[binary]')")
+        self.dsn = dsn
+        self.conn = None
+        self.lock = threading.Lock()
+
+    def connect(self):
+        """연결 (처음 사용할 때 한 번, 트랜잭션은 upsert_rows에서 명시적으로 시작)"""
+        if self.conn is None or self.conn.closed:
+            self.conn = psycopg.connect(self.dsn, autocommit=True)
+        return self.conn
+
+    def close(self):
+        if self.conn is not None and not self.conn.closed:
+            self.conn.close()
+        self.conn = None
+
+    def test_connection(self):
+        """연결 테스트"""
+        try:
+            with self.lock:
+                self.connect().execute("SELECT 1")
+            return True
+        except Exception as e:
+            print(f"❌ PostgreSQL 직접 연결 실패: {str(e)}")
+            self.close()
+            return False
+
+    @staticmethod
+    def to_copy_value(value):
+        """COPY 입력 값 변환 (dict/list는 JSONB용 JSON 문자열)"""
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False)
+        return value
+
+    def upsert_rows(self, table_name, conflict_target, rows):
+        """
+        행 목록을 스테이징 테이블에 COPY한 뒤 대상 테이블에 병합
+
+        같은 충돌 키가 여러 번 나오면 마지막 행만 사용한다. 기존 행은 data_hash가 다를 때만 갱신하며,
+        한 트랜잭션으로 처리되므로 실패하면 아무 행도 반영되지 않는다.
+
+        Returns:
+            list: 반영된 행의 id, 충돌 키 컬럼, data_hash (PostgREST 업서트 응답과 같은 형태)
+        """
+        if not rows:
+            return []
+
+        conflict_columns = conflict_target.split(",")
+        columns = list(dict.fromkeys(column for row in rows for column in row))
+
+        # 스테이징 테이블 안의 충돌 키 중복 제거 (ON CONFLICT는 같은 행을 두 번 갱신할 수 없음)
+        unique_rows = {tuple(str(row.get(column)) for column in conflict_columns): row for row in rows}
+
+        target = sql.Identifier(table_name)
+        column_list = sql.SQL(", ").join(sql.Identifier(column) for column in columns)
+        update_columns = [column for column in columns if column not in conflict_columns]
+        update_list = [
+            sql.SQL("{} = EXCLUDED.{}").format(sql.Identifier(column), sql.Identifier(column))
+            for column in update_columns
+        ]
+        if "updated_at" not in update_columns:
+            update_list.append(sql.SQL("updated_at = NOW()"))
+        returning_list = sql.SQL(", ").join(
+            sql.Identifier(column) for column in ["id", *conflict_columns, "data_hash"]
+        )
+
+        merge_query = sql.SQL(
+            "INSERT INTO {target} ({columns}) SELECT {columns} FROM _staging "
+            "ON CONFLICT ({conflict}) DO UPDATE SET {updates} "
+            "WHERE {target}.data_hash IS DISTINCT FROM EXCLUDED.data_hash "
+            "RETURNING {returning}"
+        ).format(
+            target=target,
+            columns=column_list,
+            conflict=sql.SQL(", ").join(sql.Identifier(column) for column in conflict_columns),
+            updates=sql.SQL(", ").join(update_list),
+            returning=returning_list
+        )
+
+        with self.lock:
+            conn = self.connect()
+            try:
+                with conn.transaction(), conn.cursor() as cur:
+                    cur.execute(sql.SQL(
+                        "CREATE TEMP TABLE _staging ON COMMIT DROP AS SELECT {columns} FROM {target} WITH NO DATA"
+                    ).format(columns=column_list, target=target))
+
+                    # 송신량은 COPY 입력 값의 문자열 길이로 추정 (실행 계측)
+                    bytes_out = 0
+                    with cur.copy(sql.SQL("COPY _staging ({columns}) FROM STDIN").format(columns=column_list)) as copy:
+                        for row in unique_rows.values():
+                            values = [self.to_copy_value(row.get(column)) for column in columns]
+                            copy.write_row(values)
+                            bytes_out += sum(len(str(value)) for value in values if value is not None)
+
+                    cur.execute(merge_query)
+                    names = [desc.name for desc in cur.description]
+                    upserted = [dict(zip(names, record)) for record in cur.fetchall()]
+
+                metrics = get_metrics()
+                metrics.incr("db_requests")
+                metrics.incr("db_bytes_out", bytes_out)
+                return upserted
+            except Exception:
+                # 연결이 끊긴 경우 다음 호출에서 다시 연결
+                if conn.broken:
+                    self.close()
+                raise
+
+
+# 프로세스 전체에서 공유하는 직접 연결 writer
+_writer = None
+_writer_lock = threading.Lock()
+_writer_unavailable = False
+
+
+def get_pg_writer():
+    """SUPABASE_DB_DSN이 설정되어 있으면 공유 PgCopyWriter, 아니면 None"""
+    global _writer, _writer_unavailable
+    if not SUPABASE_DB_DSN:
+        return None
+
+    with _writer_lock:
+        if _writer is None and not _writer_unavailable:
+            try:
+                writer = PgCopyWriter()
+            except ImportError as e:
+                print(f"⚠️  {str(e)} - PostgREST로 진행")
+                writer = None
+            if writer and not writer.test_connection():
+                print("⚠️  PostgreSQL 직접 연결을 사용할 수 없어 PostgREST로 진행")
+                writer = None
+            # 한 번 실패하면 이번 실행에서는 다시 시도하지 않음
+            _writer_unavailable = writer is None
+            _writer = writer
+        return _writer
@@ -1,63 +1,176 @@
 #!/usr/bin/env python3
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 from supabase import create_client
-from sync.areabased_mapper import AreaBasedMapper
+from batch.writer_pool import WriterPool
+from sync.areabased_mapper import AreaBasedMapper, to_rows
+from settings.config import EXISTING_READ_CONCURRENCY, EXISTING_READ_PAGE_SIZE, SYNC_UPSERT_BATCH_SIZE
+from settings.metrics import get_metrics, map_in_scope, phase
+
+# 테이블별 업서트 충돌 기준 (고유 제약 컬럼)
+# greentour_areabased, barrier_free_areabased는 contentid가 UNIQUE
+CONFLICT_TARGETS = {
+    'greentour_areabased': "contentid",
+    'barrier_free_areabased': "contentid",
+    'base_tour_areabased': "hubtatscode,baseym"
+}
+
+# timestamp 컬럼에 넣으면 PostgreSQL이 트랜잭션 시작 시각(DB 서버 시계)으로 해석하는 입력값
+# updated_at을 클라이언트 시계로 쓰면 키 인덱스 워터마크(DB에서 읽은 최대 updated_at)가 호스트마다 어긋난다.
+DB_NOW = "now"
+
+# 프로세스 전체에서 공유하는 Supabase 클라이언트 (여러 작업을 한 프로세스에서 실행할 때 커넥션 풀 재사용)
+_client = None
+_client_lock = threading.Lock()
+_connection_verified = False
+
+
+def get_supabase_client():
+    """공유 Supabase 클라이언트 반환"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            # 환경 변수 로드
+            load_dotenv()
+            
+            # Supabase 클라이언트 생성
+            _client = create_client(
+                os.getenv("SUPABASE_BASE_URL"),
+                os.getenv("SUPABASE_API_KEY")
+            )
+            
+            # PostgREST 요청 수/송수신 바이트 집계 (실행 계측)
+            hooks = _client.postgrest.session.event_hooks
+            hooks["request"].append(count_db_request)
+            hooks["response"].append(count_db_response)
+        return _client
+
+
+def count_db_request(request):
+    metrics = get_metrics()
+    metrics.incr("db_requests")
+    metrics.incr("db_bytes_out", len(request.content))
+
+
+def count_db_response(response):
+    response.read()
+    get_metrics().incr("db_bytes_in", len(response.content))
+
 
 class SupabaseAreaBasedHandler:
     def __init__(self):
-        # 환경 변수 로드
-        load_dotenv()
-        
-        # Supabase 클라이언트 생성
-        self.client = create_client(
-            os.getenv("SUPABASE_BASE_URL"),
-            os.getenv("SUPABASE_API_KEY")
-        )
+        self.client = get_supabase_client()
         self.mapper = AreaBasedMapper()
     
-    def get_existing_data(self, table_name, key_field, page_size=1000):
-        """기존 데이터 조회 (페이징으로 전체 조회)"""
-        try:
-            if isinstance(key_field, list):
-                # 복합 키인 경우 모든 키 필드와 data_hash 조회
-                select_fields = "id, " + ", ".join(key_field) + ", data_hash"
-            else:
-                # 단일 키인 경우
-                select_fields = f"id, {key_field}, data_hash"
+    def get_existing_data(self, table_name, key_field, page_size=EXISTING_READ_PAGE_SIZE, updated_since=None,
+                          concurrency=EXISTING_READ_CONCURRENCY):
+        """
+        기존 데이터 조회 (전체 행 수 확인 후 범위 구간을 병렬 조회)
+        
+        updated_since가 주어지면 updated_at이 그 이후(같은 시각 포함)인 행만 조회한다.
+        구간 결과는 id 순서대로 이어 붙인다.
+        
+        조회가 실패하거나 읽은 행 수가 전체 행 수와 다르면 예외를 발생시킨다.
+        (빈 결과로 대신하면 호출자가 모든 행을 신규로 판단하거나 빈 키 인덱스를 저장하게 됨)
+        """
+        with phase("existing_read"):
+            try:
+                if isinstance(key_field, list):
+                    # 복합 키인 경우 모든 키 필드와 data_hash 조회
+                    select_fields = "id, " + ", ".join(key_field) + ", data_hash, updated_at"
+                else:
+                    # 단일 키인 경우
+                    select_fields = f"id, {key_field}, data_hash, updated_at"
 
-            all_rows = []
-            start = 0
-            while True:
-                end = start + page_size - 1
-                response = self.client.table(table_name)\
-                    .select(select_fields)\
-                    .range(start, end)\
-                    .execute()
+                def build_query(columns, count=None):
+                    query = self.client.table(table_name).select(columns, count=count)
+                    if updated_since:
+                        query = query.gte("updated_at", updated_since)
+                    return query
 
-                rows = response.data or []
-                all_rows.extend(rows)
+                # 전체 행 수 확인
+                total_count = build_query("id", count="exact").limit(1).execute().count or 0
+                if total_count == 0:
+                    return []
 
-                if len(rows) < page_size:
-                    break
+                def fetch_window(start):
+                    """[start, start + page_size) 구간 조회 (서버 최대 행 수 제한으로 잘리면 나머지 이어서 조회)"""
+                    end = min(start + page_size, total_count) - 1
+                    rows = []
+                    while start + len(rows) <= end:
+                        response = build_query(select_fields)\
+                            .order("id")\
+                            .range(start + len(rows), end)\
+                            .execute()
+                        if not response.data:
+                            break
+                        rows.extend(response.data)
+                    return rows
 
-                start += page_size
+                starts = list(range(0, total_count, page_size))
+                if len(starts) == 1:
+                    all_rows = fetch_window(0)
+                else:
+                    with ThreadPoolExecutor(max_workers=min(concurrency, len(starts))) as executor:
+                        windows = map_in_scope(executor, fetch_window, starts)
+                    all_rows = [row for rows in windows for row in rows]
+                    print(f"  📥 기존 데이터 {len(all_rows)}개 조회 ({len(starts)}개 구간, 동시 {min(concurrency, len(starts))}개)")
 
-            return all_rows
+                # 조회 중 행이 추가/삭제되었거나 구간이 비어 돌아온 경우
+                if len(all_rows) != total_count:
+                    raise RuntimeError(f"조회한 행 수({len(all_rows)}개)가 전체 행 수({total_count}개)와 다릅니다")
+                return all_rows
+            except Exception as e:
+                print(f"❌ 기존 데이터 조회 실패: {str(e)}")
+                raise e
+    
+    
+    def get_max_value(self, table_name, column):
+        """컬럼의 최댓값 조회 (증분 수집 워터마크용)"""
+        try:
+            response = self.client.table(table_name)\
+                .select(column)\
+                .not_.is_(column, "null")\
+                .order(column, desc=True)\
+                .limit(1)\
+                .execute()
+            rows = response.data or []
+            return rows[0][column] if rows else None
         except Exception as e:
-            print(f"❌ 기존 데이터 조회 실패: {str(e)}")
-            return []
+            print(f"⚠️  최댓값 조회 실패 ({table_name}.{column}): {str(e)}")
+            return None
     
+    def get_rows_by_value(self, table_name, select_fields, column, value, page_size=EXISTING_READ_PAGE_SIZE):
+        """
+        column = value인 행 조회 (id 순서로 page_size씩 이어서 조회)
+
+        Returns:
+            list: 조회된 행 (실패 시 None)
+        """
+        with phase("existing_read"):
+            try:
+                rows = []
+                while True:
+                    response = self.client.table(table_name)\
+                        .select(select_fields)\
+                        .eq(column, value)\
+                        .order("id")\
+                        .range(len(rows), len(rows) + page_size - 1)\
+                        .execute()
+                    if not response.data:
+                        return rows
+                    rows.extend(response.data)
+            except Exception as e:
+                print(f"⚠️  행 조회 실패 ({table_name}.{column}={value}): {str(e)}")
+                return None
+
     def insert_record(self, table_name, data):
         """신규 레코드 업서트(충돌 시 병합)"""
         try:
-            # 테이블별 고유 제약 기준으로 on_conflict 지정
-            if table_name == 'base_tour_areabased':
-                on_conflict = "hubtatscode,baseym"
-            else:
-                # greentour_areabased, barrier_free_areabased는 contentid가 UNIQUE
-                on_conflict = "contentid"
+            on_conflict = self.get_conflict_target(table_name)
             response = self.client.table(table_name).upsert(data, on_conflict=on_conflict).execute()
             return response.data
         except Exception as e:
@@ -67,7 +180,7 @@ class SupabaseAreaBasedHandler:
     def update_record(self, table_name, record_id, data):
         """기존 레코드 업데이트"""
         try:
-            data['updated_at'] = datetime.now().isoformat()
+            data['updated_at'] = DB_NOW
             response = self.client.table(table_name)\
                 .update(data)\
                 .eq("id", record_id)\
@@ -77,17 +190,64 @@ class SupabaseAreaBasedHandler:
             print(f"❌ 레코드 업데이트 실패: {str(e)}")
             raise e
     
-    def batch_upsert(self, table_name, data_list, batch_size=100):
-        """배치 업서트"""
+    @staticmethod
+    def get_conflict_target(table_name):
+        """테이블별 업서트 충돌 기준 컬럼 (on_conflict)"""
+        return CONFLICT_TARGETS.get(table_name, "contentid")
+    
+    def batch_upsert(self, table_name, data_list, batch_size=SYNC_UPSERT_BATCH_SIZE):
+        """
+        배치 업서트 (WriterPool로 여러 배치를 동시에 전송)
+        
+        실패한 배치는 반으로 나누어 다시 시도하여, 문제가 되는 행만 제외하고 나머지는 반영한다.
+        
+        Returns:
+            tuple: (upserted: list, failed: list)
+                upserted: 반영된 행 (DB가 돌려준 id 포함)
+                failed: 반영하지 못한 (행, 오류 메시지) 목록
+        """
+        on_conflict = self.get_conflict_target(table_name)
+        upserted = []
+        failed = []
+        
+        with WriterPool(label=f"{table_name} 업서트") as pool:
+            futures = [
+                pool.submit(self.upsert_batch, table_name, data_list[i:i + batch_size], on_conflict)
+                for i in range(0, len(data_list), batch_size)
+            ]
+        
+        for batch_no, future in enumerate(futures, 1):
+            batch_upserted, batch_failed = future.result()
+            upserted.extend(batch_upserted)
+            failed.extend(batch_failed)
+            
+            if batch_failed:
+                print(f"  📦 배치 {batch_no}: {len(batch_upserted)}개 처리, {len(batch_failed)}개 실패")
+            else:
+                print(f"  📦 배치 {batch_no}: {len(batch_upserted)}개 처리")
+        
+        return upserted, failed
+    
+    def upsert_batch(self, table_name, batch, on_conflict):
+        """배치 하나 업서트 (WriterPool 작업 단위, 매핑된 행은 여기서 dict로 변환)"""
+        upserted = []
+        failed = []
+        self.upsert_bisect(table_name, to_rows(batch), on_conflict, upserted, failed)
+        return upserted, failed
+    
+    def upsert_bisect(self, table_name, batch, on_conflict, upserted, failed):
+        """배치 업서트 후 실패하면 절반씩 나누어 재귀적으로 재시도"""
         try:
-            for i in range(0, len(data_list), batch_size):
-                batch = data_list[i:i + batch_size]
-                # 고유 제약(UNIQUE): hubtatscode, baseym 기준으로 업서트
-                self.client.table(table_name).upsert(batch, on_conflict="hubtatscode,baseym").execute()
-                print(f"  📦 배치 {i//batch_size + 1}: {len(batch)}개 처리")
+            response = self.client.table(table_name).upsert(batch, on_conflict=on_conflict).execute()
+            upserted.extend(response.data or batch)
         except Exception as e:
-            print(f"❌ 배치 업서트 실패: {str(e)}")
-            raise e
+            if len(batch) == 1:
+                failed.append((batch[0], str(e)))
+                return
+            
+            mid = len(batch) // 2
+            self.upsert_bisect(table_name, batch[:mid], on_conflict, upserted, failed)
+            self.upsert_bisect(table_name, batch[mid:], on_conflict, upserted, failed)
     
     def log_sync_result(self, api_type, table_name, stats):
         """동기화 결과 로그"""
@@ -99,13 +259,24 @@ class SupabaseAreaBasedHandler:
                 'total_items': stats.get('total', 0),
                 'new_items': stats.get('new', 0),
                 'updated_items': stats.get('updated', 0),
-                'status': 'SUCCESS' if stats.get('success', True) else 'FAILED',
+                # PARTIAL: 받은 데이터는 반영했지만 일부 지역 단위 수집 실패
+                'status': stats.get('status') or ('SUCCESS' if stats.get('success', True) else 'FAILED'),
                 'error_message': stats.get('error_message'),
                 'completed_at': datetime.now().isoformat(),
                 'execution_time_seconds': stats.get('execution_time', 0)
             }
+            if stats.get('metrics'):
+                log_data['metrics'] = stats['metrics']
             
-            self.client.table('sync_logs').insert(log_data).execute()
+            try:
+                self.client.table('sync_logs').insert(log_data).execute()
+            except Exception as e:
+                # metrics 컬럼이 없는 기존 스키마 (migrate_sync_logs_metrics.sql 미적용)
+                if 'metrics' not in log_data or 'metrics' not in str(e):
+                    raise
+                print("⚠️  sync_logs에 metrics 컬럼이 없어 계측값 없이 기록 (migrate_sync_logs_metrics.sql 실행 필요)")
+                del log_data['metrics']
+                self.client.table('sync_logs').insert(log_data).execute()
             print(f"✅ 동기화 로그 기록 완료")
             
         except Exception as e:
@@ -123,13 +294,17 @@ class SupabaseAreaBasedHandler:
             return 0
     
     def test_connection(self):
-        """연결 테스트"""
+        """연결 테스트 (프로세스에서 한 번 성공하면 다시 확인하지 않음)"""
+        global _connection_verified
+        if _connection_verified:
+            return True
         try:
             # 간단한 쿼리로 연결 테스트
             response = self.client.table('sync_logs')\
                 .select("id")\
                 .limit(1)\
                 .execute()
+            _connection_verified = True
             return True
         except Exception as e:
             print(f"❌ Supabase 연결 실패: {str(e)}")
@@ -1,16 +1,49 @@
+import gzip
 import requests
 import json
-from settings.config import SUPABASE_API_KEY, SUPABASE_BASE_URL
+from batch.writer_pool import WriterPool
+from settings.config import (
+    HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT, SUPABASE_API_KEY, SUPABASE_BASE_URL, SUPABASE_GZIP, SYNC_UPSERT_BATCH_SIZE
+)
+from settings.metrics import get_metrics, phase
+from sync.hash_utils import calculate_data_hash
+
+# tourism_data 해시 방식 (마이그레이션의 plpgsql 해시와 같은 sha256 고정)
+TOURISM_DATA_HASH_SCHEME = "sha256"
 
 class SupabaseHandler:
     def __init__(self):
         self.api_key = SUPABASE_API_KEY
         self.base_url = SUPABASE_BASE_URL
+        # 배치 요청 간 커넥션 재사용
+        self.session = requests.Session()
+        self.session.hooks["response"].append(self.count_db_traffic)
+        self.timeout = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+        # 서버가 gzip 요청 본문을 거부하면 이번 실행에서는 압축하지 않음
+        self.gzip_enabled = SUPABASE_GZIP
+        
+    def get_headers(self):
+        """PostgREST 공통 요청 헤더"""
+        return {
+            "apikey": self.api_key,
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+    
+    @staticmethod
+    def count_db_traffic(response, *args, **kwargs):
+        """요청 수/송수신 바이트 집계 (실행 계측)"""
+        metrics = get_metrics()
+        metrics.incr("db_requests")
+        metrics.incr("db_bytes_out", len(response.request.body or b""))
+        metrics.incr("db_bytes_in", len(response.content))
         
     def save_to_db(self, table_name, data):
         """
         Supabase 테이블에 데이터 저장
         
+        행에 data_hash가 있으면 같은 (api_type, endpoint_name)에 이미 저장된 해시와 같은 행은 건너뛴다.
+        
         Args:
             table_name (str): 저장할 테이블명
             data (dict): 저장할 데이터
@@ -25,27 +58,115 @@ class SupabaseHandler:
             return False, "Supabase Base URL이 설정되지 않았습니다."
             
         url = f"{self.base_url}/rest/v1/{table_name}"
-        headers = {
-            "apikey": self.api_key,
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "Prefer": "return=minimal"
-        }
+        headers = self.get_headers()
+        headers["Prefer"] = "return=minimal"
         
+        # 데이터가 리스트인 경우 SYNC_UPSERT_BATCH_SIZE개씩 나누어 WriterPool로 동시에 삽입
+        rows = data if isinstance(data, list) else [data]
         try:
-            # 데이터가 리스트인 경우 배치 삽입
-            if isinstance(data, list):
-                response = requests.post(url, headers=headers, json=data)
-            else:
-                response = requests.post(url, headers=headers, json=[data])
-                
-            if response.status_code in [200, 201]:
-                return True, "데이터베이스 저장 성공"
-            else:
-                return False, f"데이터베이스 저장 실패: HTTP {response.status_code}"
-                
+            with phase("existing_read"):
+                rows, skipped = self.skip_existing_rows(url, rows)
+        except Exception as e:
+            return False, f"기존 해시 조회 실패 (migrate_tourism_data.sql 적용 여부 확인): {str(e)}"
+        
+        if not rows:
+            return True, f"변경 없음 (중복 {skipped}개 건너뜀)"
+        
+        batches = [rows[i:i + SYNC_UPSERT_BATCH_SIZE] for i in range(0, len(rows), SYNC_UPSERT_BATCH_SIZE)]
+        
+        try:
+            with phase("write"), WriterPool(label=f"{table_name} 저장") as pool:
+                futures = [pool.submit(self.post_batch, url, headers, batch) for batch in batches]
         except Exception as e:
             return False, f"데이터베이스 연결 실패: {str(e)}"
+        
+        failed_statuses = []
+        for future in futures:
+            try:
+                status_code = future.result()
+            except Exception as e:
+                return False, f"데이터베이스 연결 실패: {str(e)}"
+            if status_code not in [200, 201]:
+                failed_statuses.append(status_code)
+        
+        if not failed_statuses:
+            if skipped:
+                return True, f"데이터베이스 저장 성공 (신규 {len(rows)}개, 중복 {skipped}개 건너뜀)"
+            return True, "데이터베이스 저장 성공"
+        if len(batches) == 1:
+            return False, f"데이터베이스 저장 실패: HTTP {failed_statuses[0]}"
+        return False, f"데이터베이스 저장 실패: 배치 {len(batches)}개 중 {len(failed_statuses)}개 실패 (HTTP {failed_statuses[0]})"
+    
+    def post_batch(self, url, headers, batch):
+        """
+        배치 하나 삽입 후 HTTP 상태 코드 반환 (WriterPool 작업 단위)
+        
+        SUPABASE_GZIP이면 요청 본문을 gzip으로 압축하며, 서버가 압축 본문을 거부한 경우
+        (415 또는 Content-Encoding을 지목한 400)에만 압축 없이 다시 보낸다.
+        """
+        body = json.dumps(batch, ensure_ascii=False).encode("utf-8")
+        
+        if self.gzip_enabled:
+            gzip_headers = dict(headers, **{"Content-Encoding": "gzip"})
+            response = self.session.post(url, headers=gzip_headers, data=gzip.compress(body), timeout=self.timeout)
+            if not self.is_encoding_rejected(response):
+                return response.status_code
+            if self.gzip_enabled:
+                self.gzip_enabled = False
+                print(f"[DB 저장] 서버가 gzip 요청 본문을 거부하여 압축 없이 전송합니다 (HTTP {response.status_code})")
+        
+        response = self.session.post(url, headers=headers, data=body, timeout=self.timeout)
+        return response.status_code
+    
+    @staticmethod
+    def is_encoding_rejected(response):
+        """압축 본문 거부 응답 여부 (다른 400 오류는 압축과 무관하므로 다시 보내지 않음)"""
+        if response.status_code == 415:
+            return True
+        if response.status_code != 400:
+            return False
+        text = response.text.lower()
+        return "encoding" in text or "gzip" in text
+    
+    def skip_existing_rows(self, url, rows):
+        """
+        이미 저장된 행 제외 (같은 api_type, endpoint_name에 같은 data_hash가 있는 행)
+        
+        저장된 해시 전체를 읽지 않고, 이번 목록의 해시만 묶음으로 나누어 조회한다.
+        
+        Returns:
+            tuple: (rows: 저장할 행 목록, skipped: 건너뛴 행 수)
+        """
+        if not rows or "data_hash" not in rows[0]:
+            return rows, 0
+        
+        # (api_type, endpoint_name)별 행 목록 (이번 목록 안의 중복도 함께 제외)
+        scoped_rows = {}
+        for row in rows:
+            scope = (row.get("api_type"), row.get("endpoint_name"))
+            scoped_rows.setdefault(scope, {}).setdefault(row["data_hash"], row)
+        
+        new_rows = []
+        for scope, rows_by_hash in scoped_rows.items():
+            existing_hashes = self.get_existing_hashes(url, *scope, list(rows_by_hash))
+            new_rows.extend(row for data_hash, row in rows_by_hash.items() if data_hash not in existing_hashes)
+        
+        return new_rows, len(rows) - len(new_rows)
+    
+    def get_existing_hashes(self, url, api_type, endpoint_name, hashes, batch_size=100):
+        """hashes 중 (api_type, endpoint_name)에 이미 저장된 data_hash 집합 조회 (data_hash=in.(...) 묶음 조회)"""
+        existing = set()
+        for i in range(0, len(hashes), batch_size):
+            batch = hashes[i:i + batch_size]
+            response = self.session.get(url, headers=self.get_headers(), timeout=self.timeout, params={
+                "select": "data_hash",
+                "api_type": f"eq.{api_type}",
+                "endpoint_name": f"eq.{endpoint_name}",
+                "data_hash": f"in.({','.join(batch)})"
+            })
+            response.raise_for_status()
+            existing.update(row["data_hash"] for row in response.json())
+        return existing
     
     def create_table_data(self, api_type, endpoint_name, raw_data):
         """
@@ -66,12 +187,7 @@ class SupabaseHandler:
                 # base_tour는 이미 통합된 형태
                 items = raw_data.get("items", [])
                 for item in items:
-                    table_data.append({
-                        "api_type": api_type,
-                        "endpoint_name": endpoint_name,
-                        "data": json.dumps(item, ensure_ascii=False),
-                        "created_at": "now()"
-                    })
+                    table_data.append(self.make_row(api_type, endpoint_name, item))
             else:
                 # 다른 API들은 표준 구조 가정
                 response_body = raw_data.get("response", {}).get("body", {})
@@ -81,14 +197,24 @@ class SupabaseHandler:
                     items = [items] if items else []
                     
                 for item in items:
-                    table_data.append({
-                        "api_type": api_type,
-                        "endpoint_name": endpoint_name, 
-                        "data": json.dumps(item, ensure_ascii=False),
-                        "created_at": "now()"
-                    })
+                    table_data.append(self.make_row(api_type, endpoint_name, item))
                     
         except Exception as e:
             print(f"데이터 변환 실패: {str(e)}")
             
         return table_data
+    
+    @staticmethod
+    def make_row(api_type, endpoint_name, item):
+        """
+        item 하나를 tourism_data 행으로 변환 (data는 JSON 문자열이 아닌 JSON 객체로 저장)
+        
+        data_hash는 migrate_tourism_data.sql의 기존 행 해시와 같아야 하므로 HASH_SCHEME과 관계없이 sha256을 사용한다.
+        """
+        return {
+            "api_type": api_type,
+            "endpoint_name": endpoint_name,
+            "data": item,
+            "data_hash": calculate_data_hash(item, TOURISM_DATA_HASH_SCHEME),
+            "created_at": "now()"
+        }
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# Supabase 쓰기 요청 풀
+# 배치 쓰기 요청을 동시에 최대 workers개까지 보내고, 실행 대기 중인 요청이 queue_size개를 넘으면
+# submit이 자리가 날 때까지 기다리게 하여(backpressure) DB가 느릴 때 메모리에 요청이 쌓이지 않게 한다.
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from settings.config import WRITER_CONCURRENCY, WRITER_QUEUE_SIZE
+from settings.metrics import submit_in_scope
+
+class WriterPool:
+    """동시 실행 수와 대기열 크기가 제한된 쓰기 작업 풀 (with 문으로 사용)"""
+
+    def __init__(self, workers=WRITER_CONCURRENCY, queue_size=WRITER_QUEUE_SIZE, label="쓰기"):
+        self.workers = max(1, workers)
+        self.label = label
+        self.executor = ThreadPoolExecutor(max_workers=self.workers)
+        # 실행 중 + 대기 중인 작업 수 상한
+        self.slots = threading.BoundedSemaphore(self.workers + max(0, queue_size))
+        self.lock = threading.Lock()
+        self.pending = set()
+        self.latencies = []
+        self.blocked_seconds = 0.0
+        self.errors = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # 정상 종료: 남은 작업을 모두 반영 / 오류: 아직 시작하지 않은 작업은 취소하고 실행 중인 작업만 마무리
+        self.close(cancel_pending=exc_type is not None)
+        return False
+
+    def submit(self, func, *args, **kwargs):
+        """
+        쓰기 작업 제출 (대기열이 가득 차면 자리가 날 때까지 대기)
+
+        Returns:
+            Future: 작업 결과
+        """
+        wait_start = time.perf_counter()
+        self.slots.acquire()
+        blocked = time.perf_counter() - wait_start
+
+        try:
+            future = submit_in_scope(self.executor, self.run, func, args, kwargs)
+        except Exception:
+            self.slots.release()
+            raise
+
+        with self.lock:
+            self.blocked_seconds += blocked
+            self.pending.add(future)
+        future.add_done_callback(self.on_done)
+        return future
+
+    def run(self, func, args, kwargs):
+        """작업 실행 및 소요 시간 기록"""
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            with self.lock:
+                self.errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                self.latencies.append(elapsed)
+
+    def on_done(self, future):
+        with self.lock:
+            self.pending.discard(future)
+        self.slots.release()
+
+    def drain(self):
+        """제출된 작업이 모두 끝날 때까지 대기"""
+        with self.lock:
+            pending = list(self.pending)
+        if pending:
+            wait(pending)
+
+    def close(self, cancel_pending=False):
+        """풀 종료 (cancel_pending이면 시작하지 않은 작업 취소)"""
+        if not cancel_pending:
+            self.drain()
+        self.executor.shutdown(wait=True, cancel_futures=cancel_pending)
+        self.print_stats()
+
+    def summary(self):
+        """배치 수, 평균/p95/최대 지연(초), submit 대기 시간, 오류 수"""
+        with self.lock:
+            latencies = sorted(self.latencies)
+            blocked_seconds = self.blocked_seconds
+            errors = self.errors
+
+        if not latencies:
+            return {"batches": 0, "avg": 0.0, "p95": 0.0, "max": 0.0, "blocked": blocked_seconds, "errors": errors}
+
+        p95_index = min(len(latencies) - 1, int(len(latencies) * 0.95))
+        return {
+            "batches": len(latencies),
+            "avg": sum(latencies) / len(latencies),
+            "p95": latencies[p95_index],
+            "max": latencies[-1],
+            "blocked": blocked_seconds,
+            "errors": errors
+        }
+
+    def print_stats(self):
+        """배치 지연 통계 출력 (배치가 2개 이상일 때만)"""
+        stats = self.summary()
+        if stats["batches"] < 2:
+            return
+        print(
+            f"  ⏱️  {self.label}: 배치 {stats['batches']}개 (동시 {self.workers}개), "
+            f"평균 {stats['avg'] * 1000:.0f}ms, p95 {stats['p95'] * 1000:.0f}ms, 최대 {stats['max'] * 1000:.0f}ms, "
+            f"대기 {stats['blocked']:.2f}초, 오류 {stats['errors']}개"
+        )
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# 모의 서버를 사용한 수집 → 매핑 → DB 반영 종단 간 벤치마크
+#
+# 관광 API 모의 서버(benchmarks/mock_kto.py)와 PostgREST 모의 서버(benchmarks/mock_postgrest.py)를
+# 이 프로세스에서 띄우고, 단계마다 새 프로세스에서 TourismCrawler.execute_crawling 또는
+# AreaBasedSynchronizer.sync_items를 실행하여 items/s, API/DB 요청 수, 최대 RSS를 비교한다.
+# 단계마다 프로세스를 새로 띄우므로 최대 RSS가 단계별로 분리되고 모듈 상태도 공유되지 않는다.
+#
+# 단계 (--modes):
+#   cold     빈 DB에 전체 수집/저장
+#   warm     변경 없이 다시 실행 (모두 건너뜀)
+#   changed  모의 데이터의 --change-rate 비율을 바꾼 뒤 실행
+#   stream   --stream 모드로 실행
+#   sync     API 없이 합성 item을 sync_items로 바로 동기화 (모든 행 업데이트)
+#
+# 키 인덱스/체크포인트/캐시는 임시 디렉토리를 사용하며, 그 밖의 설정(FETCH_CONCURRENCY, HASH_SCHEME,
+# KEY_INDEX_ENABLED, CRAWL_AREAS 등)은 현재 환경 변수를 그대로 따른다. FETCH_RPS는 지정하지 않으면 1000으로 올린다.
+#
+# 사용법:
+#   python3 benchmarks/e2e_bench.py --items 20000 --latency-ms 30
+#   python3 benchmarks/e2e_bench.py --apis 3 --modes cold,warm --error-rate 0.02 --phases
+
+import argparse
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.fixtures import make_items
+from benchmarks.mock_kto import MockTourApiServer
+from benchmarks.mock_postgrest import MockPostgrestServer
+
+# API 번호 → (엔드포인트 ID, API 타입) - areaBasedList 엔드포인트
+BENCH_APIS = {
+    "1": ("2", "greentour"),
+    "2": ("5", "barrier_free"),
+    "3": ("1", "base_tour")
+}
+
+MODES = ["cold", "warm", "changed", "stream", "sync"]
+
+# 자식 프로세스 결과 줄 접두어
+RESULT_PREFIX = "@@E2E_RESULT "
+
+
+def run_stage(spec):
+    """자식 프로세스: 단계 하나를 실행하고 계측 결과 반환"""
+    from settings.metrics import end_scope, start_scope
+
+    api_key = spec["api_key"]
+    endpoint_id, api_type = BENCH_APIS[api_key]
+    items = make_items(api_type, spec["items"], seed=spec["seed"] + 1) if spec["mode"] == "sync" else None
+
+    scope = start_scope()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(sys.stdout if spec["verbose"] else devnull):
+        if spec["mode"] == "sync":
+            from sync.areabased_sync import AreaBasedSynchronizer
+            success = AreaBasedSynchronizer().sync_items(items, api_type)
+        else:
+            from main import TourismCrawler
+            crawler = TourismCrawler()
+            crawler.options["engine"] = spec["engine"]
+            if spec["mode"] == "stream":
+                crawler.options["stream"] = True
+            success = crawler.execute_crawling(api_key, endpoint_id, False, True)
+    end_scope()
+    summary = scope.summary()
+    summary["success"] = bool(success)
+    return summary
+
+
+def make_env(kto_server, db_server, work_dir):
+    """자식 프로세스 환경 변수 (모의 서버 주소, 임시 캐시 경로)"""
+    env = dict(os.environ)
+    env.update({
+        "TOUR_API_BASE_URL": kto_server.base_url,
+        "SUPABASE_BASE_URL": db_server.base_url,
+        "SUPABASE_API_KEY": "bench",
+        "SUPABASE_DB_DSN": "",
+        "DATA_KEY_DECODING": "bench",
+        "KEY_INDEX_PATH": os.path.join(work_dir, "key_index.sqlite"),
+        "CHECKPOINT_DIR": os.path.join(work_dir, "checkpoints"),
+        "PAGE_SIZE_CACHE_PATH": os.path.join(work_dir, "page_sizes.json"),
+        "REGION_SIZE_CACHE_PATH": os.path.join(work_dir, "region_sizes.json"),
+        "RESPONSE_CACHE_DIR": os.path.join(work_dir, "http")
+    })
+    env.setdefault("FETCH_RPS", "1000")
+    return env
+
+
+def run_child(spec, env):
+    """단계 하나를 새 프로세스에서 실행"""
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--stage", json.dumps(spec)],
+        env=env, cwd=ROOT_DIR, capture_output=True, text=True
+    )
+    result = None
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            result = json.loads(line[len(RESULT_PREFIX):])
+        elif spec["verbose"]:
+            print(line)
+    if result is None and completed.stderr:
+        print(completed.stderr[-2000:], file=sys.stderr)
+    return result
+
+
+def print_row(api_type, mode, result, show_phases):
+    """단계 결과 한 줄 출력"""
+    if result is None:
+        print(f"{api_type:<14}{mode:<9}{'(실행 오류)':>12}")
+        return
+
+    counters = result["counters"]
+    items = counters.get("items_mapped", 0)
+    seconds = result["wall_seconds"]
+    api_requests = f"{counters.get('api_requests', 0)}/{counters.get('api_retries', 0)}"
+    status = "" if result["success"] else "  실패"
+    print(
+        f"{api_type:<14}{mode:<9}{items:>9,}{seconds:>9.2f}{items / seconds if seconds else 0:>11,.0f}"
+        f"{api_requests:>11}{counters.get('db_requests', 0):>8}{counters.get('db_bytes_out', 0) / 1024:>11,.0f}"
+        f"{result['peak_memory_mb'] or 0:>9.1f}{status}"
+    )
+    if show_phases:
+        for name, phase in result["phases"].items():
+            print(f"{'':<23}- {name}: {phase['seconds']:.2f}초 ({phase['calls']}회)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모의 서버 종단 간 벤치마크")
+    parser.add_argument("--apis", default="1,2,3", help="API 번호 (쉼표 구분, 1: 생태관광, 2: 무장애, 3: 기초지자체)")
+    parser.add_argument("--modes", default="cold,warm,changed,stream", help=f"단계 (쉼표 구분: {', '.join(MODES)})")
+    parser.add_argument("--items", type=int, default=10000, help="API별 item 수 (최대 100000)")
+    parser.add_argument("--latency-ms", type=float, default=20, help="모의 API 요청별 지연 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="모의 API 오류 응답 비율 (0~1)")
+    parser.add_argument("--max-rows", type=int, default=1000, help="모의 API 페이지당 최대 item 수")
+    parser.add_argument("--change-rate", type=float, default=0.05, help="changed 단계에서 바꿀 item 비율")
+    parser.add_argument("--engine", default="sync", choices=["sync", "async"], help="수집 엔진")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--phases", action="store_true", help="단계별 세부 시간 출력")
+    parser.add_argument("--verbose", action="store_true", help="크롤러 출력 표시")
+    parser.add_argument("--stage", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.stage:
+        result = run_stage(json.loads(args.stage))
+        print(RESULT_PREFIX + json.dumps(result))
+        return
+
+    apis = [api_key.strip() for api_key in args.apis.split(",") if api_key.strip() in BENCH_APIS]
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip() in MODES]
+
+    kto_server = MockTourApiServer(
+        items=args.items, latency_ms=args.latency_ms, error_rate=args.error_rate,
+        max_rows=args.max_rows, seed=args.seed
+    ).start()
+    db_server = MockPostgrestServer().start()
+
+    print(
+        f"모의 API {kto_server.base_url} (API별 {args.items:,}개, 지연 {args.latency_ms:g}ms, "
+        f"오류 {args.error_rate:.1%}), 모의 PostgREST {db_server.base_url}, 엔진 {args.engine}"
+    )
+    print(
+        f"\n{'API':<14}{'stage':<9}{'items':>9}{'seconds':>9}{'items/s':>11}"
+        f"{'API req/re':>11}{'DB req':>8}{'DB out KB':>11}{'RSS MB':>9}"
+    )
+
+    generation = 0
+    start_time = time.perf_counter()
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            env = make_env(kto_server, db_server, work_dir)
+            for api_key in apis:
+                api_type = BENCH_APIS[api_key][1]
+                for mode in modes:
+                    if mode == "changed":
+                        generation += 1
+                        kto_server.dataset.mutate(args.change_rate, generation)
+
+                    spec = {
+                        "api_key": api_key, "mode": mode, "items": args.items, "seed": args.seed,
+                        "engine": args.engine, "verbose": args.verbose
+                    }
+                    print_row(api_type, mode, run_child(spec, env), args.phases)
+    finally:
+        kto_server.stop()
+        db_server.stop()
+
+    print(
+        f"\n총 {time.perf_counter() - start_time:.1f}초, 모의 API 요청 {kto_server.stats['requests']:,}회 "
+        f"(오류 {kto_server.stats['errors']:,}회), 모의 PostgREST 요청 {db_server.stats['requests']:,}회"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# 벤치마크용 합성 데이터 - 실제 API 응답 필드 구성을 따르는 item 생성
+
+import random
+
+SIGNGU_CODES = [
+    "47111", "47113", "47130", "47150", "47170", "47190", "47210",
+    "47230", "47250", "47280", "47290", "47730", "47750", "47760",
+    "47770", "47820", "47830", "47840", "47850", "47900", "47920",
+    "47930", "47940"
+]
+
+
+def make_greentour_item(i, rng=random):
+    """생태관광 areaBasedList1 item"""
+    return {
+        "contentid": str(1000000 + i),
+        "areacode": "35",
+        "sigungucode": str(rng.randint(1, 23)),
+        "title": f"생태관광지 {i}",
+        "addr": f"경상북도 어딘가 {i}번길 {rng.randint(1, 300)}",
+        "tel": f"054-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        "telname": "관광안내소",
+        "mainimage": f"http://tong.visitkorea.or.kr/cms/resource/{i}/image.jpg",
+        "summary": "자연 생태 자원을 체험할 수 있는 관광지입니다. " * rng.randint(3, 10),
+        "createdtime": "20200101000000",
+        "modifiedtime": f"2025{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}000000",
+        "cpyrhtDivCd": "Type3"
+    }
+
+
+def make_barrier_free_item(i, rng=random):
+    """무장애 여행 areaBasedList2 item"""
+    return {
+        "contentid": str(2000000 + i),
+        "contenttypeid": rng.choice(["12", "14", "28", "32", "39"]),
+        "areacode": "35",
+        "sigungucode": str(rng.randint(1, 23)),
+        "cat1": "A01",
+        "cat2": "A0101",
+        "cat3": "A01010100",
+        "title": f"무장애 관광지 {i}",
+        "addr1": f"경상북도 어딘가 {i}번길",
+        "addr2": f"({rng.randint(1, 99)}동)",
+        "tel": f"054-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        "firstimage": f"http://tong.visitkorea.or.kr/cms/resource/{i}/first.jpg",
+        "firstimage2": f"http://tong.visitkorea.or.kr/cms/resource/{i}/first_thumb.jpg",
+        "mapx": f"{128 + rng.random():.10f}",
+        "mapy": f"{36 + rng.random():.10f}",
+        "mlevel": "6",
+        "zipcode": f"{rng.randint(36000, 40999)}",
+        "createdtime": "20200101000000",
+        "modifiedtime": f"2025{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}000000",
+        "cpyrhtDivCd": "Type3",
+        "lclsSystm1": "NA",
+        "lclsSystm2": "NA04",
+        "lclsSystm3": "NA040500",
+        "lDongRegnCd": "47",
+        "lDongSignguCd": str(rng.randint(110, 940)),
+        "showflag": "1"
+    }
+
+
+def make_base_tour_item(i, rng=random):
+    """중심 관광지 areaBasedList1 item"""
+    signgu = SIGNGU_CODES[i % len(SIGNGU_CODES)]
+    return {
+        "baseYm": "202506",
+        "areaCd": "47",
+        "areaNm": "경상북도",
+        "signguCd": signgu,
+        "signguNm": f"시군구{signgu}",
+        "hubTatsCd": f"{signgu}{i:08d}",
+        "hubTatsNm": f"중심 관광지 {i}",
+        "hubCtgryLclsNm": "관광지",
+        "hubCtgryMclsNm": "자연관광",
+        "hubRank": str(rng.randint(1, 50)),
+        "mapX": f"{128 + rng.random():.10f}",
+        "mapY": f"{36 + rng.random():.10f}"
+    }
+
+
+ITEM_FACTORIES = {
+    "greentour": make_greentour_item,
+    "barrier_free": make_barrier_free_item,
+    "base_tour": make_base_tour_item
+}
+
+
+def make_items(api_type, count, seed=42):
+    """api_type에 맞는 합성 item count개 생성 (seed 고정으로 재현 가능)"""
+    rng = random.Random(seed)
+    factory = ITEM_FACTORIES[api_type]
+    return [factory(i, rng) for i in range(count)]
+
+
+def wrap_response(api_type, items):
+    """call_api가 반환하는 결과 형태로 감싸기"""
+    if api_type == "base_tour":
+        return {"areaCd": "47", "totalCount": len(items), "items": items}
+    return {"response": {"body": {"totalCount": len(items), "items": {"item": items}}}}
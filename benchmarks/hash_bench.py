@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# data_hash 계산 방식별 속도 비교
+#
+# 방식: sha256(기존) / blake2b / xxh3(xxhash 설치 시)
+# 배치: calculate_data_hashes를 단일 프로세스와 프로세스 풀(--workers)로 비교
+#
+# 사용법:
+#   python3 benchmarks/hash_bench.py --count 50000 --workers 4
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import make_items
+from sync.hash_utils import HASH_PREFIXES, calculate_data_hash, calculate_data_hashes, xxhash
+
+API_TYPES = ["greentour", "barrier_free", "base_tour"]
+
+
+def get_schemes():
+    """측정 가능한 해시 방식 (xxhash 미설치 시 xxh3 제외)"""
+    return [scheme for scheme in HASH_PREFIXES if scheme != "xxh3" or xxhash is not None]
+
+
+def time_call(func, repeat):
+    """repeat번 실행하여 가장 빠른 시간 반환"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="data_hash 계산 벤치마크")
+    parser.add_argument("--count", type=int, default=20000, help="API별 item 수")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2, help="배치 계산 프로세스 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    schemes = get_schemes()
+    if xxhash is None:
+        print("(xxhash 미설치: xxh3 제외)")
+
+    print(f"\n=== 해시 방식별 단일 계산 ({args.count}개, 최솟값/{args.repeat}회) ===")
+    print(f"{'API':<14}{'scheme':<10}{'seconds':>10}{'items/s':>14}")
+    for api_type in API_TYPES:
+        items = make_items(api_type, args.count)
+        for scheme in schemes:
+            seconds = time_call(lambda: [calculate_data_hash(item, scheme) for item in items], args.repeat)
+            print(f"{api_type:<14}{scheme:<10}{seconds:>10.3f}{args.count / seconds:>14,.0f}")
+
+    print(f"\n=== 배치 계산 (세 API 합계 {args.count * len(API_TYPES)}개, 프로세스 {args.workers}개 / CPU {os.cpu_count()}개) ===")
+    print(f"{'scheme':<10}{'serial':>10}{'parallel':>10}{'speedup':>10}")
+    items = [item for api_type in API_TYPES for item in make_items(api_type, args.count)]
+    for scheme in schemes:
+        serial = time_call(lambda: calculate_data_hashes(items, scheme, workers=1), args.repeat)
+        parallel = time_call(lambda: calculate_data_hashes(items, scheme, workers=args.workers), args.repeat)
+        print(f"{scheme:<10}{serial:>10.3f}{parallel:>10.3f}{serial / parallel:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
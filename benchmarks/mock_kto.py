@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# 벤치마크용 관광 API(data.go.kr) 모의 서버
+#
+# 세 서비스(GreenTourService1, KorWithService2, LocgoHubTarService1)를 실제와 같은 경로와
+# response.body.items.item 응답 구조로 제공한다.
+# - 목록 엔드포인트(areaBasedList*, areaBasedSyncList*)는 fixtures의 합성 item을 numOfRows/pageNo로 페이징
+# - 기초지자체 API는 signguCd별로 나누어 페이징 (BaseTourAPI의 시군구 단위 수집과 동일)
+# - 생태/무장애 목록은 areaCode로 거름 (합성 item은 모두 경상북도 35)
+# - modifiedtime은 실제 API처럼 수정 시각의 앞자리(YYYY, YYYYMM, YYYYMMDD)가 같은 item만 반환
+# - 지역코드조회는 17개 시도 코드, 법정동코드조회(lDongListYn=Y)는 시도별 시군구 목록, 그 외 코드 조회는 작은 코드 목록 반환
+# - 요청마다 지연(--latency-ms), 일정 비율의 오류(--error-rate: HTTP 503 또는 XML 오류 본문),
+#   페이지 크기 상한(--max-rows, 넘으면 잘린 응답) 설정 가능
+#
+# 사용법:
+#   python3 benchmarks/mock_kto.py --port 8765 --items 20000 --latency-ms 30
+#   TOUR_API_BASE_URL=http://127.0.0.1:8765 python3 main.py 2 5 F T
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import SIGNGU_CODES, make_items
+
+# 서비스 경로 → API 타입
+SERVICES = {
+    "GreenTourService1": "greentour",
+    "KorWithService2": "barrier_free",
+    "LocgoHubTarService1": "base_tour"
+}
+
+# 목록 엔드포인트 (합성 item 제공)
+LIST_ENDPOINTS = {"areaBasedList1", "areaBasedList2", "areaBasedSyncList1", "areaBasedSyncList2"}
+
+# 변경 시 수정하는 API별 필드
+TITLE_FIELDS = {"greentour": "title", "barrier_free": "title", "base_tour": "hubTatsNm"}
+
+# 지역코드조회(areaCode1/areaCode2) 응답의 관광 지역코드
+AREA_CODES = ["1", "2", "3", "4", "5", "6", "7", "8", "31", "32", "33", "34", "35", "36", "37", "38", "39"]
+
+# 법정동코드조회(ldongCode2) 응답의 시도별 시군구 코드 (합성 item은 경상북도(47)에만 있음)
+LDONG_SIGNGU_CODES = {
+    "11": ["11110", "11140"],
+    "26": ["26110"],
+    "47": SIGNGU_CODES
+}
+
+
+class MockTourDataset:
+    """API별 합성 item (처음 요청될 때 생성)"""
+
+    def __init__(self, items_per_api, seed=42):
+        self.items_per_api = items_per_api
+        self.seed = seed
+        self.lock = threading.Lock()
+        self.items = {}
+        self.by_signgu = {}
+
+    def get_items(self, api_type):
+        with self.lock:
+            if api_type not in self.items:
+                items = make_items(api_type, self.items_per_api, self.seed)
+                self.items[api_type] = items
+                if api_type == "base_tour":
+                    self.by_signgu = {code: [] for code in SIGNGU_CODES}
+                    for item in items:
+                        self.by_signgu[item["signguCd"]].append(item)
+            return self.items[api_type]
+
+    def select(self, api_type, params):
+        """요청 파라미터에 해당하는 item 목록 (기초지자체 API는 signguCd, 그 외는 areaCode/modifiedtime 기준)"""
+        items = self.get_items(api_type)
+        if api_type == "base_tour" and params.get("signguCd"):
+            return self.by_signgu.get(params["signguCd"], [])
+        if api_type != "base_tour" and params.get("areaCode"):
+            # 합성 item은 모두 areacode 35
+            items = items if params["areaCode"] == "35" else []
+        if api_type != "base_tour" and params.get("modifiedtime"):
+            # 날짜 앞자리 일치 (이후 변경분이 아님)
+            prefix = params["modifiedtime"]
+            items = [item for item in items if str(item.get("modifiedtime") or "").startswith(prefix)]
+        return items
+
+    @staticmethod
+    def code_items(endpoint, params):
+        """코드 조회 엔드포인트 item 목록"""
+        if endpoint == "ldongCode2" and params.get("lDongListYn") == "Y":
+            pairs = [(area_code, code) for area_code, codes in LDONG_SIGNGU_CODES.items() for code in codes]
+            return [
+                {"lDongRegnCd": area_code, "lDongRegnNm": f"시도 {area_code}",
+                 "lDongSignguCd": code[2:], "lDongSignguNm": f"시군구 {code}", "rnum": index}
+                for index, (area_code, code) in enumerate(pairs, 1)
+            ]
+        if endpoint.startswith("areaCode") and not params.get("areaCode"):
+            return [{"code": code, "name": f"지역 {code}", "rnum": index} for index, code in enumerate(AREA_CODES, 1)]
+        return [{"code": str(code), "name": f"코드 {code}", "rnum": code} for code in range(1, 18)]
+
+    def mutate(self, fraction, generation=1):
+        """
+        API별 item 중 fraction 비율의 제목과 수정 시각 변경 (변경분 동기화 측정용)
+
+        Returns:
+            int: 변경한 item 수 (세 API 합계)
+        """
+        rng = random.Random(self.seed + generation)
+        changed = 0
+        for api_type, field in TITLE_FIELDS.items():
+            items = self.get_items(api_type)
+            count = int(len(items) * fraction)
+            with self.lock:
+                for item in rng.sample(items, count):
+                    item[field] = f"{item[field]} (변경 {generation})"
+                    if "modifiedtime" in item:
+                        item["modifiedtime"] = time.strftime("%Y%m%d%H%M%S")
+            changed += count
+        return changed
+
+
+class MockTourApiServer:
+    """관광 API 모의 서버 (백그라운드 스레드에서 실행)"""
+
+    def __init__(self, host="127.0.0.1", port=0, items=10000, latency_ms=0, error_rate=0.0, max_rows=1000, seed=42):
+        self.dataset = MockTourDataset(items, seed)
+        self.latency = latency_ms / 1000
+        self.error_rate = error_rate
+        self.max_rows = max_rows
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "errors": 0, "bytes_out": 0}
+        self.httpd = ThreadingHTTPServer((host, port), self.make_handler())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        """TOUR_API_BASE_URL로 사용할 주소"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def incr(self, name, amount=1):
+        with self.lock:
+            self.stats[name] += amount
+
+    def should_fail(self):
+        with self.lock:
+            return self.error_rate > 0 and self.rng.random() < self.error_rate
+
+    def build_response(self, path, params):
+        """요청 경로/파라미터에 대한 (HTTP 상태, 본문)"""
+        parts = path.strip("/").split("/")
+        if len(parts) != 2 or parts[0] not in SERVICES:
+            return 404, b"Not Found"
+        api_type, endpoint = SERVICES[parts[0]], parts[1]
+
+        if self.should_fail():
+            self.incr("errors")
+            if self.rng.random() < 0.5:
+                return 503, b"Service Unavailable"
+            # data.go.kr은 오류 시 _type=json 요청에도 XML 본문을 반환
+            return 200, (
+                "<OpenAPI_ServiceResponse><cmmMsgHeader><errMsg>SERVICE ERROR</errMsg>"
+                "<returnReasonCode>99</returnReasonCode></cmmMsgHeader></OpenAPI_ServiceResponse>"
+            ).encode()
+
+        num_of_rows = int(params.get("numOfRows") or 10)
+        page_no = int(params.get("pageNo") or 1)
+
+        if endpoint in LIST_ENDPOINTS:
+            items = self.dataset.select(api_type, params)
+        else:
+            items = self.dataset.code_items(endpoint, params)
+
+        start = (page_no - 1) * num_of_rows
+        page_items = items[start:start + min(num_of_rows, self.max_rows)]
+        if api_type == "base_tour" and params.get("baseYm"):
+            # 기준 연월별 순위는 같은 합성 item을 요청한 baseYm으로 바꾸어 제공
+            page_items = [dict(item, baseYm=params["baseYm"]) for item in page_items]
+        body = {
+            "response": {
+                "header": {"resultCode": "0000", "resultMsg": "OK"},
+                "body": {
+                    "items": {"item": page_items} if page_items else "",
+                    "numOfRows": num_of_rows,
+                    "pageNo": page_no,
+                    "totalCount": len(items)
+                }
+            }
+        }
+        return 200, json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+    def make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.incr("requests")
+                if server.latency:
+                    time.sleep(server.latency)
+                url = urlparse(self.path)
+                status, body = server.build_response(url.path, dict(parse_qsl(url.query)))
+                server.incr("bytes_out", len(body))
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json;charset=UTF-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="관광 API 모의 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--items", type=int, default=10000, help="API별 item 수 (최대 100000 권장)")
+    parser.add_argument("--latency-ms", type=float, default=0, help="요청별 지연 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 (0~1)")
+    parser.add_argument("--max-rows", type=int, default=1000, help="페이지당 최대 item 수 (넘으면 잘린 응답)")
+    args = parser.parse_args()
+
+    server = MockTourApiServer(args.host, args.port, args.items, args.latency_ms, args.error_rate, args.max_rows)
+    print(f"관광 API 모의 서버: {server.base_url} (API별 {args.items}개)")
+    print(f"TOUR_API_BASE_URL={server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# 벤치마크용 PostgREST(Supabase REST) 모의 서버
+#
+# 이 프로젝트가 사용하는 범위만 메모리 테이블로 구현한다.
+# - GET: 필터(eq/gt/gte/lt/lte/is/in, not.), select, order, offset/limit, Prefer: count=exact
+# - POST: 삽입, Prefer: resolution=merge-duplicates + on_conflict 업서트, return=minimal/representation
+# - Content-Encoding이 있는 요청 본문은 실제 PostgREST처럼 받지 않음 (HTTP 415, --accept-gzip이면 gzip 해제)
+# - PATCH/DELETE: 필터에 맞는 행 수정/삭제
+# 신규 행에는 id(테이블별 순번)와 created_at/updated_at을 채운다.
+# *_at 컬럼 값 "now"는 PostgreSQL처럼 서버 시각으로 바꾼다.
+# 한 요청 안에 같은 충돌 키가 두 번 나오면 PostgreSQL처럼 오류를 반환한다.
+#
+# 사용법:
+#   python3 benchmarks/mock_postgrest.py --port 8766
+#   SUPABASE_BASE_URL=http://127.0.0.1:8766 SUPABASE_API_KEY=dummy python3 main.py 2 5 F T
+
+import argparse
+import gzip
+import json
+import re
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+# 필터가 아닌 쿼리 파라미터
+RESERVED_PARAMS = {"select", "order", "offset", "limit", "on_conflict", "columns"}
+
+
+def resolve_now(item, now):
+    """*_at 컬럼의 "now" 입력값을 서버 시각으로 변환 (PostgreSQL timestamp 특수 입력값)"""
+    return {
+        column: now if column.endswith("_at") and value == "now" else value
+        for column, value in item.items()
+    }
+
+
+def match_filter(row, column, expression):
+    """PostgREST 필터 식(예: eq.1, not.is.null, in.(a,b)) 평가"""
+    negate = expression.startswith("not.")
+    if negate:
+        expression = expression[4:]
+    operator, _, value = expression.partition(".")
+    current = row.get(column)
+
+    if operator == "is":
+        result = current is None if value == "null" else str(current).lower() == value
+    elif operator == "in":
+        result = str(current) in [part.strip().strip('"') for part in value.strip("()").split(",")]
+    elif current is None:
+        result = False
+    elif operator == "eq":
+        result = str(current) == value
+    elif operator == "neq":
+        result = str(current) != value
+    elif operator == "gt":
+        result = str(current) > value
+    elif operator == "gte":
+        result = str(current) >= value
+    elif operator == "lt":
+        result = str(current) < value
+    elif operator == "lte":
+        result = str(current) <= value
+    else:
+        result = True
+    return not result if negate else result
+
+
+class MockPostgrestServer:
+    """PostgREST 모의 서버 (백그라운드 스레드에서 실행)"""
+
+    def __init__(self, host="127.0.0.1", port=0, accept_gzip=False):
+        self.lock = threading.Lock()
+        # gzip 요청 본문 허용 여부 (압축을 풀어 주는 프록시 뒤의 PostgREST 흉내)
+        self.accept_gzip = accept_gzip
+        self.tables = {}
+        self.sequences = {}
+        # (테이블, 충돌 컬럼) → {충돌 키: 행}
+        self.indexes = {}
+        self.stats = {"requests": 0, "bytes_in": 0, "bytes_out": 0}
+        self.httpd = ThreadingHTTPServer((host, port), self.make_handler())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        """SUPABASE_BASE_URL로 사용할 주소"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def incr(self, name, amount=1):
+        with self.lock:
+            self.stats[name] += amount
+
+    def row_count(self, table):
+        with self.lock:
+            return len(self.tables.get(table, []))
+
+    def reset(self):
+        """모든 테이블 삭제"""
+        with self.lock:
+            self.tables.clear()
+            self.sequences.clear()
+            self.indexes.clear()
+
+    def filter_rows(self, table, params):
+        rows = self.tables.get(table, [])
+        for column, expression in params:
+            if column not in RESERVED_PARAMS:
+                rows = [row for row in rows if match_filter(row, column, expression)]
+        return rows
+
+    def get_index(self, table, columns):
+        """충돌 키 인덱스 (처음 사용할 때 구성)"""
+        index_key = (table, columns)
+        if index_key not in self.indexes:
+            self.indexes[index_key] = {
+                tuple(str(row.get(column)) for column in columns): row for row in self.tables.get(table, [])
+            }
+        return self.indexes[index_key]
+
+    def handle_get(self, table, params, prefer):
+        query = dict(params)
+        with self.lock:
+            rows = self.filter_rows(table, params)
+            if "order" in query:
+                column, _, direction = query["order"].partition(".")
+                # 행은 id 순서로 저장되므로 id 오름차순은 정렬 생략
+                if column != "id" or direction == "desc":
+                    rows = sorted(
+                        rows, key=lambda row: (row.get(column) is None, str(row.get(column))),
+                        reverse=direction.startswith("desc")
+                    )
+            total = len(rows)
+            offset = int(query.get("offset", 0))
+            limit = int(query["limit"]) if "limit" in query else None
+            rows = rows[offset:offset + limit] if limit is not None else rows[offset:]
+
+            select = query.get("select", "*")
+            if select != "*":
+                columns = [column.strip() for column in select.split(",")]
+                rows = [{column: row.get(column) for column in columns} for row in rows]
+            else:
+                rows = [dict(row) for row in rows]
+
+        headers = {}
+        if "count=exact" in prefer:
+            headers["Content-Range"] = f"{offset}-{offset + len(rows) - 1}/{total}" if rows else f"*/{total}"
+        return 200, rows, headers
+
+    def handle_post(self, table, params, prefer, body):
+        now = datetime.now().isoformat()
+        items = [resolve_now(item, now) for item in (body if isinstance(body, list) else [body])]
+        conflict = dict(params).get("on_conflict")
+        upsert = "merge-duplicates" in prefer and conflict
+        written = []
+
+        with self.lock:
+            rows = self.tables.setdefault(table, [])
+            columns = tuple(conflict.split(",")) if upsert else None
+            if upsert:
+                keys = [tuple(str(item.get(column)) for column in columns) for item in items]
+                if len(set(keys)) != len(keys):
+                    return 500, {
+                        "code": "21000",
+                        "message": "ON CONFLICT DO UPDATE command cannot affect row a second time"
+                    }, {}
+                index = self.get_index(table, columns)
+
+            for item in items:
+                existing = index.get(tuple(str(item.get(column)) for column in columns)) if upsert else None
+                if existing is not None:
+                    existing.update(item)
+                    written.append(existing)
+                    continue
+
+                self.sequences[table] = self.sequences.get(table, 0) + 1
+                row = {"id": self.sequences[table], "created_at": now, "updated_at": now}
+                row.update(item)
+                rows.append(row)
+                written.append(row)
+                for (index_table, index_columns), index in self.indexes.items():
+                    if index_table == table:
+                        index[tuple(str(row.get(column)) for column in index_columns)] = row
+
+            written = [dict(row) for row in written]
+
+        if "return=minimal" in prefer:
+            return 201, None, {}
+        return 201, written, {}
+
+    def handle_patch(self, table, params, body):
+        body = resolve_now(body, datetime.now().isoformat())
+        with self.lock:
+            rows = self.filter_rows(table, params)
+            for row in rows:
+                row.update(body)
+            return 200, [dict(row) for row in rows], {}
+
+    def handle_delete(self, table, params):
+        with self.lock:
+            removed = {id(row) for row in self.filter_rows(table, params)}
+            self.tables[table] = [row for row in self.tables.get(table, []) if id(row) not in removed]
+            self.indexes = {key: index for key, index in self.indexes.items() if key[0] != table}
+        return 204, None, {}
+
+    def make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def parse_request_target(self):
+                url = urlparse(self.path)
+                match = re.match(r"/rest/v1/(\w+)", url.path)
+                return (match.group(1) if match else None), parse_qsl(url.query, keep_blank_values=True)
+
+            def read_body(self):
+                raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                server.incr("bytes_in", len(raw))
+                if self.headers.get("Content-Encoding") == "gzip" and server.accept_gzip:
+                    raw = gzip.decompress(raw)
+                return json.loads(raw) if raw else None
+
+            def unsupported_encoding(self):
+                """받을 수 없는 Content-Encoding이면 True (본문은 읽어서 버림)"""
+                encoding = (self.headers.get("Content-Encoding") or "identity").lower()
+                if encoding == "identity" or (encoding == "gzip" and server.accept_gzip):
+                    return False
+                server.incr("bytes_in", len(self.rfile.read(int(self.headers.get("Content-Length", 0)))))
+                return True
+
+            def respond(self, status, body, headers):
+                data = json.dumps(body, ensure_ascii=False).encode("utf-8") if body is not None else b""
+                server.incr("bytes_out", len(data))
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def dispatch(self, method):
+                server.incr("requests")
+                table, params = self.parse_request_target()
+                if table is None:
+                    return self.respond(404, {"message": "not found"}, {})
+                prefer = self.headers.get("Prefer") or ""
+                if method in ("POST", "PATCH") and self.unsupported_encoding():
+                    return self.respond(415, {
+                        "code": "PGRST107",
+                        "message": f"Content-Encoding {self.headers.get('Content-Encoding')} is not supported"
+                    }, {})
+
+                if method == "GET":
+                    result = server.handle_get(table, params, prefer)
+                elif method == "POST":
+                    result = server.handle_post(table, params, prefer, self.read_body())
+                elif method == "PATCH":
+                    result = server.handle_patch(table, params, self.read_body())
+                else:
+                    result = server.handle_delete(table, params)
+                self.respond(*result)
+
+            def do_GET(self):
+                self.dispatch("GET")
+
+            def do_POST(self):
+                self.dispatch("POST")
+
+            def do_PATCH(self):
+                self.dispatch("PATCH")
+
+            def do_DELETE(self):
+                self.dispatch("DELETE")
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PostgREST 모의 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--accept-gzip", action="store_true", help="gzip 요청 본문 허용 (기본: HTTP 415)")
+    args = parser.parse_args()
+
+    server = MockPostgrestServer(args.host, args.port, args.accept_gzip)
+    print(f"PostgREST 모의 서버: {server.base_url}")
+    print(f"SUPABASE_BASE_URL={server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# numOfRows 페이지 크기별 수집 시간/요청 수/수신 바이트 비교
+#
+# 사용법:
+#   python3 benchmarks/page_size_bench.py                       # 세 API 모두, 기본 크기 목록
+#   python3 benchmarks/page_size_bench.py --apis greentour --sizes 100,500,1000
+#
+# 실제 data.go.kr API를 호출하므로 .env에 DATA_KEY_DECODING이 필요하며 일일 호출량을 소모한다.
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.greentour import GreenTourAPI
+from api.barrier_free import BarrierFreeAPI
+from api.base_tour import BaseTourAPI
+from settings.config import fetch_all_pages
+from settings.transport import get_transport
+
+# API별 벤치마크 대상 (API 인스턴스, 엔드포인트 ID, 추가 파라미터)
+BENCH_TARGETS = {
+    "greentour": (GreenTourAPI, "2", {}),
+    "barrier_free": (BarrierFreeAPI, "5", {}),
+    # 기초지자체 API는 시군구 단위로 페이징하므로 대표 시군구 하나로 측정
+    "base_tour": (BaseTourAPI, "1", {"signguCd": "47111"})
+}
+
+
+def build_params(api, endpoint_id, extra_params):
+    """API 인스턴스에서 요청 파라미터 구성"""
+    if hasattr(api, "build_params"):
+        params = api.build_params(endpoint_id)
+    else:
+        params = api.get_common_params()
+    params.update(extra_params)
+    return params
+
+
+def run_once(api, endpoint_path, params, page_size):
+    """지정한 페이지 크기로 한 번 수집하고 측정값 반환"""
+    before = get_transport().stats.summary()
+    start = time.perf_counter()
+    items, error = fetch_all_pages(api.base_url, endpoint_path, params, page_size=page_size)
+    elapsed = time.perf_counter() - start
+    after = get_transport().stats.summary()
+
+    return {
+        "items": len(items),
+        "error": error,
+        "seconds": elapsed,
+        "requests": after["requests"] - before["requests"],
+        "bytes": after["bytes_in"] - before["bytes_in"]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="numOfRows 페이지 크기 벤치마크")
+    parser.add_argument("--apis", default=",".join(BENCH_TARGETS), help="측정할 API (쉼표 구분)")
+    parser.add_argument("--sizes", default="50,100,200,500,1000", help="측정할 numOfRows (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=1, help="크기별 반복 횟수")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    rows = []
+
+    for api_type in args.apis.split(","):
+        api_class, endpoint_id, extra_params = BENCH_TARGETS[api_type]
+        api = api_class()
+        _, endpoint_path = api.get_endpoints()[endpoint_id]
+        params = build_params(api, endpoint_id, extra_params)
+
+        for size in sizes:
+            for _ in range(args.repeat):
+                result = run_once(api, endpoint_path, params, size)
+                rows.append((api_type, size, result))
+
+    print("\n=== 페이지 크기 벤치마크 결과 ===")
+    print(f"{'API':<14}{'numOfRows':>10}{'items':>8}{'requests':>10}{'seconds':>10}{'bytes':>12}  error")
+    for api_type, size, result in rows:
+        print(
+            f"{api_type:<14}{size:>10}{result['items']:>8}{result['requests']:>10}"
+            f"{result['seconds']:>10.2f}{result['bytes']:>12,}  {result['error'] or ''}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# areaBasedList 매핑 결과 표현 방식별 메모리/전송량 비교 (DB 호출 없음)
+#
+# 메모리: 합성 item을 매핑하여 전부 보관했을 때의 RSS 증가량과 프로세스 최대 RSS
+#   dict    기존 방식 - 행마다 컬럼 + data_hash + raw_data dict (AreaBasedRecord.to_row() 결과를 보관)
+#   record  AreaBasedRecord (__slots__, 업서트 배치 단위로만 dict 변환)
+# 전송량: SYNC_UPSERT_BATCH_SIZE 배치로 나눈 업서트 요청 본문(JSON) 크기 합계
+#   full    raw_data에 원본 item 전체 (AREABASED_RAW_DATA=full)
+#   extra   raw_data에 컬럼으로 옮기지 않은 필드만 (AREABASED_RAW_DATA=extra)
+#
+# 최대 RSS는 프로세스 단위로만 알 수 있으므로 방식마다 새 프로세스에서 측정한다.
+# (item 생성/해시 계산 중의 일시적 할당이 최대값을 정할 수 있어, 매핑 전후의 현재 RSS 차이도 함께 출력)
+# 수집/DB 반영까지 포함한 비교는 e2e_bench.py --modes sync를 AREABASED_RAW_DATA별로 실행한다.
+#
+# 사용법:
+#   python3 benchmarks/record_bench.py --count 100000
+#   python3 benchmarks/record_bench.py --count 20000 --apis barrier_free
+
+import argparse
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.fixtures import make_items
+
+VARIANTS = ["dict", "record"]
+
+
+def max_rss_mb():
+    """현재 프로세스의 최대 RSS (MB, Linux의 ru_maxrss는 KB 단위)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def current_rss_mb():
+    """현재 RSS (MB, /proc이 없으면 최대 RSS로 대신함)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize() / (1024 * 1024)
+    except OSError:
+        return max_rss_mb()
+
+
+def run_variant(api_type, count, variant):
+    """
+    자식 프로세스: item 생성/해시 후 매핑 결과를 모두 보관
+
+    Returns:
+        dict: retained (매핑 결과로 늘어난 RSS, MB), peak (프로세스 최대 RSS, MB)
+    """
+    from sync.areabased_mapper import AreaBasedMapper
+    from sync.hash_utils import calculate_data_hashes
+
+    items = make_items(api_type, count)
+    hashes = calculate_data_hashes(items, workers=1)
+    gc.collect()
+    baseline = current_rss_mb()
+
+    rows = []
+    for item, data_hash in zip(items, hashes):
+        record = AreaBasedMapper.map_item_data(api_type, item, data_hash)
+        rows.append(record.to_row("full") if variant == "dict" else record)
+    return {"retained": current_rss_mb() - baseline, "peak": max_rss_mb()}
+
+
+def payload_bytes(api_type, count, raw_data_mode, batch_size):
+    """업서트 배치 요청 본문 크기 합계 (bytes)"""
+    from sync.areabased_mapper import AreaBasedMapper
+
+    records = [AreaBasedMapper.map_item_data(api_type, item) for item in make_items(api_type, count)]
+    total = 0
+    for i in range(0, len(records), batch_size):
+        batch = [record.to_row(raw_data_mode) for record in records[i:i + batch_size]]
+        total += len(json.dumps(batch, ensure_ascii=False).encode("utf-8"))
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="매핑 결과 표현 방식별 메모리/전송량 비교")
+    parser.add_argument("--count", type=int, default=100000, help="API 타입별 item 수")
+    parser.add_argument("--apis", default="greentour,barrier_free,base_tour", help="API 타입 (쉼표 구분)")
+    parser.add_argument("--variant", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        print(json.dumps(run_variant(args.apis, args.count, args.variant)))
+        return
+
+    from settings.config import SYNC_UPSERT_BATCH_SIZE
+
+    print(f"{'API':<14}{'items':>8}{'dict MB(+/peak)':>18}{'record MB(+/peak)':>20}{'full bytes':>14}{'extra bytes':>14}")
+    for api_type in args.apis.split(","):
+        rss = {}
+        for variant in VARIANTS:
+            completed = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--variant", variant,
+                 "--apis", api_type, "--count", str(args.count)],
+                cwd=ROOT_DIR, capture_output=True, text=True, check=True
+            )
+            rss[variant] = json.loads(completed.stdout.strip().splitlines()[-1])
+
+        full = payload_bytes(api_type, args.count, "full", SYNC_UPSERT_BATCH_SIZE)
+        extra = payload_bytes(api_type, args.count, "extra", SYNC_UPSERT_BATCH_SIZE)
+        dict_mb = f"{rss['dict']['retained']:.1f}/{rss['dict']['peak']:.1f}"
+        record_mb = f"{rss['record']['retained']:.1f}/{rss['record']['peak']:.1f}"
+        print(f"{api_type:<14}{args.count:>8}{dict_mb:>18}{record_mb:>20}{full:>14,}{extra:>14,}")
+
+
+if __name__ == "__main__":
+    main()
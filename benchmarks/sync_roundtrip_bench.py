@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# save_areabased_to_supabase의 임시 파일 왕복과 메모리 직접 전달 비교
+#
+# 임시 파일 경로: json.dump(indent=2) → 디스크 쓰기 → json.load → extract_items
+# 메모리 경로:   extract_items (sync_items에 바로 전달)
+# DB 반영 비용은 두 경로가 같으므로 제외하고 그 앞단의 직렬화/IO 비용만 측정한다.
+#
+# 사용법:
+#   python3 benchmarks/sync_roundtrip_bench.py --sizes 1000,10000,100000
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import make_items, wrap_response
+from sync.areabased_sync import AreaBasedSynchronizer
+
+
+def via_temp_file(data, api_type):
+    """기존 방식: 임시 파일에 쓰고 다시 읽어서 item 추출"""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8') as temp_file:
+        json.dump(data, temp_file, indent=2, ensure_ascii=False)
+        temp_file_path = temp_file.name
+    try:
+        size = os.path.getsize(temp_file_path)
+        with open(temp_file_path, 'r', encoding='utf-8') as f:
+            loaded = json.load(f)
+        return AreaBasedSynchronizer.extract_items(loaded, api_type), size
+    finally:
+        os.unlink(temp_file_path)
+
+
+def in_memory(data, api_type):
+    """새 방식: 메모리의 결과에서 바로 item 추출"""
+    return AreaBasedSynchronizer.extract_items(data, api_type), 0
+
+
+def measure(func, data, api_type):
+    start = time.perf_counter()
+    items, size = func(data, api_type)
+    return time.perf_counter() - start, len(items), size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="임시 파일 왕복 vs 메모리 동기화 입력 비교")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="item 수 (쉼표 구분)")
+    parser.add_argument("--apis", default="greentour,barrier_free,base_tour", help="API 타입 (쉼표 구분)")
+    args = parser.parse_args()
+
+    print(f"{'API':<14}{'items':>8}{'temp file(s)':>14}{'memory(s)':>12}{'file bytes':>14}")
+    for api_type in args.apis.split(","):
+        for count in [int(size) for size in args.sizes.split(",")]:
+            data = wrap_response(api_type, make_items(api_type, count))
+            file_seconds, file_items, file_size = measure(via_temp_file, data, api_type)
+            memory_seconds, memory_items, _ = measure(in_memory, data, api_type)
+            assert file_items == memory_items == count
+            print(f"{api_type:<14}{count:>8}{file_seconds:>14.3f}{memory_seconds:>12.4f}{file_size:>14,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,21 @@
 import sys
 import json
 import os
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from api.greentour import GreenTourAPI
 from api.barrier_free import BarrierFreeAPI  
 from api.base_tour import BaseTourAPI
+from api.regions import get_area_spec, set_crawl_areas
 from batch.supabase_handler import SupabaseHandler
+from settings.transport import get_transport
+from settings.checkpoint import clear_checkpoints
+from settings.config import JOB_CONCURRENCY, LOCAL_COMPRESSION, LOCAL_FORMAT, PageFetchError
+from settings.metrics import end_scope, start_scope
+from settings.response_cache import get_response_cache, set_cache_bypass
 
 class TourismCrawler:
     def __init__(self):
@@ -17,6 +26,9 @@ class TourismCrawler:
             "3": ("기초지자체 중심 관광지 정보 API", BaseTourAPI())
         }
         self.supabase = SupabaseHandler()
+        self.api_type_map = {"1": "greentour", "2": "barrier_free", "3": "base_tour"}
+        # CLI 옵션 (--engine=async 등)
+        self.options = {"engine": "sync"}
         
     def show_api_menu(self):
         print("=== 관광 데이터 크롤러 ===\n")
@@ -37,32 +49,87 @@ class TourismCrawler:
         print()
         
     def save_to_local(self, api_key, endpoint_id, api_type, endpoint_path, data):
-        """로컬 data 디렉토리에 JSON 파일 저장"""
+        """로컬 data 디렉토리에 JSON 파일 저장 (--format=ndjson이면 item 한 줄씩 NDJSON으로 저장)"""
+        if self.get_local_format() == "ndjson":
+            return self.save_to_ndjson(api_key, endpoint_id, api_type, endpoint_path, data)
+        
+        filename = self.get_local_path(api_key, endpoint_id, api_type, endpoint_path, "json")
+        
+        try:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            print(f"[로컬 저장 완료] {filename}")
+            return True
+        except Exception as e:
+            print(f"[로컬 저장 실패] {str(e)}")
+            return False
+    
+    def get_local_path(self, api_key, endpoint_id, api_type, endpoint_path, extension):
+        """로컬 저장 파일 경로 (API 번호와 엔드포인트 번호를 포함한 파일명)"""
         if not os.path.exists("data"):
             os.makedirs("data")
             
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         # 엔드포인트 경로에서 '/' 제거하여 파일명으로 사용
         endpoint_name = endpoint_path.lstrip('/')
-        # API 번호와 엔드포인트 번호를 포함한 파일명 생성
-        filename = f"data/{api_key}{api_type}_{endpoint_id}{endpoint_name}_{timestamp}.json"
+        return f"data/{api_key}{api_type}_{endpoint_id}{endpoint_name}_{timestamp}.{extension}"
+    
+    def get_local_format(self):
+        """로컬 저장 형식 (--format, 기본값 LOCAL_FORMAT)"""
+        return str(self.options.get("format", LOCAL_FORMAT)).lower()
+    
+    def get_local_compression(self):
+        """NDJSON 압축 방식 (--compress, 값 없이 주면 gzip)"""
+        compression = self.options.get("compress", LOCAL_COMPRESSION)
+        return "gzip" if compression is True else str(compression).lower()
+    
+    def open_local_writer(self, api_key, endpoint_id, api_type, endpoint_path):
+        """NDJSON 작성기 생성 (매니페스트에 요청 파라미터와 수집 옵션 기록)"""
+        from batch.ndjson_writer import NdjsonWriter
+        
+        api_instance = self.apis[api_key][1]
+        build_params = getattr(api_instance, "build_params", None)
+        params = build_params(endpoint_id) if build_params else api_instance.get_common_params()
+        metadata = {
+            "api_key": api_key,
+            "api_type": api_type,
+            "endpoint": endpoint_path,
+            "params": {key: value for key, value in params.items() if key not in ("serviceKey", "pageNo")},
+            "areas": get_area_spec() or "default",
+            "options": {key: self.options[key] for key in ("months", "incremental", "full", "stream") if key in self.options}
+        }
+        path = self.get_local_path(api_key, endpoint_id, api_type, endpoint_path, "ndjson")
+        return NdjsonWriter(path, self.get_local_compression(), metadata)
+    
+    def save_to_ndjson(self, api_key, endpoint_id, api_type, endpoint_path, data):
+        """API 결과의 item을 NDJSON 파일로 저장 (item 외의 응답 정보는 매니페스트에 기록)"""
+        from sync.areabased_sync import AreaBasedSynchronizer
         
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            print(f"[로컬 저장 완료] {filename}")
+            with self.open_local_writer(api_key, endpoint_id, api_type, endpoint_path) as writer:
+                writer.write_items(AreaBasedSynchronizer.extract_items(data, api_type))
+                # totalCount, areaCd, failures 등
+                writer.metadata.update({key: value for key, value in data.items() if key not in ("items", "response")})
+                body = data.get("response", {}).get("body", {})
+                if "totalCount" in body:
+                    writer.metadata["totalCount"] = body["totalCount"]
+            print(f"[로컬 저장 완료] {writer.path} ({writer.items}개 item)")
             return True
         except Exception as e:
             print(f"[로컬 저장 실패] {str(e)}")
             return False
             
-    def save_to_supabase(self, api_key, endpoint_id, api_type, endpoint_path, data):
-        """Supabase DB에 데이터 저장 - areaBasedList 전용 처리 추가"""
+    def save_to_supabase(self, api_key, endpoint_id, api_type, endpoint_path, data, failed_items=None):
+        """
+        Supabase DB에 데이터 저장 - areaBasedList 전용 처리 추가
+        
+        failed_items 리스트를 넘기면 areaBasedList 동기화에서 반영하지 못한 item을 담아 돌려준다.
+        """
         endpoint_name = endpoint_path.lstrip('/')
         
         # areaBasedList 엔드포인트인지 확인
         if "areaBasedList" in endpoint_name:
-            return self.save_areabased_to_supabase(api_key, endpoint_id, api_type, data)
+            return self.save_areabased_to_supabase(api_key, endpoint_id, api_type, data, failed_items)
         else:
             # 기존 방식 (일반 테이블)
             table_identifier = f"{api_key}{api_type}_{endpoint_id}{endpoint_name}"
@@ -76,8 +143,8 @@ class TourismCrawler:
             print(f"[DB 저장] {message}")
             return success
     
-    def save_areabased_to_supabase(self, api_key, endpoint_id, api_type, data):
-        """areaBasedList 데이터를 전용 테이블에 저장"""
+    def save_areabased_to_supabase(self, api_key, endpoint_id, api_type, data, failed_items=None):
+        """areaBasedList 데이터를 전용 테이블에 저장 (반영하지 못한 item은 failed_items에 추가)"""
         try:
             from sync.areabased_sync import AreaBasedSynchronizer
             
@@ -92,34 +159,21 @@ class TourismCrawler:
             
             actual_api_type = api_type_mapping.get(api_key, api_type)
             
-            # 임시 파일 생성하여 동기화 로직 재사용
-            import tempfile
-            import json
-            
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8') as temp_file:
-                json.dump(data, temp_file, indent=2, ensure_ascii=False)
-                temp_file_path = temp_file.name
+            # 파일을 거치지 않고 메모리의 데이터를 바로 동기화
+            synchronizer = AreaBasedSynchronizer()
+            items = synchronizer.extract_items(data, actual_api_type)
+            # 일부 지역 단위 수집 실패는 동기화 로그에 부분 완료(PARTIAL)로 기록
+            success = synchronizer.sync_items(items, actual_api_type, data.get("failures"))
+            if failed_items is not None:
+                failed_items.extend(synchronizer.failed_items)
             
-            try:
-                # AreaBasedSynchronizer를 사용하여 DB 저장
-                synchronizer = AreaBasedSynchronizer()
-                success = synchronizer.sync_from_file(temp_file_path, actual_api_type)
+            if success:
+                print(f"[areaBasedList DB 저장 완료] {actual_api_type}")
+                return True
+            else:
+                print(f"[areaBasedList DB 저장 실패] {actual_api_type}")
+                return False
                 
-                if success:
-                    print(f"[areaBasedList DB 저장 완료] {actual_api_type}")
-                    return True
-                else:
-                    print(f"[areaBasedList DB 저장 실패] {actual_api_type}")
-                    return False
-                    
-            finally:
-                # 임시 파일 정리
-                import os
-                try:
-                    os.unlink(temp_file_path)
-                except:
-                    pass
-                    
         except Exception as e:
             print(f"[areaBasedList DB 저장 실패] {str(e)}")
             return False
@@ -146,9 +200,49 @@ class TourismCrawler:
         print(f"\n[설정] 로컬 저장: {'T' if save_local else 'F'}, DB 저장: {'T' if save_db else 'F'}")
         
         self.execute_crawling(api_key, endpoint_id, save_local, save_db)
+        self.print_run_stats()
+        
+    def parse_options(self, args):
+        """CLI 인자에서 --이름=값 형태의 옵션을 분리하고 나머지 위치 인자 반환"""
+        positional = []
+        for arg in args:
+            if arg.startswith("--"):
+                name, _, value = arg[2:].partition("=")
+                self.options[name.replace("-", "_")] = value if value else True
+            else:
+                positional.append(arg)
+        return positional
         
     def run_cli(self, args):
         """CLI 모드 실행 - 부분 입력 지원"""
+        args = self.parse_options(args)
+        
+        if self.options["engine"] not in ("sync", "async"):
+            print(f"잘못된 엔진: {self.options['engine']} (sync 또는 async)")
+            return False
+        
+        # --format=ndjson: item 한 줄씩 로컬 저장 (--compress=gzip|zstd|none으로 압축 방식 지정)
+        if self.get_local_format() not in ("json", "ndjson"):
+            print(f"잘못된 저장 형식: {self.get_local_format()} (json 또는 ndjson)")
+            return False
+        
+        # --no-cache: 참조 코드 응답 캐시를 읽지 않고 API 직접 호출
+        if self.options.get("no_cache"):
+            set_cache_bypass()
+        
+        # --areas: 수집 지역 (all: 전국 지역 탐색, 쉼표로 구분한 지역 코드: 해당 지역만)
+        if self.options.get("areas"):
+            set_crawl_areas(self.options["areas"])
+        
+        # --jobs: 여러 (API, 엔드포인트, 저장 옵션) 작업을 한 프로세스에서 동시에 실행
+        if self.options.get("jobs"):
+            jobs = self.parse_jobs(self.options["jobs"])
+            return self.run_jobs(jobs) if jobs else False
+        
+        # --backfill: 저장된 스냅샷 파일(data/*.json)을 API 호출 없이 DB에 일괄 적재
+        if self.options.get("backfill"):
+            return self.run_backfill(args)
+        
         # API 선택
         if len(args) >= 1:
             api_key = args[0]
@@ -158,7 +252,7 @@ class TourismCrawler:
         
         if api_key not in self.apis:
             print(f"잘못된 API 번호: {api_key}")
-            return
+            return False
         
         # 엔드포인트 선택
         if len(args) >= 2:
@@ -185,49 +279,417 @@ class TourismCrawler:
         if len(args) < 4:
             print(f"\n[설정] 로컬 저장: {'T' if save_local else 'F'}, DB 저장: {'T' if save_db else 'F'}")
         
-        self.execute_crawling(api_key, endpoint_id, save_local, save_db)
+        success = self.execute_crawling(api_key, endpoint_id, save_local, save_db)
+        self.print_run_stats()
+        return success
         
     def execute_crawling(self, api_key, endpoint_id, save_local, save_db):
-        """크롤링 실행"""
+        """
+        크롤링 실행 후 실행 계측 요약 출력
+        
+        단계별 소요 시간, API/DB 요청 수와 송수신 바이트, 최대 메모리를 계측하며
+        같은 값이 동기화 로그(sync_logs.metrics)에도 기록된다.
+        
+        Returns:
+            bool: API 호출과 요청한 저장이 모두 성공했는지 여부
+        """
+        scope = start_scope(f"{api_key} {endpoint_id}")
+        try:
+            return self.crawl_endpoint(api_key, endpoint_id, save_local, save_db)
+        finally:
+            end_scope()
+            scope.print_summary()
+            
+    def crawl_endpoint(self, api_key, endpoint_id, save_local, save_db):
+        """execute_crawling 본체 (API 호출 → 로컬/DB 저장)"""
         if api_key not in self.apis:
             print(f"잘못된 API 번호: {api_key}")
-            return
+            return False
             
         desc, api_instance = self.apis[api_key]
         endpoints = api_instance.get_endpoints()
         
         if endpoint_id not in endpoints:
             print(f"잘못된 엔드포인트 번호: {endpoint_id}")
-            return
+            return False
             
         endpoint_desc, endpoint_path = endpoints[endpoint_id]
         print(f"\n[실행] {desc} - {endpoint_desc}({endpoint_path})")
         
-        # API 호출
-        data, error = api_instance.call_api(endpoint_id)
+        # --months: 기초지자체 API를 기준 연월 범위의 (baseYm × 시군구) 셀로 수집 (적재가 끝난 월은 건너뜀)
+        if self.options.get("months") and getattr(api_instance, "supports_months", False):
+            return self.crawl_month_grid(api_key, api_instance, endpoint_id, endpoint_path, save_local, save_db)
+        
+        # --stream: 페이지 수집 → 매핑 → DB 반영을 chunk 단위로 흘려보냄 (전체 결과를 메모리에 모으지 않음)
+        # --format=ndjson이면 같은 페이지를 로컬 파일에도 이어 씀 (DB 저장 없이 로컬 저장만 할 수도 있음)
+        stream_local = save_local and self.get_local_format() == "ndjson"
+        if self.options.get("stream") and (save_db or stream_local) and "areaBasedList" in endpoint_path:
+            return self.crawl_stream(api_key, api_instance, endpoint_id, endpoint_path, save_local, save_db)
+        
+        # API 호출 (--incremental: 동기화 목록 + modifiedtime 워터마크로 변경분만 수집)
+        if self.options.get("incremental") and "areaBasedList" in endpoint_path:
+            data, error = self.crawl_incremental(api_key, api_instance, endpoint_id)
+        else:
+            data, error = self.call_api(api_instance, endpoint_id)
         
         if error:
             print(f"[API 호출 실패] {error}")
-            return
+            return False
             
         print("[API 호출 성공]")
+        self.finish_checkpoints(api_instance, endpoint_id, data)
+        
+        saved = self.save_results(api_key, api_instance, endpoint_id, endpoint_path, data, save_local, save_db)
+        return self.check_unit_failures(data.get("failures")) and saved
+    
+    def check_unit_failures(self, failures):
+        """
+        수집 실패한 지역 단위가 있으면 실행을 실패로 처리 (받은 데이터는 저장된 뒤 호출)
         
-        # 데이터 저장
-        api_type_map = {"1": "greentour", "2": "barrier_free", "3": "base_tour"}
-        api_type = api_type_map[api_key]
+        Returns:
+            bool: 실패한 지역 단위가 없는지 여부
+        """
+        if not failures:
+            return True
+        print(f"[부분 완료] 지역 단위 {len(failures)}개 수집 실패로 실행을 실패 처리합니다: {', '.join(sorted(failures))}")
+        return False
+    
+    def save_results(self, api_key, api_instance, endpoint_id, endpoint_path, data, save_local, save_db, failed_items=None):
+        """API 결과를 로컬/DB에 저장 (DB에 반영하지 못한 item은 failed_items에 추가)"""
+        api_type = self.api_type_map[api_key]
         
+        saved = True
         if save_local:
-            self.save_to_local(api_key, endpoint_id, api_type, endpoint_path, data)
+            saved = self.save_to_local(api_key, endpoint_id, api_type, endpoint_path, data) and saved
             
         if save_db:
-            self.save_to_supabase(api_key, endpoint_id, api_type, endpoint_path, data)
+            saved = self.save_to_supabase(api_key, endpoint_id, api_type, endpoint_path, data, failed_items) and saved
+        
+        return saved
+
+    def crawl_month_grid(self, api_key, api_instance, endpoint_id, endpoint_path, save_local, save_db):
+        """
+        기준 연월 범위 수집 - --months의 각 월 × 시군구 셀을 작업 큐에서 동시에 수집하여 한 번에 저장
+        
+        DB 저장 시 적재가 끝난 월(DB의 월별 행 수/해시가 적재 기록과 같은 월)은 수집하지 않으며,
+        --full이면 모든 월을 다시 수집한다.
+        """
+        from sync.month_grid import MonthGrid, get_item_months, parse_month_range
+        
+        months, error = parse_month_range(self.options["months"])
+        if error:
+            print(f"[월별 수집] {error}")
+            return False
+        if self.options.get("stream"):
+            print("[월별 수집] 월별 수집은 스트리밍 모드를 지원하지 않아 일반 모드로 실행합니다.")
+        
+        units, error = api_instance.get_region_units()
+        if error:
+            print(f"[API 호출 실패] {error}")
+            return False
+        
+        grid = MonthGrid([unit.key for unit in units])
+        pending = months
+        if save_db and not self.options.get("full"):
+            pending, skipped = grid.pending_months(months)
+            if skipped:
+                print(f"[월별 수집] 적재 완료된 {len(skipped)}개월 건너뜀: {', '.join(skipped)}")
+        if not pending:
+            print("[월별 수집] 수집할 월이 없습니다.")
+            return True
+        
+        print(f"[월별 수집] {len(pending)}개월 × 시군구 {len(units)}개 = 셀 {len(pending) * len(units)}개 수집")
+        # 월 목록은 인자로 넘김 (--jobs로 같은 API 인스턴스를 동시에 쓰는 작업과 상태를 공유하지 않음)
+        data, error = self.call_api(api_instance, endpoint_id, months=pending)
+        
+        if error:
+            print(f"[API 호출 실패] {error}")
+            return False
+        
+        print("[API 호출 성공]")
+        self.finish_checkpoints(api_instance, endpoint_id, data)
+        failed_items = []
+        saved = self.save_results(api_key, api_instance, endpoint_id, endpoint_path, data, save_local, save_db, failed_items)
+        
+        # 수집 실패한 셀과 DB 반영 실패한 행이 없는 월만 적재 완료로 기록
+        if saved and save_db:
+            failed_months = {key.split(":", 1)[0] for key in data.get("failures", {})}
+            failed_months.update(get_item_months(failed_items, pending))
+            if failed_items:
+                print(f"[월별 수집] DB 반영 실패 {len(failed_items)}개 행이 있는 월은 적재 완료로 기록하지 않음")
+            recorded = grid.record_loaded([month for month in pending if month not in failed_months])
+            if recorded:
+                print(f"[월별 수집] 적재 완료 기록: {', '.join(recorded)}")
+        
+        return self.check_unit_failures(data.get("failures")) and saved
+
+    def parse_jobs(self, spec):
+        """
+        --jobs 값을 작업 목록으로 변환
+        
+        형식: "API:엔드포인트:로컬저장:DB저장"을 쉼표로 구분 (예: 1:2:F:T,2:5:F:T,3:1:F:T)
+        
+        Returns:
+            list: (api_key, endpoint_id, save_local, save_db) 목록 (형식 오류 시 빈 목록)
+        """
+        jobs = []
+        for job_spec in str(spec).split(","):
+            parts = job_spec.strip().split(":")
+            if len(parts) != 4 or parts[0] not in self.apis:
+                print(f"잘못된 작업 형식: {job_spec} (예: 1:2:F:T)")
+                return []
+            api_key, endpoint_id, save_local, save_db = parts
+            jobs.append((api_key, endpoint_id, save_local.upper() == 'T', save_db.upper() == 'T'))
+        return jobs
+
+    def run_jobs(self, jobs):
+        """
+        여러 작업을 한 프로세스에서 동시에 실행
+        
+        HTTP 커넥션 풀과 Supabase 클라이언트는 작업 간에 공유하고, 한 작업의 실패(예외 포함)는
+        다른 작업에 영향을 주지 않는다. 모든 작업이 끝나면 작업별 결과 요약을 출력한다.
+        
+        Returns:
+            bool: 모든 작업 성공 여부
+        """
+        concurrency = int(self.options.get("job_concurrency") or JOB_CONCURRENCY)
+        print(f"[작업 실행] {len(jobs)}개 작업 (동시 {min(concurrency, len(jobs))}개)")
+        start_time = time.perf_counter()
+        
+        def run_job(job):
+            api_key, endpoint_id, save_local, save_db = job
+            job_start = time.perf_counter()
+            try:
+                success = self.execute_crawling(api_key, endpoint_id, save_local, save_db)
+                error = None
+            except Exception as e:
+                success, error = False, str(e)
+                print(f"[작업 실패] {api_key} {endpoint_id}: {error}")
+            return success, error, time.perf_counter() - job_start
+        
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            results = list(executor.map(run_job, jobs))
+        
+        self.print_run_stats()
+        
+        print("\n=== 작업 요약 ===")
+        for (api_key, endpoint_id, save_local, save_db), (success, error, elapsed) in zip(jobs, results):
+            status = "성공" if success else "실패"
+            flags = f"{'T' if save_local else 'F'} {'T' if save_db else 'F'}"
+            line = f"[{status}] {api_key} {endpoint_id} {flags} ({self.describe_job(api_key, endpoint_id)}) {elapsed:.1f}초"
+            print(f"{line} - {error}" if error else line)
+        
+        success_count = sum(1 for success, _, _ in results if success)
+        print(f"총 {len(jobs)}개 중 성공 {success_count}개, 실패 {len(jobs) - success_count}개, 소요 {time.perf_counter() - start_time:.1f}초")
+        return success_count == len(jobs)
+
+    def run_backfill(self, args):
+        """
+        스냅샷 일괄 적재 실행
+        
+        --backfill=경로(디렉토리 또는 glob 패턴)와 나머지 위치 인자를 모두 입력으로 사용하며,
+        아무것도 없으면 data/ 디렉토리를 읽는다.
+        
+        Returns:
+            bool: 적재 성공 여부
+        """
+        from sync.backfill import backfill
+        
+        value = self.options["backfill"]
+        sources = ([value] if isinstance(value, str) else []) + list(args)
+        workers = self.options.get("backfill_workers")
+        
+        scope = start_scope("backfill")
+        try:
+            return backfill(sources or ["data"], int(workers) if workers else None)
+        finally:
+            end_scope()
+            scope.print_summary()
+
+    def describe_job(self, api_key, endpoint_id):
+        """작업 요약에 표시할 API/엔드포인트 이름"""
+        desc, api_instance = self.apis[api_key]
+        endpoint = api_instance.get_endpoints().get(endpoint_id)
+        return f"{desc} - {endpoint[0]}" if endpoint else desc
+
+    def print_run_stats(self):
+        """HTTP 커넥션 재사용/재시도 통계, 응답 캐시 적중 통계 출력"""
+        get_transport().print_stats()
+        get_response_cache().print_stats()
+
+    def finish_checkpoints(self, api_instance, endpoint_id, data):
+        """
+        수집이 빠짐없이 끝났으면 저장 전에 체크포인트 정리
+        
+        저장이 실패해도 완료된 수집을 재실행에서 다시 읽지 않도록 하고,
+        일부 시군구가 실패한 수집의 체크포인트만 남겨 이어받는다.
+        """
+        if not data.get("failures"):
+            self.clear_checkpoints(api_instance, endpoint_id)
+
+    def clear_checkpoints_when_exhausted(self, pages, api_instance, endpoint_id, failures=None):
+        """
+        페이지 이터레이터를 그대로 내보내고, 끝까지 수집되면 (저장 결과와 무관하게) 체크포인트 정리
+        
+        일부 지역 단위가 실패하면 이터레이터가 PageFetchError를 던지므로 체크포인트를 남겨 다음 실행에서 이어받고,
+        실패한 단위는 failures 딕셔너리에 담는다.
+        """
+        try:
+            yield from pages
+        except PageFetchError as e:
+            if failures is not None and e.failures:
+                failures.update(e.failures)
+            raise
+        self.clear_checkpoints(api_instance, endpoint_id)
+
+    def clear_checkpoints(self, api_instance, endpoint_id):
+        """엔드포인트(및 증분 수집용 동기화 목록 엔드포인트)의 수집 체크포인트 삭제"""
+        endpoints = api_instance.get_endpoints()
+        endpoint_ids = [endpoint_id]
+        get_sync_endpoint_id = getattr(api_instance, "get_sync_endpoint_id", None)
+        if get_sync_endpoint_id and get_sync_endpoint_id(endpoint_id):
+            endpoint_ids.append(get_sync_endpoint_id(endpoint_id))
+        
+        endpoint_paths = [endpoints[eid][1] for eid in endpoint_ids if eid in endpoints]
+        clear_checkpoints(api_instance.base_url, endpoint_paths)
+
+    def crawl_stream(self, api_key, api_instance, endpoint_id, endpoint_path, save_local, save_db):
+        """
+        스트리밍 모드: API 페이지를 받는 즉시 매핑하여 chunk 단위로 DB에 반영
+        
+        --format=ndjson이면 같은 페이지를 로컬 NDJSON 파일에 이어 쓰며,
+        수집이 끝까지 완료된 경우에만 파일과 매니페스트를 남긴다.
+        일부 지역 단위만 실패하면 받은 데이터는 저장하되 실패한 단위를 매니페스트(failures)에 기록하고 실패로 반환한다.
+        """
+        from sync.areabased_sync import AreaBasedSynchronizer
+        
+        if self.options.get("engine") == "async":
+            print("[스트리밍] 스트리밍 모드는 동기 엔진으로 실행됩니다.")
+        
+        api_type = self.api_type_map[api_key]
+        failures = {}
+        pages = self.clear_checkpoints_when_exhausted(api_instance.iter_pages(endpoint_id), api_instance, endpoint_id, failures)
+        
+        writer = None
+        if save_local:
+            if self.get_local_format() == "ndjson":
+                writer = self.open_local_writer(api_key, endpoint_id, api_type, endpoint_path)
+                pages = writer.tee(pages)
+            else:
+                print("[스트리밍] JSON 형식은 스트리밍 저장을 지원하지 않아 로컬 저장을 건너뜁니다. (--format=ndjson 사용)")
+        
+        try:
+            if save_db:
+                # 수집 오류(PageFetchError)는 sync_stream에서 실패 로그로 기록됨
+                success = AreaBasedSynchronizer().sync_stream(pages, api_type)
+                
+                if success:
+                    print(f"[areaBasedList DB 저장 완료] {api_type}")
+                else:
+                    print(f"[areaBasedList DB 저장 실패] {api_type}")
+            else:
+                try:
+                    for _ in pages:
+                        pass
+                    success = True
+                except PageFetchError as e:
+                    print(f"[API 호출 실패] {str(e)}")
+                    success = False
+        except BaseException:
+            if writer:
+                writer.abort()
+            raise
+        
+        if writer:
+            if writer.exhausted and writer.failures:
+                writer.close(failures=writer.failures)
+                print(f"[로컬 저장 부분 완료] {writer.path} ({writer.items}개 item, 실패한 지역 단위 {len(writer.failures)}개는 매니페스트에 기록)")
+            elif writer.exhausted:
+                writer.close()
+                print(f"[로컬 저장 완료] {writer.path} ({writer.items}개 item)")
+            else:
+                writer.abort()
+                print("[로컬 저장 실패] 수집이 중간에 중단되어 파일을 남기지 않았습니다.")
+                success = False
+        return self.check_unit_failures(failures) and success
+        
+    def call_api(self, api_instance, endpoint_id, extra_params=None, months=None):
+        """
+        선택된 엔진(sync/async)으로 API 호출 - 두 엔진 모두 같은 결과 형태 반환
+        
+        months(기준 연월 목록)는 supports_months인 API에만 전달한다.
+        """
+        if self.options.get("engine") == "async":
+            return asyncio.run(self.call_api_async(api_instance, endpoint_id, extra_params, months))
+        if months:
+            return api_instance.call_api(endpoint_id, extra_params, months=months)
+        return api_instance.call_api(endpoint_id, extra_params)
+        
+    async def call_api_async(self, api_instance, endpoint_id, extra_params=None, months=None):
+        """비동기 엔진: 하나의 이벤트 루프와 공유 커넥션 풀로 API 호출"""
+        from settings.async_transport import AsyncTourApiTransport
+        
+        async with AsyncTourApiTransport() as transport:
+            if months:
+                result = await api_instance.call_api_async(endpoint_id, transport, extra_params, months=months)
+            else:
+                result = await api_instance.call_api_async(endpoint_id, transport, extra_params)
+        
+        transport.print_stats()
+        return result
+
+    def crawl_incremental(self, api_key, api_instance, endpoint_id):
+        """
+        증분 수집: DB의 최대 modifiedtime 이후 변경분만 areaBasedSyncList로 조회
+        
+        워터마크가 없거나, --full 옵션이거나, 주기적 재동기화 요일이면 전체 목록을 수집한다.
+        """
+        from batch.supabase_areabased import SupabaseAreaBasedHandler
+        from sync.areabased_mapper import AreaBasedMapper
+        from sync.areabased_sync import AreaBasedSynchronizer
+        from sync.incremental import get_watermark, should_full_reconcile, get_sync_params, filter_changed_items
+        
+        get_sync_endpoint_id = getattr(api_instance, "get_sync_endpoint_id", None)
+        sync_endpoint_id = get_sync_endpoint_id(endpoint_id) if get_sync_endpoint_id else None
+        if not sync_endpoint_id:
+            print("[증분 수집] 동기화 목록 엔드포인트가 없어 전체 수집으로 진행합니다.")
+            return self.call_api(api_instance, endpoint_id)
+        
+        api_type = self.api_type_map[api_key]
+        table_name = AreaBasedMapper.get_table_name(api_type)
+        watermark = get_watermark(SupabaseAreaBasedHandler(), table_name)
+        
+        if should_full_reconcile(watermark, force_full=bool(self.options.get("full"))):
+            print(f"[증분 수집] 전체 재동기화 수행 (워터마크: {watermark or '없음'})")
+            return self.call_api(api_instance, endpoint_id)
+        
+        # modifiedtime은 날짜 앞자리 일치 조건이므로 워터마크 날짜부터 오늘까지 일/월 단위로 나누어 조회
+        sync_params = get_sync_params(watermark)
+        print(f"[증분 수집] 워터마크 {watermark} 이후 변경분 조회 ({len(sync_params)}회: "
+              f"{sync_params[0]['modifiedtime']} ~ {sync_params[-1]['modifiedtime']})")
+        items = []
+        failures = {}
+        for params in sync_params:
+            data, error = self.call_api(api_instance, sync_endpoint_id, params)
+            if error:
+                return None, error
+            items.extend(AreaBasedSynchronizer.extract_items(data, api_type))
+            # 조회 구간별로 실패한 지역 단위 (구간을 붙여 구분)
+            failures.update({f"{params['modifiedtime']}:{key}": value for key, value in data.get("failures", {}).items()})
+        
+        changed_items, hidden_count = filter_changed_items(items, watermark)
+        print(f"[증분 수집] 변경 {len(changed_items)}개 (조회 {len(items)}개, 비공개 {hidden_count}개 제외)")
+        
+        return api_instance.build_result(changed_items, failures), None
 
 def main():
     crawler = TourismCrawler()
     
     if len(sys.argv) > 1:
-        # CLI 모드
-        crawler.run_cli(sys.argv[1:])
+        # CLI 모드 (실행이 실패하거나 일부 지역 단위 수집이 실패하면 종료 코드 1)
+        success = crawler.run_cli(sys.argv[1:])
+        if not success:
+            sys.exit(1)
     else:
         # 대화형 모드
         crawler.run_interactive()
@@ -0,0 +1,15 @@
+-- sync_logs 실행 계측 컬럼 추가 (PostgreSQL 표준)
+-- Supabase SQL Editor에서 실행하세요
+-- metrics 예시:
+-- {"wall_seconds": 42.1, "phases": {"fetch_pages": {"seconds": 30.2, "calls": 3}, "write": {"seconds": 5.4, "calls": 2}},
+--  "counters": {"api_requests": 18, "api_retries": 1, "api_bytes_in": 5242880, "db_requests": 12, "db_bytes_out": 1048576},
+--  "peak_memory_mb": 180.5}
+
+ALTER TABLE sync_logs ADD COLUMN IF NOT EXISTS metrics JSONB;
+
+-- 예: 최근 실행의 단계별 소요 시간
+-- SELECT sync_date, api_type, execution_time_seconds,
+--        metrics->'phases'->'fetch_pages'->>'seconds' AS fetch_seconds,
+--        metrics->'phases'->'write'->>'seconds' AS write_seconds,
+--        metrics->>'peak_memory_mb' AS peak_memory_mb
+-- FROM sync_logs ORDER BY id DESC LIMIT 20;
@@ -0,0 +1,24 @@
+-- 실행 간 상태 테이블 추가 (PostgreSQL 표준)
+-- Supabase SQL Editor에서 실행하세요
+-- 컨테이너(docker run --rm)로 실행하면 로컬 캐시 파일이 실행마다 사라지므로 다음 상태를 DB에 보관한다 (settings/state_store.py)
+--   base_ym_months: --months 실행에서 적재가 끝난 월 기록 (key: 테이블 이름)
+--   region_sizes:   지역 단위별 최근 item 수 (key: API 종류)
+--   page_sizes:     엔드포인트별 최대 페이지 크기 (key: 엔드포인트 URL)
+-- 항목(namespace, key) 단위로 저장하므로 동시에 실행한 작업이 서로의 항목을 덮어쓰지 않는다.
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    namespace VARCHAR(50) NOT NULL,
+    key TEXT NOT NULL,
+    value JSONB NOT NULL,
+    updated_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (namespace, key)
+);
+
+ALTER TABLE sync_state ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "Enable all operations for anon users" ON sync_state;
+CREATE POLICY "Enable all operations for anon users" ON sync_state
+    FOR ALL USING (true);
+
+-- 예: 적재가 끝난 월 목록
+-- SELECT jsonb_object_keys(value) AS base_ym FROM sync_state
+-- WHERE namespace = 'base_ym_months' AND key = 'base_tour_areabased' ORDER BY 1;
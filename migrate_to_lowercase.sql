@@ -100,7 +100,8 @@ CREATE TABLE sync_logs (
     error_message TEXT,
     started_at TIMESTAMP DEFAULT NOW(),
     completed_at TIMESTAMP,
-    execution_time_seconds INTEGER
+    execution_time_seconds INTEGER,
+    metrics JSONB -- 단계별 소요 시간, API/DB 요청 수와 송수신 바이트, 최대 메모리
 );
 
 -- 6. 인덱스 생성
@@ -0,0 +1,57 @@
+-- tourism_data 테이블 마이그레이션 (PostgreSQL 표준)
+-- Supabase SQL Editor에서 실행하세요
+-- - data: JSON 문자열(TEXT 또는 문자열이 담긴 JSONB) → JSON 객체(JSONB)
+-- - data_hash: 같은 (api_type, endpoint_name)에 이미 저장된 item을 다시 저장하지 않기 위한 해시
+
+-- 1. 테이블이 없으면 생성
+CREATE TABLE IF NOT EXISTS tourism_data (
+    id SERIAL PRIMARY KEY,
+    api_type VARCHAR(100) NOT NULL,
+    endpoint_name VARCHAR(100) NOT NULL,
+    data JSONB NOT NULL,
+    data_hash VARCHAR(64),
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
+-- 2. 기존 테이블: data를 JSONB로 변환하고 data_hash 컬럼 추가
+ALTER TABLE tourism_data ALTER COLUMN data TYPE JSONB USING data::jsonb;
+ALTER TABLE tourism_data ADD COLUMN IF NOT EXISTS data_hash VARCHAR(64);
+
+-- 3. 이중 인코딩된 기존 행(JSON 문자열이 담긴 JSONB)을 JSON 객체로 변환
+UPDATE tourism_data SET data = (data #>> '{}')::jsonb WHERE jsonb_typeof(data) = 'string';
+
+-- 4. 기존 행의 data_hash 채우기
+-- SupabaseHandler.make_row와 같은 해시(HASH_SCHEME과 관계없이 sha256)를 계산하여, 다음 실행에서 기존 item을 다시 저장하지 않게 함
+-- (Python과 같은 값이 나오는지는 benchmarks/tourism_hash_check.py로 확인)
+-- Python json.dumps(item, sort_keys=True, ensure_ascii=False)와 같은 문자열을 만든 뒤 sha256 (PostgreSQL 11+)
+-- (키는 코드 포인트 순, 구분자는 ', '와 ': ', 문자열은 JSON 이스케이프만 적용)
+-- 정수가 아닌 숫자는 표기가 다를 수 있으며, 그런 행은 다음 실행에서 한 번 더 저장됨
+CREATE OR REPLACE FUNCTION tourism_data_canonical_json(value JSONB) RETURNS TEXT
+LANGUAGE plpgsql IMMUTABLE AS $$
+BEGIN
+    CASE jsonb_typeof(value)
+        WHEN 'object' THEN
+            RETURN '{' || COALESCE((
+                SELECT string_agg(to_jsonb(entry.key)::text || ': ' || tourism_data_canonical_json(entry.value), ', '
+                                  ORDER BY entry.key COLLATE "C")
+                FROM jsonb_each(value) AS entry
+            ), '') || '}';
+        WHEN 'array' THEN
+            RETURN '[' || COALESCE((
+                SELECT string_agg(tourism_data_canonical_json(element.value), ', ' ORDER BY element.position)
+                FROM jsonb_array_elements(value) WITH ORDINALITY AS element(value, position)
+            ), '') || ']';
+        ELSE
+            RETURN value::text;
+    END CASE;
+END;
+$$;
+
+UPDATE tourism_data
+SET data_hash = encode(sha256(convert_to(tourism_data_canonical_json(data), 'UTF8')), 'hex')
+WHERE data_hash IS NULL;
+
+DROP FUNCTION tourism_data_canonical_json(JSONB);
+
+-- 5. 해시 조회용 인덱스
+CREATE INDEX IF NOT EXISTS idx_tourism_data_hash ON tourism_data(api_type, endpoint_name, data_hash);
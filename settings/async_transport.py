@@ -0,0 +1,254 @@
+# 비동기(asyncio) 크롤링 엔진용 HTTP 전송 계층
+# 하나의 이벤트 루프에서 공유 커넥션 풀로 모든 API 요청을 코루틴으로 처리
+# aiohttp가 필요하며, 동기 엔진(settings/transport.py)과 같은 재시도/오류 판정 규칙을 사용
+
+import asyncio
+import math
+from collections import deque
+
+try:
+    import aiohttp
+except ImportError:  # 비동기 엔진을 사용하지 않으면 필요 없음
+    aiohttp = None
+
+from settings.config import (
+    AUTO_PAGE_SIZE, FETCH_CONCURRENCY, FETCH_RPS, HOST_CONCURRENCY, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT,
+    HTTP_MAX_RETRIES, extract_page_items, resolve_page_sizes
+)
+from settings.checkpoint import get_checkpoint
+from settings.metrics import phase
+from settings.response_cache import get_response_cache
+from settings.page_size import PageSizeTuner, get_page_size_tuner
+from settings.transport import (
+    RateLimiter, TourApiError, TransportStats, backoff_delay, check_api_response
+)
+
+
+class AsyncTourApiTransport:
+    """asyncio 엔진이 공유하는 HTTP 전송 계층 (async with로 사용)"""
+
+    def __init__(self, max_retries=None, rate_per_sec=None, host_concurrency=None):
+        if aiohttp is None:
+            raise RuntimeError("비동기 엔진을 사용하려면 aiohttp 패키지가 필요합니다. (pip install aiohttp)")
+
+        self.max_retries = HTTP_MAX_RETRIES if max_retries is None else max_retries
+        self.host_concurrency = host_concurrency or HOST_CONCURRENCY
+        self.rate_limiter = RateLimiter(FETCH_RPS if rate_per_sec is None else rate_per_sec)
+        self.stats = TransportStats()
+        self.session = None
+
+    async def __aenter__(self):
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_create)
+
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=self.host_concurrency),
+            timeout=aiohttp.ClientTimeout(connect=HTTP_CONNECT_TIMEOUT, sock_read=HTTP_READ_TIMEOUT),
+            trace_configs=[trace_config]
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+
+    async def _on_connection_create(self, session, context, params):
+        self.stats.incr("connections_opened")
+
+    async def get_json(self, url, params):
+        """
+        GET 요청 후 JSON 응답 반환 (재시도 포함, 참조 코드 엔드포인트는 디스크 캐시 사용)
+
+        Raises:
+            TourApiError: 재시도 후에도 실패한 경우
+        """
+        # requests와 동일하게 값이 None인 파라미터는 제외
+        params = {key: value for key, value in params.items() if value is not None}
+
+        # 캐시 파일 읽기/쓰기는 이벤트 루프를 막지 않도록 스레드에서 실행
+        cache = get_response_cache()
+        cached = await asyncio.to_thread(cache.get, url, params)
+        if cached is not None:
+            return cached
+
+        last_error = None
+
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                self.stats.incr("retries")
+                await asyncio.sleep(backoff_delay(attempt - 1))
+
+            try:
+                delay = self.rate_limiter.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                self.stats.incr("requests")
+                async with self.session.get(url, params=params) as response:
+                    body = await response.read()
+                    status = response.status
+                    request_url = str(response.request_info.url)
+
+                self.stats.incr("bytes_out", len(request_url))
+                self.stats.incr("bytes_in", len(body))
+                data = check_api_response(status, body.decode("utf-8", errors="replace"))
+                await asyncio.to_thread(cache.put, url, params, data)
+                return data
+            except TourApiError as e:
+                last_error = e
+                if not e.retryable:
+                    break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = TourApiError(f"연결 오류: {str(e) or type(e).__name__}", retryable=True)
+
+        self.stats.incr("failures")
+        raise last_error
+
+    def print_stats(self):
+        """실행 통계 출력"""
+        stats = self.stats.summary()
+        if not stats["requests"]:
+            return
+        print(
+            f"[HTTP 통계] 요청 {stats['requests']}회, 재시도 {stats['retries']}회, 실패 {stats['failures']}회, "
+            f"커넥션 생성 {stats['connections_opened']}회 / 재사용 {stats['connections_reused']}회, "
+            f"송신 {stats['bytes_out']:,} / 수신 {stats['bytes_in']:,} bytes"
+        )
+
+
+async def fetch_page_async(transport, url, params, page_no):
+    """
+    단일 페이지 요청 (비동기)
+
+    Returns:
+        tuple: (total_count: int, item_list: list)
+    """
+    page_params = params.copy()
+    page_params["pageNo"] = str(page_no)
+
+    data = await transport.get_json(url, page_params)
+    return extract_page_items(data)
+
+
+async def fetch_all_pages_async(transport, base_url, endpoint_path, base_params, max_pages=50, concurrency=None, label=None, page_size=None):
+    """
+    fetch_all_pages의 비동기 버전 (페이지 크기 자동 조정 포함)
+
+    Returns:
+        tuple: (all_items: list, error: str)
+    """
+    url = base_url + endpoint_path
+    tag = f"[{label}] " if label else ""
+    tuned = page_size is None and AUTO_PAGE_SIZE
+    checkpoint = get_checkpoint(base_url, endpoint_path, base_params)
+    sizes = resolve_page_sizes(url, base_params, page_size, checkpoint, tag)
+
+    for size in sizes:
+        params = base_params.copy()
+        params["numOfRows"] = str(size)
+
+        with phase("fetch_pages"):
+            all_items, error, size_rejected = await fetch_pages_with_size_async(
+                transport, url, params, size, max_pages, concurrency, tag, checkpoint
+            )
+
+        if size_rejected and size != sizes[-1]:
+            print(f"{tag}[페이지 크기] numOfRows={size} 거부 또는 잘린 응답, 더 작은 크기로 재시도")
+            get_page_size_tuner().record_failure(url, size)
+            if checkpoint:
+                checkpoint.clear()
+            continue
+
+        if tuned and not size_rejected:
+            get_page_size_tuner().record(url, size)
+        return all_items, error
+
+    return [], "페이지 크기 후보 없음"
+
+
+async def fetch_pages_with_size_async(transport, url, params, size, max_pages, concurrency, tag, checkpoint=None):
+    """
+    fetch_pages_with_size의 비동기 버전
+
+    Returns:
+        tuple: (all_items: list, error: str, size_rejected: bool)
+    """
+    concurrency = concurrency or FETCH_CONCURRENCY
+    # 체크포인트 파일 읽기/쓰기는 이벤트 루프를 막지 않도록 스레드에서 실행
+    meta = await asyncio.to_thread(checkpoint.load_meta) if checkpoint else None
+
+    async def load_page(page_no):
+        """체크포인트에 있으면 디스크에서, 없으면 API에서 페이지 조회"""
+        if meta:
+            saved_items = await asyncio.to_thread(checkpoint.load_page, page_no)
+            if saved_items is not None:
+                return meta["total_count"], saved_items
+
+        total_count, page_items = await fetch_page_async(transport, url, params, page_no)
+        if checkpoint:
+            if page_no == 1:
+                await asyncio.to_thread(checkpoint.save_meta, size, total_count)
+            await asyncio.to_thread(checkpoint.save_page, page_no, page_items)
+        return total_count, page_items
+
+    # 1페이지: totalCount 확인
+    try:
+        total_count, item_list = await load_page(1)
+    except Exception as e:
+        # 페이지 크기와 무관한 오류(인증, 호출 한도, 연결 등)는 더 작은 크기로 재시도하지 않음
+        return [], f"페이지 1 처리 실패: {str(e)}", getattr(e, "size_related", False)
+
+    if not item_list:
+        print(f"{tag}[페이지 1] 데이터 없음, 종료")
+        return [], None, False
+
+    if PageSizeTuner.is_truncated(size, total_count, len(item_list)):
+        return [], f"페이지 1 응답 잘림 ({len(item_list)}/{min(size, total_count)}개)", True
+
+    all_items = list(item_list)
+    print(f"{tag}[페이지 1] {len(item_list)}개 수집 (전체 {total_count}개)")
+
+    if len(all_items) >= total_count:
+        return all_items, None, False
+
+    last_page = min(max_pages, math.ceil(total_count / size))
+    workers = min(concurrency, last_page - 1)
+    semaphore = asyncio.Semaphore(workers)
+
+    async def fetch_with_limit(page_no):
+        async with semaphore:
+            return await load_page(page_no)
+
+    pending = deque()
+    next_page = 2
+    try:
+        # 동기 엔진과 같이 작업자 수의 2배까지만 미리 요청 (순서 대기 중인 페이지 수 제한)
+        while next_page <= last_page and len(pending) < workers * 2:
+            pending.append((next_page, asyncio.ensure_future(fetch_with_limit(next_page))))
+            next_page += 1
+
+        # 페이지 순서대로 병합 (첫 실패 페이지 이전까지)
+        while pending:
+            page_no, task = pending.popleft()
+            try:
+                _, page_items = await task
+            except Exception as e:
+                return all_items, f"페이지 {page_no} 처리 실패: {str(e)}", False
+
+            if next_page <= last_page:
+                pending.append((next_page, asyncio.ensure_future(fetch_with_limit(next_page))))
+                next_page += 1
+
+            if not page_items:
+                break
+            if PageSizeTuner.is_truncated(size, total_count, len(page_items), page_no, last_page):
+                return all_items, f"페이지 {page_no} 응답 잘림", True
+            all_items.extend(page_items)
+    finally:
+        # 중단한 경우 아직 끝나지 않은 페이지 요청 취소
+        for _, task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+    print(f"{tag}[완료] 전체 {total_count}개 중 {len(all_items)}개 데이터 수집 완료")
+    return all_items, None, False
@@ -0,0 +1,121 @@
+# 페이지 단위 수집 체크포인트
+# 페이지를 받는 즉시 로컬에 저장해두고, 중간에 실패한 수집을 다시 실행하면
+# 이미 받은 페이지는 디스크에서 읽고 빠진 페이지부터 이어서 요청한다.
+# 체크포인트 키: API 서비스 + 엔드포인트 + 파라미터 (serviceKey, pageNo, numOfRows 제외)
+
+import hashlib
+import json
+import os
+import shutil
+import time
+
+from settings.config import CHECKPOINT_DIR, CHECKPOINT_ENABLED, CHECKPOINT_MAX_AGE_HOURS
+
+# 체크포인트 키에서 제외할 파라미터 (대소문자 무시)
+EXCLUDED_KEY_PARAMS = {"servicekey", "pageno", "numofrows"}
+
+
+def get_checkpoint_prefix(base_url, endpoint_path):
+    """API 서비스와 엔드포인트로 체크포인트 디렉토리 접두어 생성 (예: KorWithService2_areaBasedList2)"""
+    service_name = base_url.rstrip("/").rsplit("/", 1)[-1]
+    return f"{service_name}_{endpoint_path.strip('/')}"
+
+
+class PageCheckpoint:
+    """하나의 (API, 엔드포인트, 파라미터) 수집에 대한 페이지 체크포인트"""
+
+    def __init__(self, base_url, endpoint_path, params, checkpoint_dir=CHECKPOINT_DIR):
+        normalized = sorted(
+            (str(key), str(value)) for key, value in params.items()
+            if value is not None and str(key).lower() not in EXCLUDED_KEY_PARAMS
+        )
+        params_hash = hashlib.sha256(json.dumps(normalized, ensure_ascii=False).encode()).hexdigest()[:16]
+        self.path = os.path.join(checkpoint_dir, f"{get_checkpoint_prefix(base_url, endpoint_path)}_{params_hash}")
+        self.params = dict(normalized)
+
+    def meta_path(self):
+        return os.path.join(self.path, "meta.json")
+
+    def page_path(self, page_no):
+        return os.path.join(self.path, f"page_{page_no:05d}.json")
+
+    def load_meta(self):
+        """
+        저장된 메타 정보 (page_size, total_count) 조회
+
+        CHECKPOINT_MAX_AGE_HOURS보다 오래된 체크포인트는 원본 데이터가 바뀌었을 수 있으므로 삭제한다.
+        """
+        try:
+            with open(self.meta_path(), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - meta.get("created_at", 0) > CHECKPOINT_MAX_AGE_HOURS * 3600:
+            self.clear()
+            return None
+        return meta
+
+    def save_meta(self, page_size, total_count):
+        """1페이지 수집 후 페이지 크기와 전체 개수 저장"""
+        if os.path.exists(self.meta_path()):
+            return
+        self.write_json(self.meta_path(), {
+            "page_size": page_size,
+            "total_count": total_count,
+            "params": self.params,
+            "created_at": time.time()
+        })
+
+    def load_page(self, page_no):
+        """저장된 페이지 item 리스트 (없으면 None)"""
+        try:
+            with open(self.page_path(page_no), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save_page(self, page_no, items):
+        """수집한 페이지 저장"""
+        self.write_json(self.page_path(page_no), items)
+
+    def write_json(self, path, data):
+        """임시 파일에 쓴 뒤 교체하여 중간에 끊겨도 깨진 파일이 남지 않게 저장"""
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[경고] 체크포인트 저장 실패: {str(e)}")
+
+    def clear(self):
+        """체크포인트 삭제"""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def get_checkpoint(base_url, endpoint_path, params):
+    """체크포인트 사용 시 PageCheckpoint, 아니면 None"""
+    if not CHECKPOINT_ENABLED:
+        return None
+    return PageCheckpoint(base_url, endpoint_path, params)
+
+
+def clear_checkpoints(base_url, endpoint_paths, checkpoint_dir=CHECKPOINT_DIR):
+    """동기화 성공 후 해당 엔드포인트의 모든 체크포인트 삭제 (시군구별 체크포인트 포함)"""
+    prefixes = tuple(f"{get_checkpoint_prefix(base_url, endpoint_path)}_" for endpoint_path in endpoint_paths)
+    try:
+        names = os.listdir(checkpoint_dir)
+    except OSError:
+        return 0
+
+    removed = 0
+    for name in names:
+        if name.startswith(prefixes):
+            shutil.rmtree(os.path.join(checkpoint_dir, name), ignore_errors=True)
+            removed += 1
+
+    if removed:
+        print(f"[체크포인트] {removed}개 정리 완료")
+    return removed
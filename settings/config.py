@@ -1,7 +1,8 @@
 import os
 from dotenv import load_dotenv
-import requests
-import time
+import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 # .env 파일 로드
 load_dotenv()
@@ -9,8 +10,15 @@ load_dotenv()
 # 환경 변수
 SUPABASE_BASE_URL = os.getenv('SUPABASE_BASE_URL')
 SUPABASE_API_KEY = os.getenv('SUPABASE_API_KEY')
+# PostgreSQL 직접 연결 DSN (선택사항, 설정 시 areaBasedList 동기화 쓰기를 COPY로 수행 - batch/pg_copy.py)
+SUPABASE_DB_DSN = os.getenv('SUPABASE_DB_DSN')
+# tourism_data 저장 요청 본문 gzip 압축 여부 (PostgREST는 압축 본문을 받지 않으므로 압축을 풀어 주는 프록시 뒤에서만 켬,
+# 서버가 Content-Encoding을 거부하면 이번 실행에서는 압축 없이 전송)
+SUPABASE_GZIP = os.getenv('SUPABASE_GZIP', 'false').lower() == 'true'
 DATA_KEY_ENCODING = os.getenv('DATA_KEY_ENCODING')
 DATA_KEY_DECODING = os.getenv('DATA_KEY_DECODING')
+# 관광 API 기본 주소 (벤치마크용 로컬 모의 서버나 프록시를 사용할 때 변경)
+TOUR_API_BASE_URL = os.getenv('TOUR_API_BASE_URL', 'http://apis.data.go.kr/B551011').rstrip('/')
 
 # API 공통 파라미터
 COMMON_PARAMS = {
@@ -20,93 +28,422 @@ COMMON_PARAMS = {
     "_type": "json"
 }
 
-def fetch_all_pages(base_url, endpoint_path, base_params, max_pages=50):
+# 페이지 병렬 수집 설정
+# FETCH_CONCURRENCY: 동시에 요청할 최대 페이지 수
+# FETCH_RPS: 초당 최대 요청 수 (기존 0.1초 고정 간격 대체)
+# HOST_CONCURRENCY: 호스트(data.go.kr)별 동시 요청 상한 (모든 작업자 공유)
+# SIGNGU_CONCURRENCY: 지역/시군구 단위 동시 수집 작업자 수
+FETCH_CONCURRENCY = int(os.getenv('FETCH_CONCURRENCY', '4'))
+FETCH_RPS = float(os.getenv('FETCH_RPS', '10'))
+HOST_CONCURRENCY = int(os.getenv('HOST_CONCURRENCY', '6'))
+SIGNGU_CONCURRENCY = int(os.getenv('SIGNGU_CONCURRENCY', '4'))
+
+# 실행 간 상태 저장 위치 (settings/state_store.py)
+# STATE_STORE: auto(Supabase 설정이 있으면 sync_state 테이블, 없으면 로컬 파일) / supabase / file
+#   월별 적재 기록(BASE_YM_LEDGER_PATH), 지역 크기 캐시(REGION_SIZE_CACHE_PATH), 페이지 크기 캐시(PAGE_SIZE_CACHE_PATH)에 적용
+#   컨테이너(docker run --rm)에서는 로컬 파일이 실행마다 사라지므로 DB에 보관 (migrate_sync_state.sql)
+STATE_STORE = os.getenv('STATE_STORE', 'auto').lower()
+
+# 수집 지역 (api/regions.py)
+# CRAWL_AREAS: 비우면 기존 고정 지역(생태/무장애 areaCode 35, 기초지자체 areaCd 47), all이면 전국 지역 탐색,
+#              쉼표로 구분한 코드면 해당 지역만 (생태/무장애는 관광 지역코드, 기초지자체는 법정동 시도코드)
+# REGION_UNIT_RETRIES: 지역 단위 수집 실패 시 재시도 횟수 (작업 큐 뒤에 다시 넣음)
+# REGION_SIZE_CACHE_PATH: 지역 단위별 최근 item 수 (큰 단위부터 예약하는 데 사용)
+# 지역 단위 동시 수집 작업자 수는 SIGNGU_CONCURRENCY를 사용
+CRAWL_AREAS = os.getenv('CRAWL_AREAS', '')
+REGION_UNIT_RETRIES = int(os.getenv('REGION_UNIT_RETRIES', '2'))
+REGION_SIZE_CACHE_PATH = os.getenv('REGION_SIZE_CACHE_PATH', 'data/.cache/region_sizes.json')
+
+# 기초지자체 API 기준 연월 (api/base_tour.py, sync/month_grid.py)
+# BASE_TOUR_BASE_YM: --months를 지정하지 않았을 때 수집할 baseYm
+# BASE_YM_LEDGER_PATH: --months 실행에서 적재가 끝난 월 기록 (DB 행 수/해시가 기록과 같으면 다음 실행에서 건너뜀)
+BASE_TOUR_BASE_YM = os.getenv('BASE_TOUR_BASE_YM', '202506')
+BASE_YM_LEDGER_PATH = os.getenv('BASE_YM_LEDGER_PATH', 'data/.cache/base_ym_months.json')
+
+# 증분 수집 설정
+# INCREMENTAL_FULL_RECONCILE_WEEKDAY: 증분 모드에서도 전체 재동기화를 수행할 요일 (0=월 ~ 6=일, -1=사용 안 함)
+INCREMENTAL_FULL_RECONCILE_WEEKDAY = int(os.getenv('INCREMENTAL_FULL_RECONCILE_WEEKDAY', '6'))
+
+# numOfRows 자동 조정 (settings/page_size.py)
+# AUTO_PAGE_SIZE: 사용 여부, PAGE_SIZE_CANDIDATES: 시도할 크기(큰 순서로 시도, 기본 100은 항상 포함)
+# PAGE_SIZE_CACHE_TTL_DAYS: 캐시된 크기를 재탐색하기까지의 기간
+AUTO_PAGE_SIZE = os.getenv('AUTO_PAGE_SIZE', 'true').lower() == 'true'
+PAGE_SIZE_CANDIDATES = [int(size) for size in os.getenv('PAGE_SIZE_CANDIDATES', '1000,500,200').split(',') if size.strip()]
+PAGE_SIZE_CACHE_PATH = os.getenv('PAGE_SIZE_CACHE_PATH', 'data/.cache/page_sizes.json')
+PAGE_SIZE_CACHE_TTL_DAYS = int(os.getenv('PAGE_SIZE_CACHE_TTL_DAYS', '7'))
+
+# 참조 코드 응답 캐시 (settings/response_cache.py)
+# RESPONSE_CACHE_ENABLED: 사용 여부, RESPONSE_CACHE_TTL_HOURS: 참조 코드 엔드포인트 캐시 유지 시간
+# RESPONSE_CACHE_MAX_BYTES: 캐시 디렉토리 최대 크기 (초과 시 LRU 삭제)
+RESPONSE_CACHE_ENABLED = os.getenv('RESPONSE_CACHE_ENABLED', 'true').lower() == 'true'
+RESPONSE_CACHE_DIR = os.getenv('RESPONSE_CACHE_DIR', 'data/.cache/http')
+RESPONSE_CACHE_TTL_HOURS = float(os.getenv('RESPONSE_CACHE_TTL_HOURS', '168'))
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv('RESPONSE_CACHE_MAX_BYTES', str(50 * 1024 * 1024)))
+
+# 다중 작업 실행 (main.py --jobs)
+# JOB_CONCURRENCY: 동시에 실행할 작업 수
+JOB_CONCURRENCY = int(os.getenv('JOB_CONCURRENCY', '3'))
+
+# 동기화 설정
+# SYNC_CHUNK_SIZE: 스트리밍 모드에서 매핑 후 한 번에 DB에 반영할 item 수
+# SYNC_UPSERT_BATCH_SIZE: 업서트 요청 한 번에 보낼 행 수
+SYNC_CHUNK_SIZE = int(os.getenv('SYNC_CHUNK_SIZE', '500'))
+SYNC_UPSERT_BATCH_SIZE = int(os.getenv('SYNC_UPSERT_BATCH_SIZE', '200'))
+
+# areaBasedList 테이블 raw_data 저장 방식 (sync/areabased_mapper.py)
+# full: 원본 item 전체 (기존) / extra: 값을 그대로 컬럼에 옮긴 필드를 뺀 나머지만 저장 (업서트 전송량 감소)
+AREABASED_RAW_DATA = os.getenv('AREABASED_RAW_DATA', 'full').lower()
+
+# 데이터 해시 설정 (sync/hash_utils.py)
+# HASH_SCHEME: sha256(기존, 접두어 없음) / blake2b("b2:") / xxh3("xx:", xxhash 패키지 필요)
+#   방식을 바꿔도 기존 행은 저장된 해시의 방식으로 다시 계산해 비교하므로 내용이 같으면 다시 쓰지 않는다.
+# HASH_WORKERS: 대량 해시 계산 시 프로세스 수 (1이면 단일 프로세스)
+# HASH_PARALLEL_MIN_ITEMS: 프로세스 풀을 사용할 최소 item 수
+HASH_SCHEME = os.getenv('HASH_SCHEME', 'sha256')
+HASH_WORKERS = int(os.getenv('HASH_WORKERS', '1'))
+HASH_PARALLEL_MIN_ITEMS = int(os.getenv('HASH_PARALLEL_MIN_ITEMS', '20000'))
+
+# Supabase 쓰기 풀 (batch/writer_pool.py)
+# WRITER_CONCURRENCY: 동시에 보낼 쓰기 요청 수, WRITER_QUEUE_SIZE: 실행 대기 요청 상한 (넘으면 생산자가 대기)
+WRITER_CONCURRENCY = int(os.getenv('WRITER_CONCURRENCY', '4'))
+WRITER_QUEUE_SIZE = int(os.getenv('WRITER_QUEUE_SIZE', '8'))
+
+# 기존 데이터 조회 설정 (batch/supabase_areabased.py)
+# EXISTING_READ_PAGE_SIZE: 범위 조회 한 번의 행 수, EXISTING_READ_CONCURRENCY: 동시에 조회할 구간 수
+EXISTING_READ_PAGE_SIZE = int(os.getenv('EXISTING_READ_PAGE_SIZE', '1000'))
+EXISTING_READ_CONCURRENCY = int(os.getenv('EXISTING_READ_CONCURRENCY', '4'))
+
+# 로컬 키 인덱스 (sync/key_index.py)
+# KEY_INDEX_ENABLED: 사용 여부 (끄면 동기화마다 DB에서 전체 키 목록 조회)
+# KEY_INDEX_PATH: 인덱스 파일 (컨테이너에서는 볼륨에 두어야 실행 간에 유지됨, 일일 동기화 워크플로는 actions/cache 볼륨 사용)
+KEY_INDEX_ENABLED = os.getenv('KEY_INDEX_ENABLED', 'true').lower() == 'true'
+KEY_INDEX_PATH = os.getenv('KEY_INDEX_PATH', 'data/.cache/key_index.sqlite')
+
+# 수집 체크포인트 (settings/checkpoint.py)
+# CHECKPOINT_ENABLED: 사용 여부 (페이지마다 디스크에 쓰므로 불안정한 API를 긴 수집할 때만 켬)
+# CHECKPOINT_MAX_AGE_HOURS: 이보다 오래된 체크포인트는 무시하고 새로 수집
+CHECKPOINT_ENABLED = os.getenv('CHECKPOINT_ENABLED', 'false').lower() == 'true'
+CHECKPOINT_DIR = os.getenv('CHECKPOINT_DIR', 'data/.checkpoints')
+CHECKPOINT_MAX_AGE_HOURS = float(os.getenv('CHECKPOINT_MAX_AGE_HOURS', '24'))
+
+# 저장된 스냅샷 일괄 적재 (sync/backfill.py)
+# BACKFILL_WORKERS: 스냅샷 파일을 동시에 읽는 프로세스 수 (1이면 현재 프로세스에서 순서대로 읽음)
+BACKFILL_WORKERS = int(os.getenv('BACKFILL_WORKERS', str(min(4, os.cpu_count() or 1))))
+
+# 로컬 저장 형식 (main.py save_to_local, batch/ndjson_writer.py)
+# LOCAL_FORMAT: json(응답 전체를 들여쓴 JSON 파일 하나) / ndjson(item 한 줄씩 + 매니페스트, --stream에서도 저장 가능)
+# LOCAL_COMPRESSION: ndjson 압축 방식 (none / gzip / zstd, zstd는 zstandard 패키지 필요)
+LOCAL_FORMAT = os.getenv('LOCAL_FORMAT', 'json').lower()
+LOCAL_COMPRESSION = os.getenv('LOCAL_COMPRESSION', 'gzip').lower()
+
+# HTTP 전송 설정 (settings/transport.py)
+# HTTP_CONNECT_TIMEOUT / HTTP_READ_TIMEOUT: 요청별 타임아웃(초)
+# HTTP_MAX_RETRIES: 최대 재시도 횟수, HTTP_BACKOFF_BASE / HTTP_BACKOFF_MAX: 백오프 기준/상한(초)
+HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '5'))
+HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', '30'))
+HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', '3'))
+HTTP_BACKOFF_BASE = float(os.getenv('HTTP_BACKOFF_BASE', '0.5'))
+HTTP_BACKOFF_MAX = float(os.getenv('HTTP_BACKOFF_MAX', '8'))
+
+
+def extract_page_items(data):
+    """
+    API 응답에서 totalCount와 item 리스트 추출
+
+    Returns:
+        tuple: (total_count: int, item_list: list)
+    """
+    response_body = data.get("response", {}).get("body", {})
+    total_count = int(response_body.get("totalCount", 0) or 0)
+    items = response_body.get("items", {})
+
+    if not items:
+        return total_count, []
+
+    if isinstance(items, dict):
+        item_list = items.get("item", [])
+    else:
+        item_list = items
+
+    if not isinstance(item_list, list):
+        item_list = [item_list] if item_list else []
+
+    return total_count, item_list
+
+
+def fetch_page(url, params, page_no):
+    """
+    단일 페이지 요청
+
+    Returns:
+        tuple: (total_count: int, item_list: list)
+    """
+    # 순환 import 방지를 위해 함수 내부에서 import
+    from settings.transport import get_transport
+
+    page_params = params.copy()
+    page_params["pageNo"] = str(page_no)
+
+    data = get_transport().get_json(url, page_params)
+    return extract_page_items(data)
+
+
+def fetch_all_pages(base_url, endpoint_path, base_params, max_pages=50, concurrency=None, label=None, page_size=None):
     """
     모든 페이지의 데이터를 가져오는 공통 함수
-    
+
+    첫 페이지로 totalCount를 확인한 뒤 나머지 페이지는 병렬로 요청한다.
+    결과는 항상 페이지 순서대로 합쳐진다.
+    page_size를 지정하지 않으면 엔드포인트별로 캐시된 최대 numOfRows를 사용하고,
+    큰 페이지가 실패하거나 잘리면 더 작은 크기로 다시 수집한다.
+
     Args:
         base_url (str): API 기본 URL
         endpoint_path (str): 엔드포인트 경로
         base_params (dict): 기본 파라미터
         max_pages (int): 최대 페이지 수 (무한루프 방지)
-        
+        concurrency (int): 동시 요청 수 (기본값: FETCH_CONCURRENCY)
+        label (str): 로그 앞에 붙일 식별자 (예: 시군구 코드)
+        page_size (int): 고정 페이지 크기 (지정 시 자동 조정 사용 안 함)
+
     Returns:
         tuple: (all_items: list, error: str)
     """
+    from settings.checkpoint import get_checkpoint
+    from settings.metrics import phase
+    from settings.page_size import get_page_size_tuner
+
+    url = base_url + endpoint_path
+    tag = f"[{label}] " if label else ""
+    tuned = page_size is None and AUTO_PAGE_SIZE
+    checkpoint = get_checkpoint(base_url, endpoint_path, base_params)
+    sizes = resolve_page_sizes(url, base_params, page_size, checkpoint, tag)
+
+    for size in sizes:
+        params = base_params.copy()
+        params["numOfRows"] = str(size)
+
+        with phase("fetch_pages"):
+            all_items, error, size_rejected = fetch_pages_with_size(url, params, size, max_pages, concurrency, tag, checkpoint)
+
+        if size_rejected and size != sizes[-1]:
+            print(f"{tag}[페이지 크기] numOfRows={size} 거부 또는 잘린 응답, 더 작은 크기로 재시도")
+            get_page_size_tuner().record_failure(url, size)
+            if checkpoint:
+                checkpoint.clear()
+            continue
+
+        if tuned and not size_rejected:
+            get_page_size_tuner().record(url, size)
+        return all_items, error
+
+    return [], "페이지 크기 후보 없음"
+
+
+def resolve_page_sizes(url, base_params, page_size, checkpoint, tag):
+    """시도할 페이지 크기 목록 - 이어받을 체크포인트가 있으면 그때의 페이지 크기만 사용"""
+    from settings.page_size import get_page_size_candidates
+
+    meta = checkpoint.load_meta() if checkpoint else None
+    if meta:
+        print(f"{tag}[체크포인트] 이전 수집 이어받기 (numOfRows={meta['page_size']}, 전체 {meta['total_count']}개)")
+        return [meta["page_size"]]
+    return get_page_size_candidates(url, base_params, page_size)
+
+
+class PageFetchError(Exception):
+    """
+    페이지 수집 실패
+
+    size_rejected: 페이지 크기 문제로 더 작은 크기로 재시도 필요
+    failures: 지역 단위 스트리밍 수집에서 실패한 단위 {unit.key: 오류} (나머지 단위의 페이지는 이미 yield됨)
+    """
+
+    def __init__(self, message, size_rejected=False, failures=None):
+        super().__init__(message)
+        self.size_rejected = size_rejected
+        self.failures = failures
+
+
+def fetch_pages_with_size(url, params, size, max_pages, concurrency, tag, checkpoint=None):
+    """
+    지정한 페이지 크기로 전체 페이지 수집
+
+    Returns:
+        tuple: (all_items: list, error: str, size_rejected: bool)
+            size_rejected: 잘린 응답 또는 1페이지의 페이지 크기 관련 오류 (더 작은 크기로 재시도 필요)
+    """
     all_items = []
-    page_no = 1
-    
-    while page_no <= max_pages:
+    try:
+        for page_items in iter_pages_with_size(url, params, size, max_pages, concurrency, tag, checkpoint):
+            all_items.extend(page_items)
+    except PageFetchError as e:
+        return all_items, str(e), e.size_rejected
+
+    return all_items, None, False
+
+
+def iter_pages_with_size(url, params, size, max_pages, concurrency, tag, checkpoint=None):
+    """
+    지정한 페이지 크기로 페이지별 item 리스트를 순서대로 yield
+
+    1페이지로 totalCount를 확인한 뒤 나머지 페이지는 최대 concurrency개씩 미리 요청한다.
+    미리 받아두는 페이지 수가 제한되므로 메모리 사용량은 전체 결과 크기와 무관하다.
+    checkpoint가 주어지면 받은 페이지를 저장하고, 이미 저장된 페이지는 요청하지 않는다.
+
+    Raises:
+        PageFetchError: 페이지 요청 실패 또는 잘린 응답
+    """
+    from settings.metrics import submit_in_scope
+    from settings.page_size import PageSizeTuner
+
+    concurrency = concurrency or FETCH_CONCURRENCY
+    meta = checkpoint.load_meta() if checkpoint else None
+
+    def load_page(page_no):
+        """체크포인트에 있으면 디스크에서, 없으면 API에서 페이지 조회"""
+        if meta:
+            saved_items = checkpoint.load_page(page_no)
+            if saved_items is not None:
+                return meta["total_count"], saved_items, True
+
+        total_count, page_items = fetch_page(url, params, page_no)
+        if checkpoint:
+            if page_no == 1:
+                checkpoint.save_meta(size, total_count)
+            checkpoint.save_page(page_no, page_items)
+        return total_count, page_items, False
+
+    # 1페이지: totalCount 확인
+    try:
+        print(f"{tag}[페이지 1] 요청 중... (numOfRows={size})")
+        total_count, item_list, _ = load_page(1)
+    except Exception as e:
+        # 페이지 크기와 무관한 오류(인증, 호출 한도, 연결 등)는 더 작은 크기로 재시도하지 않음
+        raise PageFetchError(f"페이지 1 처리 실패: {str(e)}", size_rejected=getattr(e, "size_related", False))
+
+    if not item_list:
+        print(f"{tag}[페이지 1] 데이터 없음, 종료")
+        return
+
+    if PageSizeTuner.is_truncated(size, total_count, len(item_list)):
+        raise PageFetchError(f"페이지 1 응답 잘림 ({len(item_list)}/{min(size, total_count)}개)", size_rejected=True)
+
+    collected = len(item_list)
+    print(f"{tag}[페이지 1] {len(item_list)}개 수집 (총 {collected}개)")
+    yield item_list
+
+    if collected >= total_count:
+        print(f"{tag}[완료] 전체 {total_count}개 데이터 수집 완료")
+        return
+
+    # 나머지 페이지 수 계산
+    last_page = min(max_pages, math.ceil(total_count / size))
+    if last_page < 2:
+        return
+
+    workers = min(concurrency, last_page - 1)
+    print(f"{tag}[병렬 수집] 페이지 2~{last_page} (동시 {workers}개)")
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending = deque()
+    next_page = 2
+    try:
+        # 작업자 수의 2배까지만 미리 요청 (순서 대기 중인 페이지 수 제한)
+        while next_page <= last_page and len(pending) < workers * 2:
+            pending.append((next_page, submit_in_scope(executor, load_page, next_page)))
+            next_page += 1
+
+        while pending:
+            page_no, future = pending.popleft()
+            try:
+                _, page_items, resumed = future.result()
+            except Exception as e:
+                raise PageFetchError(f"페이지 {page_no} 처리 실패: {str(e)}")
+
+            if next_page <= last_page:
+                pending.append((next_page, submit_in_scope(executor, load_page, next_page)))
+                next_page += 1
+
+            if not page_items:
+                print(f"{tag}[페이지 {page_no}] 아이템 없음, 종료")
+                break
+            if PageSizeTuner.is_truncated(size, total_count, len(page_items), page_no, last_page):
+                raise PageFetchError(f"페이지 {page_no} 응답 잘림", size_rejected=True)
+
+            collected += len(page_items)
+            source = "체크포인트" if resumed else "수집"
+            print(f"{tag}[페이지 {page_no}] {len(page_items)}개 {source} (총 {collected}개)")
+            yield page_items
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    print(f"{tag}[완료] 전체 {total_count}개 중 {collected}개 데이터 수집 완료")
+
+
+def iter_all_pages(base_url, endpoint_path, base_params, max_pages=50, concurrency=None, label=None, page_size=None):
+    """
+    fetch_all_pages의 스트리밍 버전 - 페이지별 item 리스트를 도착 순서가 아닌 페이지 순서대로 yield
+
+    페이지 크기 자동 조정은 1페이지에서만 하위 크기로 재시도한다.
+    (이미 내보낸 페이지는 되돌릴 수 없으므로 이후 잘린 응답은 오류로 처리)
+
+    Raises:
+        PageFetchError: 페이지 요청 실패
+    """
+    from settings.checkpoint import get_checkpoint
+    from settings.page_size import get_page_size_tuner
+
+    url = base_url + endpoint_path
+    tag = f"[{label}] " if label else ""
+    tuned = page_size is None and AUTO_PAGE_SIZE
+    checkpoint = get_checkpoint(base_url, endpoint_path, base_params)
+    sizes = resolve_page_sizes(url, base_params, page_size, checkpoint, tag)
+
+    for size in sizes:
         params = base_params.copy()
-        params["pageNo"] = str(page_no)
-        
-        url = base_url + endpoint_path
-        
+        params["numOfRows"] = str(size)
+        pages = iter_pages_with_size(url, params, size, max_pages, concurrency, tag, checkpoint)
+
         try:
-            print(f"[페이지 {page_no}] 요청 중...")
-            response = requests.get(url, params=params)
-            
-            if response.status_code != 200:
-                return all_items, f"HTTP {response.status_code} 오류 (페이지 {page_no})"
-                
-            data = response.json()
-            
-            # 응답 구조 확인
-            response_body = data.get("response", {}).get("body", {})
-            total_count = response_body.get("totalCount", 0)
-            items = response_body.get("items", {})
-            
-            # items가 없거나 빈 경우 종료
-            if not items:
-                print(f"[페이지 {page_no}] 데이터 없음, 종료")
-                break
-                
-            # item 추출
-            if isinstance(items, dict):
-                item_list = items.get("item", [])
-            else:
-                item_list = items
-                
-            if not isinstance(item_list, list):
-                item_list = [item_list] if item_list else []
-                
-            if not item_list:
-                print(f"[페이지 {page_no}] 아이템 없음, 종료")
-                break
-                
-            all_items.extend(item_list)
-            print(f"[페이지 {page_no}] {len(item_list)}개 수집 (총 {len(all_items)}개)")
-            
-            # 전체 데이터를 다 가져왔는지 확인
-            if len(all_items) >= total_count:
-                print(f"[완료] 전체 {total_count}개 데이터 수집 완료")
-                break
-                
-            # 다음 페이지로
-            page_no += 1
-            
-            # API 호출 간격 (과도한 요청 방지)
-            time.sleep(0.1)
-            
-        except Exception as e:
-            return all_items, f"페이지 {page_no} 처리 실패: {str(e)}"
-    
-    return all_items, None
+            first_page = next(pages)
+        except StopIteration:
+            return
+        except PageFetchError as e:
+            if e.size_rejected and size != sizes[-1]:
+                print(f"{tag}[페이지 크기] numOfRows={size} 거부 또는 잘린 응답, 더 작은 크기로 재시도")
+                get_page_size_tuner().record_failure(url, size)
+                if checkpoint:
+                    checkpoint.clear()
+                continue
+            raise
+
+        if tuned:
+            get_page_size_tuner().record(url, size)
+
+        yield first_page
+        try:
+            yield from pages
+        except PageFetchError as e:
+            if tuned and e.size_rejected:
+                get_page_size_tuner().record_failure(url, size)
+            raise
+        return
 
 # API 별 기본 설정
 API_CONFIGS = {
     "greentour": {
-        "base_url": "http://apis.data.go.kr/B551011/GreenTourService1",
+        "base_url": f"{TOUR_API_BASE_URL}/GreenTourService1",
         "app_name": "GROOT",
         "service_key": DATA_KEY_DECODING
     },
     "barrier_free": {
-        "base_url": "http://apis.data.go.kr/B551011/KorWithService2", 
+        "base_url": f"{TOUR_API_BASE_URL}/KorWithService2",
         "app_name": "GROOT",
         "service_key": DATA_KEY_DECODING
     },
     "base_tour": {
-        "base_url": "http://apis.data.go.kr/B551011/LocgoHubTarService1",
+        "base_url": f"{TOUR_API_BASE_URL}/LocgoHubTarService1",
         "app_name": "GROOT", 
         "service_key": DATA_KEY_DECODING
     }
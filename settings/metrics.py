@@ -0,0 +1,178 @@
+# 실행 단계별 계측 (수집/매핑/기존 데이터 조회/쓰기)
+# 단계별 소요 시간과 호출 수, HTTP 요청/재시도/송수신 바이트, 최대 메모리를 실행 구간(execute_crawling 한 번)마다
+# 따로 누적하여 sync_logs.metrics에 기록하고 요약 출력한다.
+# - 현재 실행 구간은 contextvars로 전달하므로, 작업 스레드에 제출할 때는 submit_in_scope/map_in_scope를 사용한다.
+#   (--jobs로 여러 작업을 동시에 실행해도 작업별 수치가 섞이지 않음)
+# - 단계 시간은 호출별 소요 시간의 합이므로, 여러 스레드에서 동시에 실행된 단계는 실제 경과 시간보다 클 수 있다.
+
+import contextvars
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows에서는 최대 메모리를 기록하지 않음
+    resource = None
+
+# 요약 출력 순서 (목록에 없는 단계는 뒤에 출력)
+PHASE_LABELS = {
+    "fetch_pages": "API 페이지 수집",
+    "fetch_signgu": "지역/시군구 단위 수집",
+    "fetch_wait": "API 응답 대기 (스트리밍)",
+    "hash": "해시 계산",
+    "map": "매핑",
+    "existing_read": "기존 데이터 조회",
+    "write": "DB 쓰기"
+}
+
+
+def get_peak_memory_mb():
+    """프로세스 최대 메모리 사용량(RSS, MB), 측정할 수 없으면 None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+class RunMetrics:
+    """단계별 시간/호출 수와 카운터 누적 (스레드 안전, parent가 있으면 상위에도 함께 누적)"""
+
+    def __init__(self, parent=None):
+        self.lock = threading.Lock()
+        self.parent = parent
+        self.phases = {}
+        self.counters = {}
+
+    @contextmanager
+    def phase(self, name):
+        """with 블록의 소요 시간을 단계 시간으로 누적"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name, seconds, calls=1):
+        with self.lock:
+            total, count = self.phases.get(name, (0.0, 0))
+            self.phases[name] = (total + seconds, count + calls)
+        if self.parent is not None:
+            self.parent.add_time(name, seconds, calls)
+
+    def incr(self, name, amount=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+        if self.parent is not None:
+            self.parent.incr(name, amount)
+
+    def snapshot(self):
+        """현재 누적값 {"phases": {이름: (초, 호출 수)}, "counters": {이름: 값}}"""
+        with self.lock:
+            return {"phases": dict(self.phases), "counters": dict(self.counters)}
+
+
+class MetricsScope:
+    """실행 구간 (구간 안에서 기록된 값만 따로 누적하고, 상위 구간/프로세스 전체에도 함께 누적)"""
+
+    def __init__(self, parent=None, label=None):
+        self.metrics = RunMetrics(parent)
+        self.label = label
+        self.start = time.perf_counter()
+        self.token = None
+
+    def summary(self):
+        """
+        구간 동안의 누적값
+
+        Returns:
+            dict: wall_seconds, phases({이름: {seconds, calls}}), counters, peak_memory_mb (JSON 직렬화 가능)
+        """
+        current = self.metrics.snapshot()
+        phases = {
+            name: {"seconds": round(seconds, 3), "calls": calls}
+            for name, (seconds, calls) in current["phases"].items()
+        }
+        counters = {name: value for name, value in current["counters"].items() if value}
+
+        return {
+            "wall_seconds": round(time.perf_counter() - self.start, 3),
+            "phases": phases,
+            "counters": counters,
+            "peak_memory_mb": get_peak_memory_mb()
+        }
+
+    def print_summary(self):
+        """구간 계측 요약 출력"""
+        summary = self.summary()
+        counters = summary["counters"]
+        title = f"[실행 계측] {self.label}" if self.label else "[실행 계측]"
+        print(f"\n{title} 총 {summary['wall_seconds']:.2f}초, 최대 메모리 {summary['peak_memory_mb'] or '-'}MB")
+
+        names = [name for name in PHASE_LABELS if name in summary["phases"]]
+        names += [name for name in summary["phases"] if name not in PHASE_LABELS]
+        for name in names:
+            phase = summary["phases"][name]
+            print(f"  - {PHASE_LABELS.get(name, name)}: {phase['seconds']:.2f}초 ({phase['calls']}회)")
+
+        if counters.get("api_requests") or counters.get("api_retries"):
+            print(
+                f"  - API 요청 {counters.get('api_requests', 0)}회, 재시도 {counters.get('api_retries', 0)}회, "
+                f"송신 {counters.get('api_bytes_out', 0):,} / 수신 {counters.get('api_bytes_in', 0):,} bytes"
+            )
+        if counters.get("db_requests"):
+            print(
+                f"  - DB 요청 {counters.get('db_requests', 0)}회, "
+                f"송신 {counters.get('db_bytes_out', 0):,} / 수신 {counters.get('db_bytes_in', 0):,} bytes"
+            )
+
+
+# 프로세스 전체 누적값과 현재 컨텍스트의 실행 구간
+_metrics = RunMetrics()
+_current_scope = contextvars.ContextVar("metrics_scope", default=None)
+
+
+def get_metrics():
+    """현재 실행 구간의 RunMetrics 반환 (구간 밖이면 프로세스 전체 누적값)"""
+    scope = _current_scope.get()
+    return scope.metrics if scope else _metrics
+
+
+def phase(name):
+    """현재 실행 구간에 단계 시간을 누적하는 컨텍스트 매니저"""
+    return get_metrics().phase(name)
+
+
+def start_scope(label=None):
+    """현재 컨텍스트의 실행 구간 시작 (구간 안에서 시작하면 하위 구간)"""
+    scope = MetricsScope(get_metrics(), label)
+    scope.token = _current_scope.set(scope)
+    return scope
+
+
+def end_scope():
+    """현재 컨텍스트의 실행 구간 종료 (종료된 구간 반환)"""
+    scope = _current_scope.get()
+    if scope is not None:
+        _current_scope.reset(scope.token)
+    return scope
+
+
+def current_summary():
+    """현재 컨텍스트 실행 구간의 계측 요약 (구간 밖이면 None)"""
+    scope = _current_scope.get()
+    return scope.summary() if scope else None
+
+
+def submit_in_scope(executor, func, *args, **kwargs):
+    """현재 실행 구간을 유지한 채 executor에 작업 제출 (작업 스레드의 계측값이 같은 구간에 누적)"""
+    return executor.submit(contextvars.copy_context().run, func, *args, **kwargs)
+
+
+def map_in_scope(executor, func, *iterables):
+    """executor.map과 같지만 현재 실행 구간을 유지 (결과 목록 반환)"""
+    futures = [submit_in_scope(executor, func, *args) for args in zip(*iterables)]
+    return [future.result() for future in futures]
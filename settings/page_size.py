@@ -0,0 +1,100 @@
+# numOfRows 자동 조정
+# 엔드포인트별로 안정적으로 허용되는 가장 큰 페이지 크기를 찾아 캐시한다.
+# 큰 페이지가 오류를 내거나 잘린 응답을 주면 다음 후보 크기로 내려간다.
+
+import threading
+from datetime import datetime, timedelta
+
+from settings.config import (
+    AUTO_PAGE_SIZE, COMMON_PARAMS, PAGE_SIZE_CACHE_PATH, PAGE_SIZE_CACHE_TTL_DAYS, PAGE_SIZE_CANDIDATES
+)
+from settings.state_store import StateStore
+
+
+class PageSizeTuner:
+    """엔드포인트별 최대 페이지 크기 탐색 및 캐시 (sync_state 테이블 또는 파일)"""
+
+    def __init__(self, cache_path=PAGE_SIZE_CACHE_PATH, candidates=None, ttl_days=PAGE_SIZE_CACHE_TTL_DAYS):
+        self.store = StateStore("page_sizes", cache_path)
+        self.default_size = int(COMMON_PARAMS["numOfRows"])
+        # 큰 크기부터 시도하고 마지막은 항상 기본 크기
+        sizes = set(candidates or PAGE_SIZE_CANDIDATES)
+        sizes.add(self.default_size)
+        self.candidate_sizes = sorted(sizes, reverse=True)
+        self.ttl = timedelta(days=ttl_days)
+        self.lock = threading.Lock()
+        self.cache = self.load()
+
+    def load(self):
+        """캐시 로드"""
+        return self.store.load()
+
+    def save(self, url):
+        """캐시 저장 (lock 보유 상태에서 호출, 바뀐 엔드포인트 항목만 DB에 반영)"""
+        self.store.save(self.cache, [url])
+
+    def candidates(self, url):
+        """
+        시도할 페이지 크기 목록 (큰 순서)
+
+        캐시가 유효하면 캐시된 크기부터, 만료되었으면 전체 후보를 다시 탐색한다.
+        """
+        with self.lock:
+            entry = self.cache.get(url)
+
+        if entry:
+            checked_at = datetime.fromisoformat(entry["checked_at"])
+            if datetime.now() - checked_at < self.ttl:
+                return [size for size in self.candidate_sizes if size <= entry["size"]]
+
+        return list(self.candidate_sizes)
+
+    def record(self, url, size):
+        """정상 동작한 페이지 크기 기록"""
+        with self.lock:
+            entry = self.cache.get(url)
+            if entry and entry["size"] == size:
+                return
+            self.cache[url] = {"size": size, "checked_at": datetime.now().isoformat()}
+            self.save(url)
+
+    def record_failure(self, url, size):
+        """실패한 페이지 크기 기록 - 다음부터 그보다 작은 크기부터 시도"""
+        smaller = [candidate for candidate in self.candidate_sizes if candidate < size]
+        if smaller:
+            self.record(url, smaller[0])
+
+    @staticmethod
+    def is_truncated(size, total_count, item_count, page_no=1, last_page=1):
+        """응답이 요청 크기보다 적게 잘렸는지 확인 (마지막 페이지 제외)"""
+        if page_no < last_page:
+            return item_count < size
+        expected = total_count - (page_no - 1) * size
+        return item_count < min(size, expected)
+
+
+# 프로세스 전체에서 공유하는 페이지 크기 튜너
+_tuner = None
+_tuner_lock = threading.Lock()
+
+
+def get_page_size_tuner():
+    """공유 PageSizeTuner 인스턴스 반환"""
+    global _tuner
+    with _tuner_lock:
+        if _tuner is None:
+            _tuner = PageSizeTuner()
+        return _tuner
+
+
+def get_page_size_candidates(url, base_params, page_size=None):
+    """
+    fetch_all_pages가 시도할 페이지 크기 목록
+
+    page_size를 지정하거나 AUTO_PAGE_SIZE가 꺼져 있으면 해당 크기만 사용한다.
+    """
+    if page_size:
+        return [int(page_size)]
+    if not AUTO_PAGE_SIZE:
+        return [int(base_params.get("numOfRows") or COMMON_PARAMS["numOfRows"])]
+    return get_page_size_tuner().candidates(url)
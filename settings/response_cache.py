@@ -0,0 +1,180 @@
+# 참조 코드 엔드포인트 응답 디스크 캐시
+# /areaCode1, /areaCode2, /categoryCode2, /lclsSystmCode2, /ldongCode2 처럼
+# 거의 바뀌지 않는 응답을 엔드포인트별 TTL 동안 재사용하여 일일 호출량을 아낀다.
+# - 캐시 키: URL + 정규화된 파라미터 (serviceKey 제외)
+# - 전체 크기 상한 초과 시 가장 오래 사용되지 않은 항목부터 삭제 (LRU)
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from settings.config import (
+    RESPONSE_CACHE_DIR, RESPONSE_CACHE_ENABLED, RESPONSE_CACHE_MAX_BYTES, RESPONSE_CACHE_TTL_HOURS
+)
+
+# 엔드포인트별 캐시 유지 시간 (시간 단위, 목록에 없는 엔드포인트는 캐시하지 않음)
+ENDPOINT_TTL_HOURS = {
+    "areaCode1": RESPONSE_CACHE_TTL_HOURS,
+    "areaCode2": RESPONSE_CACHE_TTL_HOURS,
+    "categoryCode2": RESPONSE_CACHE_TTL_HOURS,
+    "lclsSystmCode2": RESPONSE_CACHE_TTL_HOURS,
+    "ldongCode2": RESPONSE_CACHE_TTL_HOURS
+}
+
+# 캐시 키에서 제외할 파라미터 (대소문자 무시)
+EXCLUDED_KEY_PARAMS = {"servicekey"}
+
+
+class ResponseCache:
+    """엔드포인트 + 파라미터 기준 JSON 응답 캐시"""
+
+    def __init__(self, cache_dir=RESPONSE_CACHE_DIR, max_bytes=RESPONSE_CACHE_MAX_BYTES,
+                 ttl_hours=None, enabled=RESPONSE_CACHE_ENABLED):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttl_hours = ENDPOINT_TTL_HOURS if ttl_hours is None else ttl_hours
+        self.enabled = enabled
+        # bypass: 캐시를 읽지 않고 항상 API를 호출하되 새 응답으로 캐시는 갱신
+        self.bypass = False
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def incr(self, name, amount=1):
+        with self.lock:
+            self.stats[name] += amount
+
+    def get_ttl_seconds(self, url):
+        """URL의 엔드포인트에 해당하는 TTL(초), 캐시 대상이 아니면 None"""
+        endpoint_name = url.rstrip("/").rsplit("/", 1)[-1]
+        ttl_hours = self.ttl_hours.get(endpoint_name)
+        return ttl_hours * 3600 if ttl_hours else None
+
+    @staticmethod
+    def make_key(url, params):
+        """URL과 정규화된 파라미터로 캐시 키 생성 (serviceKey 제외)"""
+        normalized = sorted(
+            (str(key), str(value)) for key, value in params.items()
+            if value is not None and str(key).lower() not in EXCLUDED_KEY_PARAMS
+        )
+        raw = json.dumps({"url": url, "params": normalized}, ensure_ascii=False)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, url, params):
+        """
+        캐시된 응답 조회
+
+        Returns:
+            dict: 캐시된 JSON 응답 (없거나 만료되었거나 캐시 대상이 아니면 None)
+        """
+        if not self.enabled or self.bypass:
+            return None
+
+        ttl = self.get_ttl_seconds(url)
+        if not ttl:
+            return None
+
+        path = self.get_path(self.make_key(url, params))
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.incr("misses")
+            return None
+
+        if time.time() - entry.get("stored_at", 0) > ttl:
+            self.incr("misses")
+            return None
+
+        # LRU 순서 갱신을 위해 접근 시각 기록
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self.incr("hits")
+        return entry["data"]
+
+    def put(self, url, params, data):
+        """정상 응답 저장 (캐시 대상 엔드포인트만)"""
+        if not self.enabled or not self.get_ttl_seconds(url):
+            return
+
+        key = self.make_key(url, params)
+        path = self.get_path(key)
+        entry = {"url": url, "stored_at": time.time(), "data": data}
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+            self.incr("stores")
+        except OSError as e:
+            print(f"[경고] 응답 캐시 저장 실패: {str(e)}")
+            return
+
+        self.evict()
+
+    def evict(self):
+        """전체 크기가 상한을 넘으면 오래 사용되지 않은 항목부터 삭제"""
+        with self.lock:
+            try:
+                entries = []
+                for name in os.listdir(self.cache_dir):
+                    if not name.endswith(".json"):
+                        continue
+                    path = os.path.join(self.cache_dir, name)
+                    stat = os.stat(path)
+                    entries.append((stat.st_mtime, stat.st_size, path))
+            except OSError:
+                return
+
+            total_size = sum(size for _, size, _ in entries)
+            if total_size <= self.max_bytes:
+                return
+
+            for _, size, path in sorted(entries):
+                if total_size <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total_size -= size
+                    self.stats["evictions"] += 1
+                except OSError:
+                    pass
+
+    def print_stats(self):
+        """실행 통계 출력"""
+        with self.lock:
+            stats = dict(self.stats)
+        if not any(stats.values()):
+            return
+        print(
+            f"[응답 캐시] 적중 {stats['hits']}회, 미적중 {stats['misses']}회, "
+            f"저장 {stats['stores']}회, 삭제 {stats['evictions']}회"
+        )
+
+
+# 프로세스 전체에서 공유하는 응답 캐시
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """공유 ResponseCache 인스턴스 반환"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
+
+
+def set_cache_bypass(bypass=True):
+    """--no-cache: 캐시를 읽지 않고 API를 직접 호출 (응답으로 캐시는 갱신)"""
+    get_response_cache().bypass = bypass
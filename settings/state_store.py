@@ -0,0 +1,101 @@
+# 실행 간 상태 저장소 (월별 적재 기록, 지역 크기 캐시, 페이지 크기 캐시)
+# namespace별 {key: value} 딕셔너리를 Supabase sync_state 테이블의 (namespace, key) 행 또는 로컬 JSON 파일에 저장한다.
+# - 컨테이너(docker run --rm)에서는 로컬 파일이 실행마다 사라지므로 Supabase 설정이 있으면 DB에 보관한다.
+# - DB에는 바뀐 key만 업서트하여 동시에 실행한 작업이 서로의 항목을 덮어쓰지 않는다.
+# - sync_state 테이블이 없거나(migrate_sync_state.sql 미적용) 조회에 실패하면 로컬 파일을 사용한다.
+
+import json
+import os
+
+from settings.config import STATE_STORE, SUPABASE_API_KEY, SUPABASE_BASE_URL
+
+# 상태 테이블과 한 번에 조회할 행 수
+STATE_TABLE = "sync_state"
+STATE_PAGE_SIZE = 1000
+
+
+class StateStore:
+    """namespace별 {key: value} 상태 저장 (Supabase sync_state 테이블 또는 로컬 JSON 파일)"""
+
+    def __init__(self, namespace, path, backend=STATE_STORE):
+        self.namespace = namespace
+        self.path = path
+        if backend == "auto":
+            backend = "supabase" if SUPABASE_BASE_URL and SUPABASE_API_KEY else "file"
+        self.backend = backend
+
+    def load(self):
+        """상태 로드 (DB 조회에 실패하면 이번 실행에서는 로컬 파일 사용)"""
+        if self.backend == "supabase":
+            try:
+                return self.load_db()
+            except Exception as e:
+                print(f"[경고] {self.namespace} 상태 조회 실패, 로컬 파일 사용 (migrate_sync_state.sql 적용 여부 확인): {str(e)}")
+                self.backend = "file"
+        return self.load_file()
+
+    def save(self, data, keys=None):
+        """
+        상태 저장 (실패해도 예외를 던지지 않음)
+
+        Args:
+            data: 전체 상태 {key: value}
+            keys: DB에 업서트할 key 목록 (None이면 전체, 로컬 파일은 항상 전체 저장)
+        """
+        if self.backend == "supabase":
+            try:
+                self.save_db(data, keys)
+                return
+            except Exception as e:
+                print(f"[경고] {self.namespace} 상태 DB 저장 실패, 로컬 파일에 저장: {str(e)}")
+        self.save_file(data)
+
+    def get_client(self):
+        from batch.supabase_areabased import get_supabase_client
+        return get_supabase_client()
+
+    def load_db(self):
+        client = self.get_client()
+        state = {}
+        offset = 0
+        while True:
+            response = client.table(STATE_TABLE)\
+                .select("key, value")\
+                .eq("namespace", self.namespace)\
+                .order("key")\
+                .range(offset, offset + STATE_PAGE_SIZE - 1)\
+                .execute()
+            rows = response.data or []
+            state.update({row["key"]: row["value"] for row in rows})
+            if len(rows) < STATE_PAGE_SIZE:
+                return state
+            offset += STATE_PAGE_SIZE
+
+    def save_db(self, data, keys=None):
+        from batch.supabase_areabased import DB_NOW
+
+        keys = list(data) if keys is None else [key for key in keys if key in data]
+        if not keys:
+            return
+        rows = [
+            {"namespace": self.namespace, "key": key, "value": data[key], "updated_at": DB_NOW}
+            for key in keys
+        ]
+        self.get_client().table(STATE_TABLE).upsert(rows, on_conflict="namespace,key").execute()
+
+    def load_file(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_file(self, data):
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[경고] {self.namespace} 상태 파일 저장 실패: {str(e)}")
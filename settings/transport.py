@@ -0,0 +1,280 @@
+# 관광 API 공용 HTTP 전송 계층
+# - 커넥션 풀(keep-alive) 재사용
+# - 요청별 타임아웃
+# - 지수 백오프 + 지터 재시도 (5xx, 연결 오류, data.go.kr 응답 본문 오류 코드)
+# - 커넥션 생성/재사용 횟수 집계
+
+import json
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from settings.response_cache import get_response_cache
+from settings.metrics import get_metrics
+from settings.config import (
+    FETCH_RPS, HOST_CONCURRENCY, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT,
+    HTTP_MAX_RETRIES, HTTP_BACKOFF_BASE, HTTP_BACKOFF_MAX
+)
+
+# data.go.kr 정상 응답 코드
+SUCCESS_RESULT_CODES = {"00", "0000"}
+
+# 재시도 가능한 data.go.kr 오류 코드
+# 01: APPLICATION_ERROR, 02: DB_ERROR, 04: HTTP_ERROR, 05: SERVICETIME_OUT, 99: UNKNOWN_ERROR
+RETRYABLE_RESULT_CODES = {"01", "02", "04", "05", "99", "0001", "0002", "0004", "0005", "0099"}
+
+# 페이지 크기(numOfRows)가 원인일 수 있는 data.go.kr 오류 코드 (더 작은 페이지로 다시 수집)
+# 10: INVALID_REQUEST_PARAMETER_ERROR (numOfRows 상한 초과 등)
+PAGE_SIZE_RESULT_CODES = {"10", "0010"}
+
+# 재시도 가능한 HTTP 상태 코드
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TourApiError(Exception):
+    """관광 API 호출 실패 (size_related: 페이지 크기 때문일 수 있는 오류 - 잘린 응답 본문 또는 PAGE_SIZE_RESULT_CODES)"""
+
+    def __init__(self, message, retryable=False, size_related=False):
+        super().__init__(message)
+        self.retryable = retryable
+        self.size_related = size_related
+
+
+def extract_xml_code(text):
+    """XML 오류 응답에서 returnReasonCode 추출"""
+    for tag in ("returnReasonCode", "resultCode"):
+        start = text.find(f"<{tag}>")
+        end = text.find(f"</{tag}>")
+        if start != -1 and end != -1:
+            return text[start + len(tag) + 2:end].strip()
+    return None
+
+
+def check_api_response(status_code, text):
+    """
+    HTTP 상태 및 data.go.kr 응답 본문 오류 코드 확인 (동기/비동기 엔진 공용)
+
+    Returns:
+        dict: 파싱된 JSON 응답
+
+    Raises:
+        TourApiError: 오류 응답인 경우
+    """
+    if status_code != 200:
+        raise TourApiError(
+            f"HTTP {status_code} 오류",
+            retryable=status_code in RETRYABLE_STATUS_CODES
+        )
+
+    try:
+        data = json.loads(text)
+    except ValueError:
+        # 오류 시 data.go.kr은 _type=json 요청에도 XML을 반환 (코드가 없으면 중간에 잘린 응답 본문)
+        code = extract_xml_code(text)
+        raise TourApiError(
+            f"API 오류 응답 (코드 {code or '알 수 없음'})",
+            retryable=code is None or code in RETRYABLE_RESULT_CODES,
+            size_related=code is None or code in PAGE_SIZE_RESULT_CODES
+        )
+
+    header = data.get("response", {}).get("header", {}) if isinstance(data, dict) else {}
+    result_code = str(header.get("resultCode", "0000"))
+    if result_code not in SUCCESS_RESULT_CODES:
+        raise TourApiError(
+            f"API 오류 응답 (코드 {result_code}: {header.get('resultMsg', '')})",
+            retryable=result_code in RETRYABLE_RESULT_CODES,
+            size_related=result_code in PAGE_SIZE_RESULT_CODES
+        )
+
+    return data
+
+
+def backoff_delay(attempt):
+    """지수 백오프 + full jitter 대기 시간"""
+    return random.uniform(0, min(HTTP_BACKOFF_MAX, HTTP_BACKOFF_BASE * (2 ** attempt)))
+
+
+class RateLimiter:
+    """초당 요청 수 상한을 지키는 스레드 안전 리미터"""
+
+    def __init__(self, rate_per_sec):
+        self.interval = 1.0 / rate_per_sec if rate_per_sec and rate_per_sec > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_time = 0.0
+
+    def reserve(self):
+        """다음 요청 슬롯을 예약하고 대기해야 할 시간(초) 반환"""
+        if not self.interval:
+            return 0.0
+        with self.lock:
+            now = time.monotonic()
+            scheduled = max(now, self.next_time)
+            self.next_time = scheduled + self.interval
+        return scheduled - now
+
+    def wait(self):
+        """다음 요청 가능 시점까지 대기"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class TransportStats:
+    """요청/재시도/커넥션 통계 (스레드 안전, 실행 계측에도 api_* 카운터로 누적)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters = {
+            "requests": 0,
+            "retries": 0,
+            "failures": 0,
+            "connections_opened": 0,
+            "bytes_in": 0,
+            "bytes_out": 0
+        }
+
+    def incr(self, name, amount=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+        get_metrics().incr(f"api_{name}", amount)
+
+    def summary(self):
+        with self.lock:
+            summary = dict(self.counters)
+        summary["connections_reused"] = max(0, summary["requests"] - summary["connections_opened"])
+        return summary
+
+
+def _counting_pool_class(base_class, stats):
+    """새 커넥션 생성 시 카운트하는 커넥션 풀 클래스 생성"""
+
+    class CountingConnectionPool(base_class):
+        def _new_conn(self):
+            stats.incr("connections_opened")
+            return super()._new_conn()
+
+    return CountingConnectionPool
+
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """커넥션 생성 횟수를 집계하는 HTTPAdapter"""
+
+    def __init__(self, stats, **kwargs):
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self.stats),
+            "https": _counting_pool_class(HTTPSConnectionPool, self.stats)
+        }
+
+
+class TourApiTransport:
+    """GreenTourAPI, BarrierFreeAPI, BaseTourAPI가 공유하는 HTTP 전송 계층"""
+
+    def __init__(self, timeout=None, max_retries=None, rate_per_sec=None, host_concurrency=None):
+        self.timeout = timeout or (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+        self.max_retries = HTTP_MAX_RETRIES if max_retries is None else max_retries
+        self.host_concurrency = host_concurrency or HOST_CONCURRENCY
+        self.rate_limiter = RateLimiter(FETCH_RPS if rate_per_sec is None else rate_per_sec)
+        self.stats = TransportStats()
+
+        self.session = requests.Session()
+        adapter = CountingHTTPAdapter(
+            self.stats,
+            pool_connections=4,
+            pool_maxsize=self.host_concurrency
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._host_semaphores = {}
+        self._host_semaphores_lock = threading.Lock()
+
+    def host_slot(self, url):
+        """URL의 호스트에 해당하는 동시 요청 세마포어 반환"""
+        host = urlparse(url).netloc
+        with self._host_semaphores_lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.BoundedSemaphore(self.host_concurrency)
+            return self._host_semaphores[host]
+
+    def get_json(self, url, params):
+        """
+        GET 요청 후 JSON 응답 반환 (재시도 포함, 참조 코드 엔드포인트는 디스크 캐시 사용)
+
+        Returns:
+            dict: 파싱된 JSON 응답
+
+        Raises:
+            TourApiError: 재시도 후에도 실패한 경우
+        """
+        cache = get_response_cache()
+        cached = cache.get(url, params)
+        if cached is not None:
+            return cached
+
+        last_error = None
+
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                self.stats.incr("retries")
+                time.sleep(backoff_delay(attempt - 1))
+
+            try:
+                with self.host_slot(url):
+                    self.rate_limiter.wait()
+                    self.stats.incr("requests")
+                    response = self.session.get(url, params=params, timeout=self.timeout)
+                    content = response.content
+                # GET 요청이므로 송신량은 요청 URL(쿼리 포함) 길이로 집계
+                self.stats.incr("bytes_out", len(response.request.url))
+                self.stats.incr("bytes_in", len(content))
+                data = self.parse_response(response)
+                cache.put(url, params, data)
+                return data
+            except TourApiError as e:
+                last_error = e
+                if not e.retryable:
+                    break
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                last_error = TourApiError(f"연결 오류: {str(e)}", retryable=True)
+
+        self.stats.incr("failures")
+        raise last_error
+
+    def parse_response(self, response):
+        """HTTP 상태 및 data.go.kr 응답 본문 오류 코드 확인"""
+        return check_api_response(response.status_code, response.text)
+
+    def print_stats(self):
+        """실행 통계 출력"""
+        stats = self.stats.summary()
+        if not stats["requests"]:
+            return
+        print(
+            f"[HTTP 통계] 요청 {stats['requests']}회, 재시도 {stats['retries']}회, 실패 {stats['failures']}회, "
+            f"커넥션 생성 {stats['connections_opened']}회 / 재사용 {stats['connections_reused']}회, "
+            f"송신 {stats['bytes_out']:,} / 수신 {stats['bytes_in']:,} bytes"
+        )
+
+
+# 프로세스 전체에서 공유하는 전송 계층
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport():
+    """공유 TourApiTransport 인스턴스 반환"""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = TourApiTransport()
+        return _transport
@@ -1,8 +1,109 @@
 #!/usr/bin/env python3
 from sync.hash_utils import calculate_data_hash
+from settings.config import AREABASED_RAW_DATA
+
+
+class AreaBasedRecord:
+    """
+    매핑된 areaBasedList 행
+
+    행마다 컬럼 수만큼의 dict를 만들지 않도록 값을 __slots__에 보관하고, DB로 보낼 때(업서트 배치 단위)만
+    to_row()로 dict로 변환한다. 동기화 코드에서는 dict처럼 record['컬럼'], record.get()으로 읽고
+    record['updated_at'] = ...으로 쓸 수 있다.
+    """
+    __slots__ = ("data_hash", "raw_data", "updated_at")
+    # DB 컬럼 (data_hash, raw_data 제외, 행 dict의 키 순서)
+    columns = ()
+    # API 값을 변환 없이 그대로 컬럼에 옮기는 필드 (AREABASED_RAW_DATA=extra이면 raw_data에서 제외)
+    verbatim_fields = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.fields = frozenset(cls.columns + AreaBasedRecord.__slots__)
+
+    def __init__(self, data_hash=None, raw_data=None, **values):
+        self.data_hash = data_hash
+        self.raw_data = raw_data
+        self.updated_at = None
+        for column in self.columns:
+            setattr(self, column, values.get(column))
+
+    def __getitem__(self, key):
+        if key not in self.fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.fields:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.fields else default
+
+    def to_row(self, raw_data_mode=None):
+        """
+        DB 전송용 dict로 변환 (updated_at은 값이 있을 때만 포함)
+
+        raw_data_mode가 extra이면 raw_data에서 verbatim_fields를 뺀다.
+        (원본 item = 해당 컬럼 값 + raw_data, data_hash는 항상 원본 item 전체로 계산)
+        """
+        row = {column: getattr(self, column) for column in self.columns}
+        row['data_hash'] = self.data_hash
+        raw_data = self.raw_data
+        if (raw_data_mode or AREABASED_RAW_DATA) == "extra" and raw_data is not None:
+            raw_data = {field: value for field, value in raw_data.items() if field not in self.verbatim_fields}
+        row['raw_data'] = raw_data
+        if self.updated_at is not None:
+            row['updated_at'] = self.updated_at
+        return row
+
+
+class GreenTourRecord(AreaBasedRecord):
+    """greentour_areabased 행"""
+    __slots__ = columns = (
+        'contentid', 'areacode', 'sigungucode', 'title', 'addr', 'tel', 'telname',
+        'mainimage', 'summary', 'createdtime', 'modifiedtime', 'cpyrhtdivcd'
+    )
+    verbatim_fields = frozenset((
+        'areacode', 'sigungucode', 'title', 'addr', 'tel', 'telname',
+        'mainimage', 'summary', 'createdtime', 'modifiedtime', 'cpyrhtDivCd'
+    ))
+
+
+class BarrierFreeRecord(AreaBasedRecord):
+    """barrier_free_areabased 행"""
+    __slots__ = columns = (
+        'contentid', 'contenttypeid', 'areacode', 'sigungucode', 'cat1', 'cat2', 'cat3',
+        'title', 'addr1', 'addr2', 'tel', 'firstimage', 'firstimage2', 'mapx', 'mapy', 'mlevel',
+        'zipcode', 'createdtime', 'modifiedtime', 'cpyrhtdivcd', 'lclssystm1', 'lclssystm2',
+        'lclssystm3', 'ldongregn_cd', 'ldongsigngu_cd'
+    )
+    verbatim_fields = frozenset((
+        'contenttypeid', 'areacode', 'sigungucode', 'cat1', 'cat2', 'cat3', 'title', 'addr1', 'addr2',
+        'tel', 'firstimage', 'firstimage2', 'zipcode', 'createdtime', 'modifiedtime', 'cpyrhtDivCd',
+        'lclsSystm1', 'lclsSystm2', 'lclsSystm3', 'lDongRegnCd', 'lDongSignguCd'
+    ))
+
+
+class BaseTourRecord(AreaBasedRecord):
+    """base_tour_areabased 행"""
+    __slots__ = columns = (
+        'hubtatscode', 'baseym', 'areacd', 'areanm', 'signgucd', 'signgunm',
+        'hubtatsname', 'hubctgrylclsnm', 'hubctgrymclsnm', 'hubrank', 'mapx', 'mapy'
+    )
+    verbatim_fields = frozenset((
+        'baseYm', 'areaCd', 'areaNm', 'signguCd', 'signguNm', 'hubTatsNm', 'hubCtgryLclsNm', 'hubCtgryMclsNm'
+    ))
+
+
+def to_rows(rows):
+    """매핑된 행 목록을 DB 전송용 dict 목록으로 변환 (dict는 그대로)"""
+    return [row.to_row() if isinstance(row, AreaBasedRecord) else row for row in rows]
+
 
 class AreaBasedMapper:
-    """areaBasedList 데이터를 DB 테이블 구조로 매핑 (소문자)"""
+    """areaBasedList 데이터를 DB 테이블 구조로 매핑 (소문자, API 타입별 AreaBasedRecord 반환)"""
     
     @staticmethod
     def get_table_name(api_type):
@@ -23,99 +124,99 @@ class AreaBasedMapper:
             return "contentid"
     
     @staticmethod
-    def map_greentour_data(item):
+    def map_greentour_data(item, data_hash=None):
         """생태관광 areaBasedList 데이터 매핑 (소문자 컬럼명)"""
         try:
-            return {
-                'contentid': str(item.get('contentid', '')),
-                'areacode': item.get('areacode'),
-                'sigungucode': item.get('sigungucode'),
-                'title': item.get('title'),
-                'addr': item.get('addr'),
-                'tel': item.get('tel'),
-                'telname': item.get('telname'),
-                'mainimage': item.get('mainimage'),
-                'summary': item.get('summary'),
-                'createdtime': item.get('createdtime'),
-                'modifiedtime': item.get('modifiedtime'),
-                'cpyrhtdivcd': item.get('cpyrhtDivCd'),  # API는 카멜케이스, DB는 소문자
-                'data_hash': calculate_data_hash(item),
-                'raw_data': item
-            }
+            return GreenTourRecord(
+                contentid=str(item.get('contentid', '')),
+                areacode=item.get('areacode'),
+                sigungucode=item.get('sigungucode'),
+                title=item.get('title'),
+                addr=item.get('addr'),
+                tel=item.get('tel'),
+                telname=item.get('telname'),
+                mainimage=item.get('mainimage'),
+                summary=item.get('summary'),
+                createdtime=item.get('createdtime'),
+                modifiedtime=item.get('modifiedtime'),
+                cpyrhtdivcd=item.get('cpyrhtDivCd'),  # API는 카멜케이스, DB는 소문자
+                data_hash=data_hash or calculate_data_hash(item),
+                raw_data=item
+            )
         except Exception as e:
             print(f"⚠️  생태관광 데이터 매핑 실패: {str(e)}")
             return None
     
     @staticmethod
-    def map_barrier_free_data(item):
+    def map_barrier_free_data(item, data_hash=None):
         """무장애 여행 areaBasedList 데이터 매핑 (소문자 컬럼명)"""
         try:
-            return {
-                'contentid': str(item.get('contentid', '')),
-                'contenttypeid': item.get('contenttypeid'),
-                'areacode': item.get('areacode'),
-                'sigungucode': item.get('sigungucode'),
-                'cat1': item.get('cat1'),
-                'cat2': item.get('cat2'),
-                'cat3': item.get('cat3'),
-                'title': item.get('title'),
-                'addr1': item.get('addr1'),
-                'addr2': item.get('addr2'),
-                'tel': item.get('tel'),
-                'firstimage': item.get('firstimage'),
-                'firstimage2': item.get('firstimage2'),
-                'mapx': float(item.get('mapx', 0)) if item.get('mapx') else None,
-                'mapy': float(item.get('mapy', 0)) if item.get('mapy') else None,
-                'mlevel': int(item.get('mlevel', 0)) if item.get('mlevel') else None,
-                'zipcode': item.get('zipcode'),
-                'createdtime': item.get('createdtime'),
-                'modifiedtime': item.get('modifiedtime'),
-                'cpyrhtdivcd': item.get('cpyrhtDivCd'),  # API는 카멜케이스, DB는 소문자
-                'lclssystm1': item.get('lclsSystm1'),    # API는 카멜케이스, DB는 소문자
-                'lclssystm2': item.get('lclsSystm2'),
-                'lclssystm3': item.get('lclsSystm3'),
-                'ldongregn_cd': item.get('lDongRegnCd'),  # API는 카멜케이스, DB는 소문자
-                'ldongsigngu_cd': item.get('lDongSignguCd'),
-                'data_hash': calculate_data_hash(item),
-                'raw_data': item
-            }
+            return BarrierFreeRecord(
+                contentid=str(item.get('contentid', '')),
+                contenttypeid=item.get('contenttypeid'),
+                areacode=item.get('areacode'),
+                sigungucode=item.get('sigungucode'),
+                cat1=item.get('cat1'),
+                cat2=item.get('cat2'),
+                cat3=item.get('cat3'),
+                title=item.get('title'),
+                addr1=item.get('addr1'),
+                addr2=item.get('addr2'),
+                tel=item.get('tel'),
+                firstimage=item.get('firstimage'),
+                firstimage2=item.get('firstimage2'),
+                mapx=float(item.get('mapx', 0)) if item.get('mapx') else None,
+                mapy=float(item.get('mapy', 0)) if item.get('mapy') else None,
+                mlevel=int(item.get('mlevel', 0)) if item.get('mlevel') else None,
+                zipcode=item.get('zipcode'),
+                createdtime=item.get('createdtime'),
+                modifiedtime=item.get('modifiedtime'),
+                cpyrhtdivcd=item.get('cpyrhtDivCd'),  # API는 카멜케이스, DB는 소문자
+                lclssystm1=item.get('lclsSystm1'),    # API는 카멜케이스, DB는 소문자
+                lclssystm2=item.get('lclsSystm2'),
+                lclssystm3=item.get('lclsSystm3'),
+                ldongregn_cd=item.get('lDongRegnCd'),  # API는 카멜케이스, DB는 소문자
+                ldongsigngu_cd=item.get('lDongSignguCd'),
+                data_hash=data_hash or calculate_data_hash(item),
+                raw_data=item
+            )
         except Exception as e:
             print(f"⚠️  무장애 여행 데이터 매핑 실패: {str(e)}")
             return None
     
     @staticmethod
-    def map_base_tour_data(item):
+    def map_base_tour_data(item, data_hash=None):
         """중심 관광지 areaBasedList 데이터 매핑 (소문자 컬럼명)"""
         try:
-            return {
-                'hubtatscode': str(item.get('hubTatsCd', '')),    # API는 카멜케이스, DB는 소문자
-                'baseym': item.get('baseYm'),                     # API는 카멜케이스, DB는 소문자
-                'areacd': item.get('areaCd'),
-                'areanm': item.get('areaNm'),
-                'signgucd': item.get('signguCd'),
-                'signgunm': item.get('signguNm'),
-                'hubtatsname': item.get('hubTatsNm'),
-                'hubctgrylclsnm': item.get('hubCtgryLclsNm'),
-                'hubctgrymclsnm': item.get('hubCtgryMclsNm'),
-                'hubrank': int(item.get('hubRank', 0)) if item.get('hubRank') else None,
-                'mapx': float(item.get('mapX', 0)) if item.get('mapX') else None,
-                'mapy': float(item.get('mapY', 0)) if item.get('mapY') else None,
-                'data_hash': calculate_data_hash(item),
-                'raw_data': item
-            }
+            return BaseTourRecord(
+                hubtatscode=str(item.get('hubTatsCd', '')),    # API는 카멜케이스, DB는 소문자
+                baseym=item.get('baseYm'),                     # API는 카멜케이스, DB는 소문자
+                areacd=item.get('areaCd'),
+                areanm=item.get('areaNm'),
+                signgucd=item.get('signguCd'),
+                signgunm=item.get('signguNm'),
+                hubtatsname=item.get('hubTatsNm'),
+                hubctgrylclsnm=item.get('hubCtgryLclsNm'),
+                hubctgrymclsnm=item.get('hubCtgryMclsNm'),
+                hubrank=int(item.get('hubRank', 0)) if item.get('hubRank') else None,
+                mapx=float(item.get('mapX', 0)) if item.get('mapX') else None,
+                mapy=float(item.get('mapY', 0)) if item.get('mapY') else None,
+                data_hash=data_hash or calculate_data_hash(item),
+                raw_data=item
+            )
         except Exception as e:
             print(f"⚠️  중심 관광지 데이터 매핑 실패: {str(e)}")
             return None
     
     @staticmethod
-    def map_item_data(api_type, item):
-        """API 타입별 데이터 매핑 통합 메서드"""
+    def map_item_data(api_type, item, data_hash=None):
+        """API 타입별 데이터 매핑 통합 메서드 (data_hash를 미리 계산했으면 전달)"""
         if api_type == "greentour":
-            return AreaBasedMapper.map_greentour_data(item)
+            return AreaBasedMapper.map_greentour_data(item, data_hash)
         elif api_type == "barrier_free":
-            return AreaBasedMapper.map_barrier_free_data(item)
+            return AreaBasedMapper.map_barrier_free_data(item, data_hash)
         elif api_type == "base_tour":
-            return AreaBasedMapper.map_base_tour_data(item)
+            return AreaBasedMapper.map_base_tour_data(item, data_hash)
         else:
             print(f"❌ 알 수 없는 API 타입: {api_type}")
             return None
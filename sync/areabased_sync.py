@@ -2,25 +2,42 @@
 import json
 import os
 from datetime import datetime
-from batch.supabase_areabased import SupabaseAreaBasedHandler
-from sync.areabased_mapper import AreaBasedMapper
+from batch.pg_copy import get_pg_writer
+from batch.supabase_areabased import DB_NOW, SupabaseAreaBasedHandler
+from sync.areabased_mapper import AreaBasedMapper, to_rows
+from sync.hash_utils import calculate_data_hashes, hashes_match
+from sync.key_index import get_key_index
+from settings.config import SYNC_CHUNK_SIZE, PageFetchError
+from settings.metrics import current_summary, get_metrics, phase
+
+def iter_chunks(items, chunk_size):
+    """item 이터레이터를 chunk_size 크기의 리스트로 묶어 yield"""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
 class AreaBasedSynchronizer:
     def __init__(self):
         self.supabase = SupabaseAreaBasedHandler()
         self.mapper = AreaBasedMapper()
+        self.key_index = None
+        # 이번 동기화에서 DB에 반영한 키 (종료 시 로컬 키 인덱스에 기록)
+        self.changed_keys = set()
+        # 반영하지 못한 item (매핑 실패는 원본 item, 키 생성/업서트 실패는 매핑된 행)
+        self.failed_items = []
     
     def sync_from_file(self, file_path, api_type):
-        """파일에서 데이터를 읽어 DB에 동기화"""
+        """파일에서 데이터를 읽어 DB에 동기화 (sync_items 래퍼)"""
         start_time = datetime.now()
         
         try:
             print(f"🔄 {api_type} 동기화 시작: {file_path}")
             
-            # Supabase 연결 테스트
-            if not self.supabase.test_connection():
-                return False
-            
             # 파일 읽기
             print("📖 파일 읽는 중...")
             with open(file_path, 'r', encoding='utf-8') as f:
@@ -33,71 +50,220 @@ class AreaBasedSynchronizer:
                 print(f"❌ {file_path}에서 데이터를 찾을 수 없습니다.")
                 return False
             
+        except Exception as e:
+            return self.fail_sync(api_type, e, start_time)
+        
+        return self.sync_items(items, api_type)
+    
+    def sync_items(self, items, api_type, failures=None):
+        """
+        메모리의 item 리스트(또는 item 이터레이터)를 바로 DB에 동기화
+        
+        리스트는 전체를 매핑한 뒤 한 번에 처리하고, 이터레이터는 sync_stream으로
+        SYNC_CHUNK_SIZE 단위로 나누어 처리한다.
+        failures(수집 실패한 지역 단위 {unit.key: 오류})가 있으면 동기화 로그에 부분 완료(PARTIAL)로 기록한다.
+        """
+        if not isinstance(items, (list, tuple)):
+            return self.sync_stream(iter_chunks(items, SYNC_CHUNK_SIZE), api_type)
+        
+        start_time = datetime.now()
+        
+        try:
+            print(f"🔄 {api_type} 동기화 시작: {len(items)}개")
+            
+            # Supabase 연결 테스트
+            if not self.supabase.test_connection():
+                return False
+            
+            if not items:
+                print(f"❌ {api_type} 동기화할 데이터가 없습니다.")
+                return False
+            
             print(f"📊 추출된 데이터: {len(items)}개")
             
             # 데이터 매핑
             print("🔄 데이터 매핑 중...")
             mapped_items = []
             failed_count = 0
+            with phase("hash"):
+                data_hashes = calculate_data_hashes(items)
             
-            for i, item in enumerate(items):
-                mapped_item = self.mapper.map_item_data(api_type, item)
-                if mapped_item:
-                    mapped_items.append(mapped_item)
-                else:
-                    failed_count += 1
-                
-                # 진행 상황 표시 (100개마다)
-                if (i + 1) % 100 == 0:
-                    print(f"  📝 매핑 진행: {i + 1}/{len(items)}")
+            with phase("map"):
+                for i, item in enumerate(items):
+                    mapped_item = self.mapper.map_item_data(api_type, item, data_hashes[i])
+                    if mapped_item:
+                        mapped_items.append(mapped_item)
+                    else:
+                        failed_count += 1
+                        self.failed_items.append(item)
+                    
+                    # 진행 상황 표시 (100개마다)
+                    if (i + 1) % 100 == 0:
+                        print(f"  📝 매핑 진행: {i + 1}/{len(items)}")
             
             if failed_count > 0:
                 print(f"⚠️  매핑 실패: {failed_count}개")
             
             print(f"✅ 매핑 완료: {len(mapped_items)}개")
+            get_metrics().incr("items_mapped", len(mapped_items))
             
             # DB 동기화
             table_name = self.mapper.get_table_name(api_type)
             stats = self.process_data_changes(table_name, api_type, mapped_items)
+            if failures:
+                stats['failures'] = failures
             
-            # 실행 시간 계산
-            execution_time = (datetime.now() - start_time).total_seconds()
-            stats['execution_time'] = int(execution_time)
-            stats['success'] = True
+            return self.finish_sync(api_type, table_name, stats, start_time)
             
-            # 로그 기록
-            self.supabase.log_sync_result(api_type, table_name, stats)
+        except Exception as e:
+            return self.fail_sync(api_type, e, start_time)
+    
+    def sync_stream(self, pages, api_type, chunk_size=SYNC_CHUNK_SIZE):
+        """
+        페이지별 item 리스트 이터레이터를 받아 매핑과 DB 반영을 chunk 단위로 수행
+        
+        전체 결과를 메모리에 모으지 않으므로 최대 메모리 사용량은 결과 크기와 무관하게
+        chunk_size와 기존 데이터 키 인덱스 크기로 제한된다.
+        일부 지역 단위만 수집에 실패하면(PageFetchError.failures) 받은 페이지까지 반영하고
+        부분 완료(PARTIAL)로 기록한다.
+        """
+        start_time = datetime.now()
+        
+        try:
+            print(f"🔄 {api_type} 스트리밍 동기화 시작 (chunk {chunk_size}개)")
             
-            print(f"🎉 {api_type} 동기화 완료!")
-            print(f"   📊 총 {stats['total']}개 중 신규 {stats['new']}개, 업데이트 {stats['updated']}개")
-            print(f"   ⏱️  실행 시간: {execution_time:.2f}초")
+            # Supabase 연결 테스트
+            if not self.supabase.test_connection():
+                return False
             
-            return True
+            table_name = self.mapper.get_table_name(api_type)
+            existing_dict = self.load_existing_index(table_name, api_type)
+            stats = {'total': 0, 'new': 0, 'updated': 0}
+            failed_count = 0
+            chunk = []
+            fetch_error = None
             
-        except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
-            error_msg = str(e)
+            # 다음 페이지를 기다린 시간은 수집 대기(fetch_wait)로 기록 (수집 자체는 백그라운드에서 진행)
+            pages = iter(pages)
+            while True:
+                try:
+                    with phase("fetch_wait"):
+                        page_items = next(pages, None)
+                except PageFetchError as e:
+                    # 일부 지역 단위 실패: 성공한 단위의 페이지는 모두 받았으므로 반영 후 부분 완료로 기록
+                    if not e.failures:
+                        raise
+                    fetch_error = e
+                    break
+                if page_items is None:
+                    break
+                
+                with phase("map"):
+                    for item in page_items:
+                        mapped_item = self.mapper.map_item_data(api_type, item)
+                        if mapped_item:
+                            chunk.append(mapped_item)
+                        else:
+                            failed_count += 1
+                            self.failed_items.append(item)
+                
+                while len(chunk) >= chunk_size:
+                    self.flush_chunk(table_name, api_type, chunk[:chunk_size], existing_dict, stats)
+                    chunk = chunk[chunk_size:]
             
-            print(f"❌ {api_type} 동기화 실패: {error_msg}")
+            if chunk:
+                self.flush_chunk(table_name, api_type, chunk, existing_dict, stats)
+            self.save_key_index(table_name, api_type, existing_dict)
+            get_metrics().incr("items_mapped", stats['total'])
             
-            # 실패 로그 기록
-            try:
-                table_name = self.mapper.get_table_name(api_type)
-                error_stats = {
-                    'total': 0,
-                    'new': 0,
-                    'updated': 0,
-                    'execution_time': int(execution_time),
-                    'success': False,
-                    'error_message': error_msg
-                }
-                self.supabase.log_sync_result(api_type, table_name, error_stats)
-            except:
-                pass
-            
-            return False
-    
-    def extract_items(self, data, api_type):
+            if failed_count > 0:
+                print(f"⚠️  매핑 실패: {failed_count}개")
+            
+            if stats['total'] == 0:
+                if fetch_error:
+                    return self.fail_sync(api_type, fetch_error, start_time)
+                print(f"❌ {api_type} 스트림에서 데이터를 찾을 수 없습니다.")
+                return False
+            
+            if fetch_error:
+                stats['failures'] = fetch_error.failures
+            return self.finish_sync(api_type, table_name, stats, start_time)
+            
+        except Exception as e:
+            return self.fail_sync(api_type, e, start_time)
+    
+    def flush_chunk(self, table_name, api_type, chunk, existing_dict, stats):
+        """매핑된 chunk 하나를 DB에 반영"""
+        stats['total'] += len(chunk)
+        self.apply_changes(table_name, api_type, chunk, existing_dict, stats)
+        print(f"  📦 chunk 반영: 누적 {stats['total']}개 (신규: {stats['new']}, 업데이트: {stats['updated']})")
+    
+    def finish_sync(self, api_type, table_name, stats, start_time):
+        """
+        동기화 완료 처리 (실행 시간 계산, 로그 기록)
+        
+        stats['failures']({지역 단위 키: 오류})가 있으면 부분 완료(PARTIAL)로 기록한다.
+        받은 데이터는 모두 반영했으므로 True를 반환하며, 실행을 실패로 볼지는 호출자가 failures로 판단한다.
+        
+        Returns:
+            bool: 받은 데이터의 DB 반영 완료 여부
+        """
+        # 실행 시간 계산
+        execution_time = (datetime.now() - start_time).total_seconds()
+        stats['execution_time'] = int(execution_time)
+        stats['success'] = True
+        failures = stats.get('failures')
+        messages = []
+        if stats.get('failed'):
+            messages.append(f"{stats['failed']}개 항목 반영 실패")
+        if failures:
+            messages.append(f"지역 단위 {len(failures)}개 수집 실패 ({', '.join(sorted(failures))})")
+            stats['status'] = 'PARTIAL'
+        if messages:
+            stats['error_message'] = ", ".join(messages)
+        stats['metrics'] = current_summary()
+        
+        # 로그 기록
+        self.supabase.log_sync_result(api_type, table_name, stats)
+        
+        if failures:
+            print(f"⚠️  {api_type} 동기화 부분 완료 (지역 단위 {len(failures)}개 수집 실패)")
+        else:
+            print(f"🎉 {api_type} 동기화 완료!")
+        print(f"   📊 총 {stats['total']}개 중 신규 {stats['new']}개, 업데이트 {stats['updated']}개")
+        if stats.get('failed'):
+            print(f"   ⚠️  반영 실패 {stats['failed']}개")
+        print(f"   ⏱️  실행 시간: {execution_time:.2f}초")
+        
+        return True
+    
+    def fail_sync(self, api_type, error, start_time):
+        """동기화 실패 처리 (실패 로그 기록)"""
+        execution_time = (datetime.now() - start_time).total_seconds()
+        error_msg = str(error)
+        
+        print(f"❌ {api_type} 동기화 실패: {error_msg}")
+        
+        # 실패 로그 기록
+        try:
+            table_name = self.mapper.get_table_name(api_type)
+            error_stats = {
+                'total': 0,
+                'new': 0,
+                'updated': 0,
+                'execution_time': int(execution_time),
+                'success': False,
+                'error_message': error_msg,
+                'metrics': current_summary()
+            }
+            self.supabase.log_sync_result(api_type, table_name, error_stats)
+        except:
+            pass
+        
+        return False
+    
+    @staticmethod
+    def extract_items(data, api_type):
         """API 타입별 데이터 추출"""
         try:
             if api_type == "base_tour":
@@ -120,60 +286,203 @@ class AreaBasedSynchronizer:
         print(f"🔄 DB 동기화 시작: {table_name}")
         
         stats = {'total': len(new_items), 'new': 0, 'updated': 0}
+        existing_dict = self.load_existing_index(table_name, api_type)
+        
+        # 신규/업데이트 처리
+        print("🔄 데이터 변경사항 처리 중...")
+        self.apply_changes(table_name, api_type, new_items, existing_dict, stats)
+        self.save_key_index(table_name, api_type, existing_dict)
         
-        # 키 필드 결정
+        print(f"✅ 데이터 처리 완료: 신규 {stats['new']}개, 업데이트 {stats['updated']}개")
+        return stats
+    
+    def load_existing_index(self, table_name, api_type):
+        """
+        기존 데이터를 키 → {id, data_hash} 형태로 조회
+        
+        로컬 키 인덱스를 사용하면 마지막 갱신 이후 바뀐 행만 DB에서 조회한다.
+        """
         key_field = self.mapper.get_key_field(api_type)
+        self.changed_keys = set()
+        self.key_index = get_key_index()
+        
+        if self.key_index:
+            return self.refresh_key_index(table_name, key_field)
         
         # 기존 데이터 조회
         print("📋 기존 데이터 조회 중...")
         existing_data = self.supabase.get_existing_data(table_name, key_field)
+        existing_dict = {self.make_key(item, key_field): item for item in existing_data}
         
-        # 복합 키 처리
-        if isinstance(key_field, list):
-            # 복합 키인 경우 (base_tour)
-            existing_dict = {}
-            for item in existing_data:
-                composite_key = "_".join([str(item[field]) for field in key_field])
-                existing_dict[composite_key] = item
-        else:
-            # 단일 키인 경우 (greentour, barrier_free)
-            existing_dict = {str(item[key_field]): item for item in existing_data}
+        print(f"📊 기존 데이터: {len(existing_dict)}개")
+        return existing_dict
+    
+    def refresh_key_index(self, table_name, key_field):
+        """
+        로컬 키 인덱스를 갱신하고 키 → {id, data_hash} 딕셔너리 반환
+        
+        updated_at 워터마크 이후 바뀐 행만 반영한 뒤 DB 행 수와 비교하여,
+        다르면 (삭제 등으로 어긋난 경우) 전체를 다시 조회하여 재구축한다.
+        워터마크는 DB에서 읽은 행의 최대 updated_at이며 (쓰기 시 DB_NOW로 DB 시각 기록),
+        조회가 실패하면 예외가 그대로 전달되어 인덱스를 갱신하거나 재구축하지 않는다.
+        """
+        index_key_field = ",".join(key_field) if isinstance(key_field, list) else key_field
+        meta = self.key_index.get_meta(table_name)
+        
+        if meta and meta['key_field'] == index_key_field and meta['watermark']:
+            print(f"📋 키 인덱스 증분 갱신 중 (updated_at >= {meta['watermark']})...")
+            rows = self.supabase.get_existing_data(table_name, key_field, updated_since=meta['watermark'])
+            self.key_index.update(
+                table_name, index_key_field, self.make_index_entries(rows, key_field), self.get_max_updated_at(rows)
+            )
+            
+            local_count = self.key_index.count(table_name)
+            remote_count = self.supabase.get_table_stats(table_name)
+            if local_count == remote_count:
+                existing_dict = self.key_index.load(table_name)
+                print(f"📊 기존 데이터: {len(existing_dict)}개 (키 인덱스, 변경 {len(rows)}개 반영)")
+                return existing_dict
+            
+            print(f"⚠️  키 인덱스 행 수 불일치 (로컬 {local_count}개, DB {remote_count}개), 전체 재구축")
+        
+        print("📋 기존 데이터 조회 중 (키 인덱스 재구축)...")
+        rows = self.supabase.get_existing_data(table_name, key_field)
+        self.key_index.rebuild(
+            table_name, index_key_field, self.make_index_entries(rows, key_field), self.get_max_updated_at(rows)
+        )
+        existing_dict = {self.make_key(row, key_field): {'id': row.get('id'), 'data_hash': row.get('data_hash')} for row in rows}
         
         print(f"📊 기존 데이터: {len(existing_dict)}개")
+        return existing_dict
+    
+    def save_key_index(self, table_name, api_type, existing_dict):
+        """이번 동기화에서 반영한 행을 로컬 키 인덱스에 기록"""
+        if not self.key_index or not self.changed_keys:
+            return
         
-        # 신규/업데이트 처리
-        print("🔄 데이터 변경사항 처리 중...")
+        key_field = self.mapper.get_key_field(api_type)
+        index_key_field = ",".join(key_field) if isinstance(key_field, list) else key_field
+        entries = [
+            (key, existing_dict[key].get('id'), existing_dict[key].get('data_hash'), None)
+            for key in self.changed_keys if key in existing_dict
+        ]
+        try:
+            self.key_index.update(table_name, index_key_field, entries)
+        except Exception as e:
+            # 인덱스가 어긋나면 다음 동기화의 행 수 검사에서 재구축됨
+            print(f"⚠️  키 인덱스 기록 실패: {str(e)}")
+        self.changed_keys = set()
+    
+    def make_index_entries(self, rows, key_field):
+        """DB 행을 키 인덱스 항목 (key, id, data_hash, updated_at)으로 변환"""
+        return [
+            (self.make_key(row, key_field), row.get('id'), row.get('data_hash'), row.get('updated_at'))
+            for row in rows
+        ]
+    
+    @staticmethod
+    def get_max_updated_at(rows):
+        """행 목록의 최대 updated_at (없으면 None)"""
+        values = [row['updated_at'] for row in rows if row.get('updated_at')]
+        return max(values) if values else None
+    
+    @staticmethod
+    def make_key(item, key_field):
+        """키 값 생성 (복합 키는 '_'로 연결)"""
+        if isinstance(key_field, list):
+            # 복합 키인 경우 (base_tour)
+            return "_".join([str(item[field]) for field in key_field])
+        # 단일 키인 경우 (greentour, barrier_free)
+        return str(item[key_field])
+    
+    def apply_changes(self, table_name, api_type, items, existing_dict, stats):
+        """
+        매핑된 item 묶음을 기존 데이터와 비교하여 변경분을 모은 뒤 배치 업서트로 반영
+        
+        같은 키가 묶음 안에 여러 번 나오면 마지막 항목만 반영한다. 반영된 항목은 existing_dict에
+        기록하여 이후 묶음에서 같은 키가 다시 나와도 중복 삽입하지 않는다.
+        신규/업데이트 수는 실제로 반영된 행만 센다.
+        """
+        key_field = self.mapper.get_key_field(api_type)
         
-        for i, item in enumerate(new_items):
+        # 변경분 수집: 키 → (item, 신규 여부)
+        changes = {}
+        for item in items:
+            key_value = None
             try:
-                # 키 값 생성
-                if isinstance(key_field, list):
-                    # 복합 키인 경우
-                    key_value = "_".join([str(item[field]) for field in key_field])
-                else:
-                    # 단일 키인 경우
-                    key_value = str(item[key_field])
-                
-                if key_value in existing_dict:
-                    # 기존 데이터와 해시 비교
-                    if existing_dict[key_value]['data_hash'] != item['data_hash']:
-                        self.supabase.update_record(table_name, existing_dict[key_value]['id'], item)
-                        stats['updated'] += 1
-                else:
-                    # 신규 데이터
-                    self.supabase.insert_record(table_name, item)
-                    stats['new'] += 1
-                
-                # 진행 상황 표시 (100개마다)
-                if (i + 1) % 100 == 0:
-                    print(f"  💾 처리 진행: {i + 1}/{len(new_items)} (신규: {stats['new']}, 업데이트: {stats['updated']})")
-                    
+                key_value = self.make_key(item, key_field)
             except Exception as e:
                 print(f"⚠️  데이터 처리 실패 ({key_value}): {str(e)}")
+                stats['failed'] = stats.get('failed', 0) + 1
+                self.failed_items.append(item)
+                continue
+            
+            stats['processed'] = stats.get('processed', 0) + 1
+            existing = existing_dict.get(key_value)
+            
+            # HASH_SCHEME을 바꾼 직후에는 저장된 해시의 방식으로 다시 계산해 비교한다 (행은 다시 쓰지 않음)
+            if existing and hashes_match(existing['data_hash'], item):
+                # 변경 없음 (묶음 안의 앞선 중복 항목이 바꾸려던 값도 취소)
+                changes.pop(key_value, None)
+                if existing['data_hash'] != item['data_hash']:
+                    # 로컬 키 인덱스에는 새 방식 해시를 기록하여 다음 실행부터 문자열 비교만 하도록 함
+                    existing['data_hash'] = item['data_hash']
+                    self.changed_keys.add(key_value)
                 continue
+            
+            changes[key_value] = (item, existing is None)
         
-        print(f"✅ 데이터 처리 완료: 신규 {stats['new']}개, 업데이트 {stats['updated']}개")
-        return stats
+        new_rows = [item for item, is_new in changes.values() if is_new]
+        updated_rows = [item for item, is_new in changes.values() if not is_new]
+        
+        # 업데이트 행은 updated_at을 DB 시각으로 갱신 (신규 행은 DB 기본값 사용)
+        for item in updated_rows:
+            item['updated_at'] = DB_NOW
+        
+        if new_rows:
+            self.upsert_changes(table_name, key_field, new_rows, existing_dict, stats, 'new')
+        if updated_rows:
+            self.upsert_changes(table_name, key_field, updated_rows, existing_dict, stats, 'updated')
+        
+        print(f"  💾 처리 진행: {stats.get('processed', 0)}/{stats['total']} (신규: {stats['new']}, 업데이트: {stats['updated']})")
+    
+    def write_rows(self, table_name, rows):
+        """
+        변경 행 반영 - SUPABASE_DB_DSN이 설정되어 있으면 COPY 병합, 아니면 PostgREST 배치 업서트
+        
+        COPY 병합이 실패하면 (한 트랜잭션이므로 반영된 행 없음) PostgREST 배치 업서트로 다시 시도한다.
+        """
+        with phase("write"):
+            pg_writer = get_pg_writer()
+            if pg_writer:
+                try:
+                    upserted = pg_writer.upsert_rows(table_name, self.supabase.get_conflict_target(table_name), to_rows(rows))
+                    print(f"  📦 COPY 병합: {len(rows)}개 중 {len(upserted)}개 반영")
+                    return upserted, []
+                except Exception as e:
+                    print(f"⚠️  COPY 병합 실패, PostgREST 배치 업서트로 재시도: {str(e)}")
+            return self.supabase.batch_upsert(table_name, rows)
+    
+    def upsert_changes(self, table_name, key_field, rows, existing_dict, stats, stat_name):
+        """변경 행을 배치 업서트하고 반영된 행만 existing_dict와 통계에 기록"""
+        hashes = {self.make_key(item, key_field): item['data_hash'] for item in rows}
+        upserted, failed = self.write_rows(table_name, rows)
+        
+        for row in upserted:
+            key_value = self.make_key(row, key_field)
+            self.changed_keys.add(key_value)
+            existing = existing_dict.get(key_value)
+            if existing:
+                existing['data_hash'] = hashes.get(key_value, row.get('data_hash'))
+            else:
+                existing_dict[key_value] = {'id': row.get('id'), 'data_hash': hashes.get(key_value, row.get('data_hash'))}
+        
+        stats[stat_name] += len(upserted)
+        if failed:
+            stats['failed'] = stats.get('failed', 0) + len(failed)
+            for item, error in failed:
+                print(f"⚠️  데이터 처리 실패 ({self.make_key(item, key_field)}): {error}")
+                self.failed_items.append(item)
     
     def get_file_info(self, file_path):
         """파일 정보 조회"""
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# 저장된 스냅샷(data/*.json, data/*.ndjson[.gz|.zst]) 일괄 적재
+# save_to_local이 저장한 areaBasedList 파일들을 API 호출 없이 DB에 다시 적재한다.
+# - 파일명 접두어(예: 2barrier_free_5areaBasedList2_20250101_120000.json)로 API 타입 판별
+# - ijson이 설치되어 있으면 파일 전체를 읽지 않고 item 단위로 파싱 (없으면 json.load)
+# - NDJSON 파일은 한 줄씩 읽으며, 매니페스트의 item 수와 다르면 경고
+# - 여러 파일에 같은 키가 있으면 modifiedtime이 가장 최신인 item만 사용 (같으면 나중에 저장된 파일)
+# - API 타입별로 병합한 결과를 sync_items로 한 번에 동기화
+import glob
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from batch.ndjson_writer import MANIFEST_SUFFIX, iter_ndjson_items, read_manifest
+from settings.config import BACKFILL_WORKERS
+from sync.incremental import SYNC_ONLY_FIELDS, WATERMARK_FIELD
+
+try:
+    import ijson
+except ImportError:  # 없으면 파일 전체를 json.load로 읽음
+    ijson = None
+
+# save_to_local 파일명: {API 번호}{api_type}_{엔드포인트 번호}{엔드포인트명}_{YYYYMMDD_HHMMSS}.{json|ndjson[.gz|.zst]}
+SNAPSHOT_FILENAME = re.compile(
+    r"^(\d)(greentour|barrier_free|base_tour)_(\d+)(\w+?)_(\d{8}_\d{6})\.(json|ndjson(?:\.gz|\.zst)?)$"
+)
+
+# 디렉토리에서 찾을 스냅샷 파일 패턴
+SNAPSHOT_PATTERNS = ("*.json", "*.ndjson", "*.ndjson.gz", "*.ndjson.zst")
+
+# API 타입별 item 키 필드 (API 응답 필드명)
+RAW_KEY_FIELDS = {
+    "greentour": ("contentid",),
+    "barrier_free": ("contentid",),
+    "base_tour": ("hubTatsCd", "baseYm")
+}
+
+# API 타입별 item 목록 위치 (ijson prefix)
+ITEM_PREFIXES = {
+    "greentour": "response.body.items.item.item",
+    "barrier_free": "response.body.items.item.item",
+    "base_tour": "items.item"
+}
+
+
+def parse_snapshot_name(path):
+    """
+    스냅샷 파일명 해석
+
+    Returns:
+        dict: api_type, endpoint_name, timestamp, ndjson (areaBasedList 스냅샷이 아니면 None)
+    """
+    match = SNAPSHOT_FILENAME.match(os.path.basename(path))
+    if not match or "areaBased" not in match.group(4):
+        return None
+    return {
+        "api_type": match.group(2),
+        "endpoint_name": match.group(4),
+        "timestamp": match.group(5),
+        "ndjson": match.group(6) != "json"
+    }
+
+
+def find_snapshots(sources):
+    """디렉토리/glob 패턴/파일 경로 목록에서 스냅샷 파일 경로 목록 반환 (중복 제거, 정렬)"""
+    paths = set()
+    for source in sources:
+        if os.path.isdir(source):
+            for pattern in SNAPSHOT_PATTERNS:
+                paths.update(glob.glob(os.path.join(source, pattern)))
+        elif glob.has_magic(source):
+            paths.update(glob.glob(source))
+        elif os.path.isfile(source):
+            paths.add(source)
+    # NDJSON 매니페스트는 스냅샷이 아님
+    return sorted(path for path in paths if not path.endswith(MANIFEST_SUFFIX))
+
+
+def iter_snapshot_items(path, api_type):
+    """스냅샷 파일의 item을 하나씩 yield"""
+    if parse_snapshot_name(path)["ndjson"]:
+        yield from iter_ndjson_items(path)
+        return
+
+    with open(path, "rb") as f:
+        if ijson is not None:
+            # use_float: 숫자를 Decimal 대신 float로 (해시/JSON 직렬화 호환)
+            yield from ijson.items(f, ITEM_PREFIXES[api_type], use_float=True)
+            return
+        data = json.load(f)
+
+    from sync.areabased_sync import AreaBasedSynchronizer
+    yield from AreaBasedSynchronizer.extract_items(data, api_type)
+
+
+def is_newer(rank, current):
+    return current is None or rank >= current[0]
+
+
+def read_snapshot(path, api_type, timestamp):
+    """
+    스냅샷 파일 하나를 읽어 키별 최신 item만 남긴 딕셔너리 반환 (프로세스 풀 작업 단위)
+
+    Returns:
+        dict: 키 → ((modifiedtime, 파일 시각), item 또는 None)
+            동기화 목록 파일에서 비공개(showflag=0) 처리된 키는 item이 None
+    """
+    key_fields = RAW_KEY_FIELDS[api_type]
+    records = {}
+    count = 0
+    for item in iter_snapshot_items(path, api_type):
+        count += 1
+        key = tuple(str(item.get(field)) for field in key_fields)
+        rank = (str(item.get(WATERMARK_FIELD) or ""), timestamp)
+        if not is_newer(rank, records.get(key)):
+            continue
+
+        if str(item.get("showflag", "1")) == "0":
+            records[key] = (rank, None)
+        else:
+            records[key] = (rank, {field: value for field, value in item.items() if field not in SYNC_ONLY_FIELDS})
+
+    if parse_snapshot_name(path)["ndjson"]:
+        manifest = read_manifest(path)
+        if manifest is None:
+            print(f"⚠️  {os.path.basename(path)}: 매니페스트 없음")
+        elif manifest.get("items") != count:
+            print(f"⚠️  {os.path.basename(path)}: item {count}개, 매니페스트 {manifest.get('items')}개")
+        if manifest and manifest.get("failures"):
+            print(f"⚠️  {os.path.basename(path)}: 수집 실패한 지역 단위 {len(manifest['failures'])}개 (해당 단위 item 없음)")
+    return records
+
+
+def merge_snapshots(snapshots, workers=None):
+    """
+    스냅샷 파일들을 읽어 API 타입별로 키가 중복되지 않는 item 목록으로 병합
+
+    Args:
+        snapshots: (경로, 파일명 정보) 목록
+
+    Returns:
+        tuple: (merged: {api_type: [item, ...]}, read_counts: {api_type: 파일별 키 수 합계})
+    """
+    workers = BACKFILL_WORKERS if workers is None else workers
+    merged = {}
+    read_counts = {}
+
+    def merge(info, records):
+        target = merged.setdefault(info["api_type"], {})
+        read_counts[info["api_type"]] = read_counts.get(info["api_type"], 0) + len(records)
+        for key, record in records.items():
+            if is_newer(record[0], target.get(key)):
+                target[key] = record
+
+    jobs = [(path, info["api_type"], info["timestamp"]) for path, info in snapshots]
+    if workers < 2 or len(jobs) < 2:
+        for (path, info), job in zip(snapshots, jobs):
+            merge(info, read_snapshot(*job))
+            print(f"  📖 {os.path.basename(path)} 읽기 완료")
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            for (path, info), records in zip(snapshots, executor.map(read_snapshot, *zip(*jobs))):
+                merge(info, records)
+                print(f"  📖 {os.path.basename(path)} 읽기 완료")
+
+    items = {
+        api_type: [item for _, item in records.values() if item is not None]
+        for api_type, records in merged.items()
+    }
+    return items, read_counts
+
+
+def backfill(sources, workers=None):
+    """
+    스냅샷 파일들을 API 타입별로 병합하여 DB에 동기화
+
+    Args:
+        sources: 디렉토리, glob 패턴 또는 파일 경로 목록
+
+    Returns:
+        bool: 모든 API 타입 동기화 성공 여부 (적재할 파일이 없으면 False)
+    """
+    from sync.areabased_sync import AreaBasedSynchronizer
+
+    paths = find_snapshots(sources)
+    snapshots = [(path, parse_snapshot_name(path)) for path in paths]
+    skipped = [path for path, info in snapshots if info is None]
+    snapshots = [(path, info) for path, info in snapshots if info is not None]
+
+    if skipped:
+        print(f"⚠️  areaBasedList 스냅샷이 아닌 파일 {len(skipped)}개 건너뜀")
+    if not snapshots:
+        print(f"❌ 적재할 스냅샷 파일이 없습니다: {', '.join(sources)}")
+        return False
+
+    parser_name = "ijson 스트리밍" if ijson is not None else "json.load (ijson 미설치)"
+    print(f"🔄 스냅샷 {len(snapshots)}개 병합 중 ({parser_name})...")
+    merged, read_counts = merge_snapshots(snapshots, workers)
+
+    success = True
+    for api_type, items in merged.items():
+        print(f"📊 {api_type}: 파일별 키 합계 {read_counts[api_type]}개 → 병합 후 {len(items)}개")
+        if not items:
+            continue
+        success = AreaBasedSynchronizer().sync_items(items, api_type) and success
+    return success
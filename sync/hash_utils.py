@@ -1,14 +1,107 @@
 #!/usr/bin/env python3
 import hashlib
 import json
+from concurrent.futures import ProcessPoolExecutor
+from settings.config import HASH_PARALLEL_MIN_ITEMS, HASH_SCHEME, HASH_WORKERS
+
+try:
+    import xxhash
+except ImportError:  # xxh3 해시를 사용하지 않으면 필요 없음
+    xxhash = None
+
+# 해시 방식별 접두어 (기존 sha256 해시는 접두어 없이 저장되어 있으므로 그대로 유지)
+# 모든 결과는 data_hash VARCHAR(64)에 들어가는 길이로 맞춘다.
+HASH_PREFIXES = {
+    "sha256": "",
+    "blake2b": "b2:",
+    "xxh3": "xx:"
+}
+
+
+# 새 해시 방식용 정규화 인코더 (키 정렬, 공백 없는 구분자, ASCII 이스케이프)
+# ensure_ascii=True가 한글이 많은 응답에서 ensure_ascii=False보다 빠르고, 인코더를 재사용하여 생성 비용을 없앤다.
+CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
+
+
+def canonical_json(data):
+    """새 해시 방식용 정규화 직렬화"""
+    return CANONICAL_ENCODER.encode(data)
+
+
+def calculate_data_hash(data, scheme=None):
+    """
+    데이터의 해시값 계산
+
+    scheme을 지정하지 않으면 HASH_SCHEME 설정을 사용한다.
+    - sha256: 기존 방식 (기본 json.dumps 직렬화, 접두어 없음)
+    - blake2b: BLAKE2b 128비트, "b2:" 접두어
+    - xxh3: xxHash3 128비트 (xxhash 패키지 필요), "xx:" 접두어
+    """
+    scheme = scheme or HASH_SCHEME
+    if scheme not in HASH_PREFIXES:
+        raise ValueError(f"알 수 없는 해시 방식: {scheme}")
+    if scheme == "xxh3" and xxhash is None:
+        raise ImportError("xxh3 해시를 사용하려면 xxhash 패키지를 설치하세요 (pip install xxhash)")
 
-def calculate_data_hash(data):
-    """데이터의 해시값 계산"""
     try:
-        # 정렬된 JSON 문자열로 변환하여 일관된 해시 생성
-        normalized = json.dumps(data, sort_keys=True, ensure_ascii=False)
-        return hashlib.sha256(normalized.encode()).hexdigest()
+        if scheme == "sha256":
+            # 정렬된 JSON 문자열로 변환하여 일관된 해시 생성
+            normalized = json.dumps(data, sort_keys=True, ensure_ascii=False)
+            return hashlib.sha256(normalized.encode()).hexdigest()
+
+        normalized = canonical_json(data).encode('ascii')
+        if scheme == "blake2b":
+            return HASH_PREFIXES[scheme] + hashlib.blake2b(normalized, digest_size=16).hexdigest()
+        return HASH_PREFIXES[scheme] + xxhash.xxh3_128_hexdigest(normalized)
     except Exception as e:
         print(f"⚠️  해시 계산 실패: {str(e)}")
         # 실패 시 빈 문자열의 해시 반환
         return hashlib.sha256("".encode()).hexdigest()
+
+
+def calculate_data_hashes(items, scheme=None, workers=None):
+    """
+    여러 item의 해시값을 한 번에 계산 (입력 순서 유지)
+
+    item 수가 HASH_PARALLEL_MIN_ITEMS 이상이고 workers가 2 이상이면 프로세스 풀에 나누어 계산한다.
+    대량 백필처럼 item이 많을 때만 프로세스 생성 비용보다 이득이 크다.
+    """
+    scheme = scheme or HASH_SCHEME
+    workers = HASH_WORKERS if workers is None else workers
+
+    if workers < 2 or len(items) < HASH_PARALLEL_MIN_ITEMS:
+        return [calculate_data_hash(item, scheme) for item in items]
+
+    chunksize = max(1, len(items) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(calculate_data_hash, items, [scheme] * len(items), chunksize=chunksize))
+
+
+def get_hash_scheme(data_hash):
+    """저장된 해시의 방식 (접두어가 없으면 기존 sha256)"""
+    for scheme, prefix in HASH_PREFIXES.items():
+        if prefix and data_hash.startswith(prefix):
+            return scheme
+    return "sha256"
+
+
+def hashes_match(stored_hash, item):
+    """
+    저장된 해시와 item의 해시가 같은 데이터를 가리키는지 비교
+
+    HASH_SCHEME을 바꾼 직후에는 저장된 해시와 방식이 다르므로, 저장된 해시의 방식으로
+    item 원본(raw_data)의 해시를 다시 계산해 비교한다. 방식이 같으면 문자열 비교만 한다.
+    """
+    if not stored_hash:
+        return False
+    if stored_hash == item['data_hash']:
+        return True
+
+    stored_scheme = get_hash_scheme(stored_hash)
+    if stored_scheme == get_hash_scheme(item['data_hash']):
+        return False
+    try:
+        return calculate_data_hash(item['raw_data'], stored_scheme) == stored_hash
+    except (ImportError, ValueError):
+        # 저장된 방식의 해시를 계산할 수 없으면 (xxhash 미설치 등) 변경으로 처리
+        return False
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+from datetime import datetime, timedelta
+from settings.config import INCREMENTAL_FULL_RECONCILE_WEEKDAY
+
+# 워터마크로 사용할 컬럼 (API 형식: YYYYMMDDHHMMSS)
+WATERMARK_FIELD = "modifiedtime"
+
+# 동기화 목록 응답에만 있는 필드 (해시 계산 전 제거하여 전체 목록과 해시를 일치시킴)
+SYNC_ONLY_FIELDS = ("showflag",)
+
+
+def get_watermark(supabase_handler, table_name):
+    """테이블에 저장된 최대 modifiedtime (증분 수집 기준점)"""
+    watermark = supabase_handler.get_max_value(table_name, WATERMARK_FIELD)
+    return str(watermark) if watermark else None
+
+
+def should_full_reconcile(watermark, force_full=False, today=None):
+    """
+    전체 재동기화 여부 판단
+
+    - 워터마크가 없으면 (첫 실행) 전체 수집
+    - --full 옵션이 주어지면 전체 수집
+    - 주기적 전체 재동기화 요일이면 전체 수집
+    """
+    if force_full or not watermark:
+        return True
+    today = today or datetime.now()
+    return today.weekday() == INCREMENTAL_FULL_RECONCILE_WEEKDAY
+
+
+def get_sync_params(watermark, today=None):
+    """
+    동기화 목록 엔드포인트 요청 파라미터 목록 (워터마크 날짜부터 오늘까지)
+
+    modifiedtime은 "이후 변경"이 아니라 수정 시각의 앞자리(YYYY, YYYYMM, YYYYMMDD) 일치 조건이므로,
+    워터마크 날짜부터 오늘까지를 빠짐없이 덮도록 나누어 조회한다.
+    범위 안에 달 전체가 들어가면 월(YYYYMM) 하나로, 나머지는 일(YYYYMMDD)별로 요청한다.
+
+    Returns:
+        list: 요청별 파라미터 ({"modifiedtime": 앞자리})
+    """
+    start = datetime.strptime(watermark[:8], "%Y%m%d").date()
+    end = (today or datetime.now()).date()
+
+    params = []
+    day = start
+    while day <= end:
+        next_month = (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+        if day.day == 1 and next_month - timedelta(days=1) <= end:
+            params.append({WATERMARK_FIELD: day.strftime("%Y%m")})
+            day = next_month
+        else:
+            params.append({WATERMARK_FIELD: day.strftime("%Y%m%d")})
+            day += timedelta(days=1)
+    # 워터마크가 오늘보다 뒤(시계 차이)이면 워터마크 날짜만 조회
+    return params or [{WATERMARK_FIELD: watermark[:8]}]
+
+
+def filter_changed_items(items, watermark):
+    """
+    워터마크 이후 변경된 항목만 추출
+
+    Returns:
+        tuple: (changed_items: list, hidden_count: int)
+    """
+    changed_items = []
+    hidden_count = 0
+
+    for item in items:
+        # showflag=0: 비공개 처리된 콘텐츠는 반영하지 않음
+        if str(item.get("showflag", "1")) == "0":
+            hidden_count += 1
+            continue
+
+        if str(item.get(WATERMARK_FIELD) or "") < watermark:
+            continue
+
+        changed_items.append({key: value for key, value in item.items() if key not in SYNC_ONLY_FIELDS})
+
+    return changed_items, hidden_count
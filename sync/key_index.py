@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# 로컬 키 인덱스 (SQLite)
+# 테이블별 키 → (id, data_hash, updated_at)를 로컬에 보관하여 동기화마다 전체 테이블을 다시 읽지 않는다.
+# - 증분 갱신: 마지막으로 본 updated_at 이후에 바뀐 행만 조회
+# - 드리프트 검사: 로컬 행 수와 DB 행 수가 다르면 전체 재구축
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from settings.config import KEY_INDEX_ENABLED, KEY_INDEX_PATH
+
+class KeyIndex:
+    """테이블별 키 → {id, data_hash} 로컬 인덱스"""
+
+    def __init__(self, path=KEY_INDEX_PATH):
+        self.path = path
+        self.init_db()
+
+    @contextmanager
+    def connect(self):
+        """
+        트랜잭션 하나를 위한 연결 (블록이 끝나면 커밋 또는 롤백한 뒤 연결을 닫음)
+
+        sqlite3 연결의 with 문은 커밋/롤백만 하고 연결을 닫지 않으므로 여기서 직접 닫는다.
+        """
+        conn = sqlite3.connect(self.path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def init_db(self):
+        """인덱스 테이블 생성"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self.connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS key_index (
+                    table_name TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    id INTEGER,
+                    data_hash TEXT,
+                    updated_at TEXT,
+                    PRIMARY KEY (table_name, key)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS index_meta (
+                    table_name TEXT PRIMARY KEY,
+                    key_field TEXT,
+                    watermark TEXT,
+                    refreshed_at TEXT
+                )
+            """)
+
+    def get_meta(self, table_name):
+        """인덱스 메타 정보 (key_field, watermark), 없으면 None"""
+        with self.connect() as conn:
+            row = conn.execute(
+                "SELECT key_field, watermark FROM index_meta WHERE table_name = ?", (table_name,)
+            ).fetchone()
+        if not row:
+            return None
+        return {'key_field': row[0], 'watermark': row[1]}
+
+    def count(self, table_name):
+        """인덱스에 저장된 행 수"""
+        with self.connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM key_index WHERE table_name = ?", (table_name,)).fetchone()[0]
+
+    def load(self, table_name):
+        """키 → {id, data_hash} 딕셔너리로 조회"""
+        with self.connect() as conn:
+            rows = conn.execute(
+                "SELECT key, id, data_hash FROM key_index WHERE table_name = ?", (table_name,)
+            ).fetchall()
+        return {key: {'id': record_id, 'data_hash': data_hash} for key, record_id, data_hash in rows}
+
+    def rebuild(self, table_name, key_field, entries, watermark):
+        """
+        테이블 인덱스 전체 재구축
+
+        Args:
+            entries: (key, id, data_hash, updated_at) 목록
+        """
+        with self.connect() as conn:
+            conn.execute("DELETE FROM key_index WHERE table_name = ?", (table_name,))
+            self.write_entries(conn, table_name, entries)
+            self.write_meta(conn, table_name, key_field, watermark)
+
+    def update(self, table_name, key_field, entries, watermark=None):
+        """변경된 행만 인덱스에 반영 (watermark가 주어지면 함께 갱신)"""
+        with self.connect() as conn:
+            self.write_entries(conn, table_name, entries)
+            if watermark:
+                self.write_meta(conn, table_name, key_field, watermark)
+
+    @staticmethod
+    def write_entries(conn, table_name, entries):
+        conn.executemany(
+            "INSERT OR REPLACE INTO key_index (table_name, key, id, data_hash, updated_at) VALUES (?, ?, ?, ?, ?)",
+            ((table_name, key, record_id, data_hash, updated_at) for key, record_id, data_hash, updated_at in entries)
+        )
+
+    @staticmethod
+    def write_meta(conn, table_name, key_field, watermark):
+        conn.execute(
+            "INSERT OR REPLACE INTO index_meta (table_name, key_field, watermark, refreshed_at) VALUES (?, ?, ?, ?)",
+            (table_name, key_field, watermark, datetime.now().isoformat())
+        )
+
+    def clear(self, table_name):
+        """테이블 인덱스 삭제 (다음 동기화에서 전체 재구축)"""
+        with self.connect() as conn:
+            conn.execute("DELETE FROM key_index WHERE table_name = ?", (table_name,))
+            conn.execute("DELETE FROM index_meta WHERE table_name = ?", (table_name,))
+
+
+def get_key_index():
+    """키 인덱스 사용 시 KeyIndex, 아니면 None"""
+    if not KEY_INDEX_ENABLED:
+        return None
+    try:
+        return KeyIndex()
+    except (OSError, sqlite3.Error) as e:
+        print(f"⚠️  키 인덱스를 열 수 없어 DB 전체 조회로 진행: {str(e)}")
+        return None
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# 기초지자체 API 기준 연월(baseYm) 범위 수집 계획
+# --months로 지정한 기간의 (baseYm × 시군구) 셀 중 적재가 끝난 월은 수집하지 않는다.
+# - 모든 셀 수집과 DB 동기화가 성공한 월은 DB의 행 수와 (키, data_hash) 요약을 적재 기록에 남긴다.
+#   (적재 기록은 상태 저장소에 보관: Supabase 설정이 있으면 sync_state 테이블, 없으면 BASE_YM_LEDGER_PATH 파일)
+# - 다음 실행에서 같은 시군구 범위이고 DB의 월별 행 수/요약이 기록과 같으면 그 월은 건너뛴다.
+#   (기록 이후 행이 지워지거나 바뀌었으면 다시 수집)
+import hashlib
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from settings.config import BASE_YM_LEDGER_PATH, EXISTING_READ_CONCURRENCY
+from settings.metrics import map_in_scope
+from settings.state_store import StateStore
+
+# 기준 연월 형식 (YYYYMM)
+MONTH_PATTERN = re.compile(r"^\d{4}(0[1-9]|1[0-2])$")
+
+# 월별 요약 대상 테이블
+TABLE_NAME = "base_tour_areabased"
+
+
+def parse_month_range(spec):
+    """
+    --months 값을 기준 연월 목록으로 변환
+
+    형식: "202401-202506" (범위), "202401,202403" (목록), 둘을 섞어 쉼표로 구분 가능
+
+    Returns:
+        tuple: (months: list, error: str)
+    """
+    months = []
+    for part in str(spec).split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        end = end or start
+        if not MONTH_PATTERN.match(start) or not MONTH_PATTERN.match(end) or start > end:
+            return [], f"잘못된 기준 연월: {part} (예: 202401-202506)"
+
+        year, month = int(start[:4]), int(start[4:])
+        while f"{year}{month:02d}" <= end:
+            if f"{year}{month:02d}" not in months:
+                months.append(f"{year}{month:02d}")
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+    if not months:
+        return [], "기준 연월이 없습니다 (예: 202401-202506)"
+    return sorted(months), None
+
+
+def get_item_months(items, months):
+    """
+    item들의 기준 연월 집합 (원본 item의 baseYm 또는 매핑된 행의 baseym)
+
+    기준 연월을 알 수 없는 item이 있으면 어느 월인지 판단할 수 없으므로 months 전체를 반환한다.
+    """
+    item_months = set()
+    for item in items:
+        month = item.get("baseym") or item.get("baseYm")
+        if not month:
+            return set(months)
+        item_months.add(str(month))
+    return item_months
+
+
+def summarize_rows(rows):
+    """
+    월별 행 요약
+
+    Returns:
+        dict: rows (행 수), digest ((키, data_hash) 목록의 해시)
+    """
+    entries = sorted(f"{row.get('hubtatscode')}:{row.get('data_hash')}" for row in rows)
+    digest = hashlib.blake2b("\n".join(entries).encode(), digest_size=16).hexdigest()
+    return {"rows": len(rows), "digest": digest}
+
+
+def summarize_scope(signgu_codes):
+    """시군구 범위 요약 (범위가 바뀌면 이전 적재 기록을 사용하지 않음)"""
+    return hashlib.blake2b(",".join(sorted(signgu_codes)).encode(), digest_size=8).hexdigest()
+
+
+class MonthGrid:
+    """기준 연월별 적재 기록 (상태 저장소) 및 DB 월별 요약 비교"""
+
+    def __init__(self, signgu_codes, ledger_path=BASE_YM_LEDGER_PATH, handler=None):
+        self.scope = summarize_scope(signgu_codes)
+        self.store = StateStore("base_ym_months", ledger_path)
+        self.handler = handler
+        self.lock = threading.Lock()
+        self.ledger = self.store.load()
+
+    def save(self):
+        """적재 기록 저장 (테이블 항목만 DB에 반영)"""
+        self.store.save(self.ledger, [TABLE_NAME])
+
+    def get_handler(self):
+        if self.handler is None:
+            from batch.supabase_areabased import SupabaseAreaBasedHandler
+            self.handler = SupabaseAreaBasedHandler()
+        return self.handler
+
+    def fetch_summaries(self, months):
+        """
+        DB의 월별 행 요약 조회 (월 단위로 동시 조회)
+
+        Returns:
+            dict: {월: 요약} (조회 실패한 월은 None)
+        """
+        handler = self.get_handler()
+
+        def fetch(month):
+            rows = handler.get_rows_by_value(TABLE_NAME, "hubtatscode, data_hash", "baseym", month)
+            return summarize_rows(rows) if rows is not None else None
+
+        if not months:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(EXISTING_READ_CONCURRENCY, len(months))) as executor:
+            return dict(zip(months, map_in_scope(executor, fetch, months)))
+
+    def pending_months(self, months):
+        """
+        수집이 필요한 월 목록 (적재 기록이 있고 DB 요약이 기록과 같은 월 제외)
+
+        Returns:
+            tuple: (pending: list, skipped: list)
+        """
+        entries = self.ledger.get(TABLE_NAME, {})
+        recorded = [month for month in months if entries.get(month, {}).get("scope") == self.scope]
+        summaries = self.fetch_summaries(recorded)
+
+        skipped = []
+        for month in recorded:
+            entry = entries[month]
+            summary = summaries.get(month)
+            if summary and summary["rows"] == entry["rows"] and summary["digest"] == entry["digest"]:
+                skipped.append(month)
+            elif summary:
+                print(f"  🔁 {month}: DB 행 {summary['rows']}개, 기록 {entry['rows']}개 또는 해시 불일치 → 다시 수집")
+
+        return [month for month in months if month not in skipped], skipped
+
+    def record_loaded(self, months):
+        """
+        적재가 끝난 월의 DB 요약 기록 (행이 없는 월은 아직 공개 전일 수 있어 기록하지 않음)
+
+        Returns:
+            list: 기록한 월 목록
+        """
+        summaries = self.fetch_summaries(months)
+        recorded = []
+        with self.lock:
+            entries = self.ledger.setdefault(TABLE_NAME, {})
+            for month in months:
+                summary = summaries.get(month)
+                if not summary or not summary["rows"]:
+                    continue
+                entries[month] = dict(summary, scope=self.scope, loaded_at=datetime.now().isoformat())
+                recorded.append(month)
+            if recorded:
+                self.save()
+        return recorded